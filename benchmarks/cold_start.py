@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""
+워커 콜드 스타트 벤치마크
+
+새 프로세스에서 import 시간과 첫 요청 지연을 측정합니다.
+lifespan 워밍업을 하지 않은 경우(cold)와 한 경우(warm)를 비교합니다.
+
+    DJANGO_SETTINGS_MODULE=placeholder.settings.local python benchmarks/cold_start.py --runs 5
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+
+async def _startup(app):
+    # startup이 끝나면 lifespan 태스크를 정리합니다. (shutdown을 보내면 커넥션이 닫힙니다)
+    started = asyncio.Event()
+    messages = [{"type": "lifespan.startup"}]
+
+    async def receive():
+        if messages:
+            return messages.pop(0)
+        await asyncio.Event().wait()
+
+    async def send(message):
+        if message["type"] == "lifespan.startup.complete":
+            started.set()
+
+    task = asyncio.create_task(app({"type": "lifespan"}, receive, send))
+    await started.wait()
+    task.cancel()
+
+
+async def _call(app, scope, messages):
+    sent = []
+
+    async def receive():
+        if messages:
+            return messages.pop(0)
+        # 응답이 끝날 때까지 연결을 유지합니다.
+        await asyncio.Event().wait()
+
+    async def send(message):
+        sent.append(message)
+
+    await app(scope, receive, send)
+    return sent
+
+
+def _http_scope(path):
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"localhost")],
+        "client": ("127.0.0.1", 12345),
+        "server": ("localhost", 80),
+    }
+
+
+def run_child(mode, path):
+    sys.path.insert(0, str(BASE_DIR))
+    started = time.perf_counter()
+    from placeholder.asgi import application
+
+    import_seconds = time.perf_counter() - started
+
+    warmup_seconds = 0.0
+    if mode == "warm":
+        started = time.perf_counter()
+        asyncio.run(_startup(application))
+        warmup_seconds = time.perf_counter() - started
+
+    latencies = []
+    for _ in range(2):
+        started = time.perf_counter()
+        sent = asyncio.run(_call(application, _http_scope(path), [{"type": "http.request", "body": b""}]))
+        latencies.append(time.perf_counter() - started)
+    status = next(m["status"] for m in sent if m["type"] == "http.response.start")
+
+    print(
+        json.dumps(
+            {
+                "import": import_seconds,
+                "warmup": warmup_seconds,
+                "first": latencies[0],
+                "second": latencies[1],
+                "status": status,
+                "boto3_loaded": "boto3" in sys.modules,
+            }
+        )
+    )
+
+
+def _ms(values):
+    return f"{statistics.median(values) * 1000:8.1f}ms"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--path", default="/api/v1/meetup")
+    parser.add_argument("--child", choices=["cold", "warm"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child, args.path)
+        return
+
+    env = {**os.environ}
+    env.setdefault("DJANGO_SETTINGS_MODULE", "placeholder.settings.local")
+    for mode in ("cold", "warm"):
+        results = []
+        for _ in range(args.runs):
+            output = subprocess.run(
+                [sys.executable, __file__, "--child", mode, "--path", args.path],
+                cwd=BASE_DIR,
+                env=env,
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            results.append(json.loads(output.strip().splitlines()[-1]))
+
+        print(
+            f"[{mode}] import={_ms([r['import'] for r in results])} "
+            f"warmup={_ms([r['warmup'] for r in results])} "
+            f"first={_ms([r['first'] for r in results])} "
+            f"second={_ms([r['second'] for r in results])} "
+            f"status={results[0]['status']} boto3_loaded={results[0]['boto3_loaded']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
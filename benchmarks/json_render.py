@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""
+JSON 렌더러 벤치마크
+
+MeetupListSchema 행 N개(기본 1,000개)를 Ninja 기본 렌더러(json + DjangoJSONEncoder)와
+ORJSONRenderer로 직렬화하는 시간을 비교합니다. DB 없이 메모리의 데이터만 사용합니다.
+
+    python benchmarks/json_render.py --rows 1000 --rounds 50
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+
+def _measure(func, rounds):
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1000
+
+
+def _rows(count):
+    created_at = datetime(2025, 1, 1, 9, 30, 15, 123456, tzinfo=timezone.utc)
+    return [
+        {
+            "id": i,
+            "is_organizer": i % 7 == 0,
+            "organizer": {"nickname": f"주최자{i % 50}", "image": f"https://bucket.s3.amazonaws.com/user/{i}.png"},
+            "started_at": date(2025, 3, 1) + timedelta(days=i % 30),
+            "ended_at": date(2025, 4, 1) + timedelta(days=i % 30),
+            "ad_ended_at": date(2025, 2, 1),
+            "ad_title": f"같이 공부해요 #{i}",
+            "place": "서울",
+            "is_public": True,
+            "image": f"https://bucket.s3.amazonaws.com/meetup/{i}.png",
+            "like_count": i % 100,
+            "is_like": i % 3 == 0,
+            "comment_count": i % 20,
+            "created_at": created_at + timedelta(minutes=i),
+        }
+        for i in range(count)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "placeholder.settings.local")
+    sys.path.insert(0, str(BASE_DIR))
+
+    import django
+
+    django.setup()
+
+    from ninja.renderers import JSONRenderer
+
+    from meetup.schemas.meetup import MeetupListSchema
+    from placeholder.renderers import ORJSONRenderer
+
+    schemas = [MeetupListSchema.model_validate(row) for row in _rows(args.rows)]
+    data = {"result": [schema.model_dump() for schema in schemas], "total": args.rows}
+    renderers = (("json (default)", JSONRenderer()), ("orjson", ORJSONRenderer()))
+
+    print(f"rows={args.rows} rounds={args.rounds}")
+    for name, renderer in renderers:
+        assert renderer.render(None, data, response_status=200)
+        render_ms = _measure(lambda: renderer.render(None, data, response_status=200), args.rounds)
+        total_ms = _measure(
+            lambda: renderer.render(
+                None, {"result": [s.model_dump() for s in schemas], "total": args.rows}, response_status=200
+            ),
+            args.rounds,
+        )
+        size = len(renderer.render(None, data, response_status=200))
+        print(f"{name:>15}: render {render_ms:7.2f}ms  dump+render {total_ms:7.2f}ms  ({size} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+Presigned POST 생성 벤치마크
+
+로컬 S3 호환 엔드포인트(기본값 http://127.0.0.1:9000)와 더미 자격 증명으로
+파일 N개에 대한 presigned POST 생성 시간을 비교합니다. 서명은 로컬에서만 이루어지므로
+실제 S3 서버가 떠 있을 필요는 없습니다.
+
+    python benchmarks/presign.py --files 10 --rounds 50
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+
+def _measure(func, rounds):
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=10)
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument("--endpoint-url", default="http://127.0.0.1:9000")
+    args = parser.parse_args()
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "placeholder.settings.local")
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "benchmark")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "benchmark-secret")
+    os.environ.setdefault("AWS_S3_MEDIA_BUCKET_NAME", "benchmark")
+    os.environ["AWS_S3_ENDPOINT_URL"] = args.endpoint_url
+    sys.path.insert(0, str(BASE_DIR))
+
+    import django
+
+    django.setup()
+
+    from placeholder.utils.local_storage import LocalStorage
+    from placeholder.utils.s3 import S3Service, clear_client_pool
+
+    filetypes = ["image/jpeg"] * args.files
+    service = S3Service()
+
+    def client_per_file():
+        # 기존 동작: 파일마다 새 클라이언트를 만듭니다.
+        for type_ in filetypes:
+            clear_client_pool()
+            service.create_presigned_url(f"meetup/{type_}", type_)
+
+    def pooled_per_file():
+        service.create_multi_presigned_url("meetup", filetypes)
+
+    def batch():
+        service.create_batch_presigned_url("meetup", filetypes)
+
+    def local_batch():
+        # 네트워크/boto3 없이 HMAC 서명만 하는 로컬 저장소 기준치입니다.
+        LocalStorage().create_batch_presigned_url("meetup", filetypes)
+
+    print(f"files={args.files} rounds={args.rounds} endpoint={args.endpoint_url}")
+    benchmarks = (
+        ("client per file", client_per_file),
+        ("pooled client", pooled_per_file),
+        ("batch", batch),
+        ("local batch", local_batch),
+    )
+    for name, func in benchmarks:
+        func()
+        print(f"{name:>16}: {_measure(func, args.rounds):8.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+from functools import wraps
+
+from django.db.models import (
+    BooleanField,
+    Case,
+    OuterRef,
+    QuerySet,
+    Subquery,
+    Value,
+    When,
+)
+
+from meetup.models import Meetup, Member, Proposal, Schedule, ScheduleComment
+from placeholder.utils.enums import StrEnum
+from placeholder.utils.exceptions import ForbiddenException, NotFoundException
+from placeholder.utils.identity import remember, shared
+
+
+class AccessLevel(StrEnum):
+    ANY = ("any",)
+    MEMBER = ("member",)
+    ORGANIZER = ("organizer",)
+
+
+# 모델별 모임까지의 경로와 찾지 못했을 때의 메시지
+ACCESS_PATHS = {
+    Meetup: (None, "존재 하지 않은 모임입니다."),
+    Schedule: ("meetup", "존재 하지 않은 스케쥴 입니다."),
+    ScheduleComment: ("schedule__meetup", "존재 하지 않은 댓글 입니다."),
+    Proposal: ("meetup", "존재 하지 않은 신청 입니다."),
+    Member: ("meetup", "존재 하지 않은 모임원 입니다."),
+}
+
+
+def annotate_access(queryset, user):
+    """
+    대상 객체에 요청한 사용자의 모임 내 역할(access_role)과 모임장 여부(is_organizer)를 붙입니다.
+    모임원 여부는 access_role이 있는지로 판단하므로 객체와 권한을 한 번의 쿼리로 가져옵니다.
+    """
+    meetup_path, _ = ACCESS_PATHS[queryset.model]
+    if meetup_path:
+        meetup_id, organizer_id = OuterRef(f"{meetup_path}_id"), f"{meetup_path}__organizer_id"
+        # 삭제 처리 중인 모임의 하위 객체도 숨깁니다.
+        queryset = queryset.filter(**{f"{meetup_path}__deleted_at__isnull": True})
+    else:
+        meetup_id, organizer_id = OuterRef("pk"), "organizer_id"
+    membership = Member.objects.filter(meetup_id=meetup_id, user_id=user.pk)
+    return queryset.annotate(
+        access_role=Subquery(membership.values("role")[:1]),
+        is_organizer=Case(
+            When(**{organizer_id: user.pk}, then=Value(True)), default=Value(False), output_field=BooleanField()
+        ),
+    )
+
+
+def _load_with_access(queryset, user, pk):
+    obj = annotate_access(queryset, user).filter(pk=pk).first()
+    if obj:
+        obj.is_member = obj.access_role is not None
+        # get_by_pk도 같은 인스턴스를 쓰도록 identity map에 등록합니다.
+        remember(obj)
+    return obj
+
+
+def load(request, source, pk, level=AccessLevel.MEMBER):
+    """
+    source(모델 또는 QuerySet)에서 pk 객체를 권한 정보와 함께 불러오고 level을 확인합니다.
+    같은 요청(batch 안에서는 같은 batch) 안에서 다시 부르면 쿼리 없이 앞서 불러온 객체를 돌려줍니다.
+    """
+    queryset = source if isinstance(source, QuerySet) else source.objects.all()
+    model = queryset.model
+    cache = request.__dict__.setdefault("_access_cache", {})
+    key = (model, str(pk))
+    if key not in cache:
+        # batch 안에서는 하위 요청들이 같은 사용자의 같은 객체를 한 번만 불러옵니다.
+        # source마다 annotate가 다를 수 있으므로 source(모델 또는 모듈 수준 QuerySet)도 키에 넣습니다.
+        shared_key = ("access", source, str(pk), request.auth.pk)
+        cache[key] = shared(shared_key, lambda: _load_with_access(queryset, request.auth, pk))
+
+    obj = cache[key]
+    if not obj:
+        raise NotFoundException(ACCESS_PATHS[model][1])
+    if level == AccessLevel.MEMBER and not obj.is_member:
+        raise ForbiddenException()
+    if level == AccessLevel.ORGANIZER and not obj.is_organizer:
+        raise ForbiddenException()
+    return obj
+
+
+def require_access(source, param, level=AccessLevel.MEMBER):
+    """
+    라우트에 필요한 권한을 선언합니다. 경로 파라미터 param의 객체를 load로 미리 불러와 확인하며,
+    핸들러에서는 같은 인자로 load를 불러 객체를 꺼내 씁니다.
+    """
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(request, *args, **kwargs):
+            load(request, source, kwargs[param], level)
+            return func(request, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
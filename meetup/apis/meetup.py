@@ -3,6 +3,7 @@ from datetime import datetime
 from typing import List, Optional
 from urllib.parse import unquote
 
+from django.conf import settings
 from django.db import transaction
 from django.db.models import (
     BooleanField,
@@ -18,11 +19,14 @@ from django.db.models import (
 from ninja import Query, Router
 from ninja.pagination import paginate
 
+from meetup.deletion import delete_meetup_later
 from meetup.models import Meetup, MeetupLike, Member
+from meetup.relationships import get_relationships
 from meetup.schemas.meetup import (
     MeetupCreateSchema,
     MeetupLikeSchema,
     MeetupListSchema,
+    MeetupRelationshipResultSchema,
     MeetupSchema,
 )
 from placeholder.pagination import CustomPagination
@@ -30,8 +34,19 @@ from placeholder.schemas.base import PresignedUrlSchema
 from placeholder.utils.auth import JWTAuth, anonymous_user
 from placeholder.utils.decorators import handle_exceptions
 from placeholder.utils.enums import MeetupSort
-from placeholder.utils.exceptions import NotFoundException, UnauthorizedAccessException
-from placeholder.utils.s3 import S3Service
+from placeholder.utils.exceptions import (
+    BatchTooLargeException,
+    NotFoundException,
+    UnauthorizedAccessException,
+)
+from placeholder.utils.fields import (
+    get_requested_fields,
+    is_field_requested,
+    sparse_fields,
+)
+from placeholder.utils.images import schedule_image_derivatives
+from placeholder.utils.projection import project_queryset
+from placeholder.utils.storage import get_storage
 
 meetup_router = Router(tags=["Meetup"])
 
@@ -44,11 +59,13 @@ def create_meetup(request, payload: MeetupCreateSchema):
     with transaction.atomic():
         meetup = Meetup.objects.create(**payload.dict(by_alias=False), organizer=user)
         Member.objects.create(user=request.auth, meetup=meetup, role=Member.MemberRole.ORGANIZER.value)
+        schedule_image_derivatives(meetup.image)
     return meetup
 
 
 @meetup_router.get("", response=List[MeetupListSchema], auth=[JWTAuth(), anonymous_user], by_alias=True)
 @handle_exceptions
+@sparse_fields(MeetupListSchema)
 @paginate(CustomPagination)
 def get_meetups(
     request,
@@ -83,16 +100,14 @@ def get_meetups(
     if description:
         filters["description__icontains"] = unquote(description)
 
+    annotations = {
+        "is_like": is_like_annotation,
+        "comment_count": Count("meetupcomment", filter=Q(meetupcomment__is_delete=False)),
+        "is_organizer": is_organizer,
+    }
     meetups = (
-        Meetup.objects.select_related("organizer")
-        .annotate(
-            is_like=is_like_annotation,
-            comment_count=Count(
-                "meetupcomment",
-                filter=Q(meetupcomment__is_delete=False),
-            ),
-            is_organizer=is_organizer,
-        )
+        project_queryset(Meetup.objects.all(), MeetupListSchema, fields=get_requested_fields(request))
+        .annotate(**{name: value for name, value in annotations.items() if is_field_requested(request, name)})
         .filter(**filters)
         .all()
     )
@@ -110,14 +125,26 @@ def get_meetups(
 @meetup_router.get("presigned-url", response=PresignedUrlSchema, auth=JWTAuth(), by_alias=True)
 @handle_exceptions
 def get_presigned_url(request, filetype):
-    s3_service = S3Service()
     filetype_list = filetype.split(",")
-    result = s3_service.create_multi_presigned_url("meetup", filetype_list)
+    result = get_storage().create_batch_presigned_url("meetup", filetype_list)
     return result
 
 
+# "{meetup_id}" 경로보다 먼저 등록해야 relationships가 모임 id로 해석되지 않습니다.
+@meetup_router.get("relationships", response=MeetupRelationshipResultSchema, auth=JWTAuth(), by_alias=True)
+@handle_exceptions
+def get_meetup_relationships(request, ids: List[int] = Query(..., description="모임 id 목록")):
+    """
+    목록 화면의 모임 카드들에 대한 내 관계(모임원/역할/신청 상태/좋아요/모임장 여부)를 한 번에 조회합니다.
+    """
+    if len(ids) > settings.MEETUP_RELATIONSHIP_MAX_IDS:
+        raise BatchTooLargeException()
+    return {"result": get_relationships(request.auth, ids)}
+
+
 @meetup_router.get("{meetup_id}", response=MeetupSchema, auth=[JWTAuth(), anonymous_user], by_alias=True)
 @handle_exceptions
+@sparse_fields(MeetupSchema)
 def get_meetup(request, meetup_id: int):
     user = request.auth
 
@@ -130,13 +157,14 @@ def get_meetup(request, meetup_id: int):
         is_like_annotation = Value(False, output_field=BooleanField())
         is_organizer = Value(False, output_field=BooleanField())
 
+    annotations = {
+        "is_like": is_like_annotation,
+        "comment_count": Count("meetupcomment", filter=Q(meetupcomment__is_delete=False)),
+        "is_organizer": is_organizer,
+    }
     meetup = (
-        Meetup.objects.select_related("organizer")
-        .annotate(
-            is_like=is_like_annotation,
-            comment_count=Count("meetupcomment", filter=Q(meetupcomment__is_delete=False)),
-            is_organizer=is_organizer,
-        )
+        project_queryset(Meetup.objects.all(), MeetupSchema, fields=get_requested_fields(request))
+        .annotate(**{name: value for name, value in annotations.items() if is_field_requested(request, name)})
         .filter(id=meetup_id)
         .first()
     )
@@ -160,10 +188,12 @@ def update_meetup(request, meetup_id: int, payload: MeetupCreateSchema):
         raise NotFoundException("존재 하지 않은 모임 입니다.")
     if meetup.organizer != user:
         raise UnauthorizedAccessException()
+    previous_image = meetup.image
     for attr, value in payload.model_dump(by_alias=False).items():
         setattr(meetup, attr, value)
 
     meetup.save()
+    schedule_image_derivatives(meetup.image, previous_image)
     return meetup
 
 
@@ -173,9 +203,9 @@ def delete_meetup(request, meetup_id: int):
     meetup = Meetup.objects.filter(id=meetup_id).first()
     if not meetup:
         raise NotFoundException("존재 하지 않은 모임 입니다.")
-    if meetup.organizer != request.auth:
+    if meetup.organizer_id != request.auth.id:
         raise UnauthorizedAccessException()
-    meetup.delete()
+    delete_meetup_later(meetup)
     return None
 
 
@@ -13,6 +13,7 @@ from notification.models import Notification
 from placeholder.utils.auth import JWTAuth
 from placeholder.utils.decorators import handle_exceptions
 from placeholder.utils.exceptions import ForbiddenException, NotFoundException
+from placeholder.utils.identity import get_by_pk
 
 meetup_comment_router = Router(tags=["MeetupComment"])
 
@@ -52,7 +53,7 @@ def create_meetup_comment(request, meetup_id, payload: MeetupCommentCreateSchema
 )
 @handle_exceptions
 def get_comments(request, meetup_id):
-    if not Meetup.objects.filter(id=meetup_id).exists():
+    if not get_by_pk(Meetup, meetup_id):
         raise NotFoundException("존재 하지 않은 모임 입니다.")
     comments = (
         MeetupComment.objects.select_related("user", "meetup")
@@ -1,13 +1,23 @@
 # -*- coding: utf-8 -*-
+from typing import Optional
+
 from django.db import transaction
-from ninja import Router
+from ninja import Query, Router
 
+from meetup.access import AccessLevel, load, require_access
 from meetup.apis.meetup import meetup_router
+from meetup.models import Meetup
 from meetup.models.member import Member
-from meetup.schemas.member import MemberListResultSchema
+from meetup.roster import get_roster_page
+from meetup.schemas.member import (
+    MemberListResultSchema,
+    MemberListSchema,
+    MemberRosterSchema,
+)
 from placeholder.utils.auth import JWTAuth
 from placeholder.utils.decorators import handle_exceptions
-from placeholder.utils.exceptions import ForbiddenException, NotFoundException
+from placeholder.utils.exceptions import ForbiddenException
+from placeholder.utils.projection import project_queryset
 
 member_router = Router(tags=["Member"])
 
@@ -16,20 +26,39 @@ member_router = Router(tags=["Member"])
     "{meetup_id}/member", response=MemberListResultSchema, auth=JWTAuth(), by_alias=True, tags=["Member"]
 )
 @handle_exceptions
+@require_access(Meetup, "meetup_id", AccessLevel.MEMBER)
 def get_members(request, meetup_id):
-    members = Member.objects.filter(meetup_id=meetup_id).all()
+    # 탈퇴 처리 중인 사용자는 명단에서 뺍니다.
+    members = Member.objects.filter(
+        meetup_id=meetup_id, meetup__deleted_at__isnull=True, user__deleted_at__isnull=True
+    )
+    members = project_queryset(members, MemberListSchema)
     return {"result": members}
 
 
+@meetup_router.get(
+    "{meetup_id}/member/roster", response=MemberRosterSchema, auth=JWTAuth(), by_alias=True, tags=["Member"]
+)
+@handle_exceptions
+@require_access(Meetup, "meetup_id", AccessLevel.MEMBER)
+def get_member_roster(
+    request,
+    meetup_id: int,
+    cursor: Optional[str] = Query(None, description="이전 응답의 next 값"),
+    size: int = Query(20, ge=1, le=100, description="페이지 크기"),
+):
+    """
+    모임원 명단. 역할별 인원 수와 함께 모임장부터 커서로 나눠 내려줍니다.
+    """
+    return get_roster_page(meetup_id, cursor, size)
+
+
 @member_router.delete("{member_id}", response={204: None}, auth=JWTAuth(), by_alias=True)
 @handle_exceptions
 def delete_member(request, member_id):
-    member = Member.objects.select_related("meetup").filter(id=member_id).first()
-    if not member:
-        raise NotFoundException("존재 하지 않은 모임원 입니다.")
-
-    proposal_queryset = request.auth.proposal_set.filter(meetup=member.meetup)
-    if request.auth == member.user:
+    member = load(request, Member, member_id, AccessLevel.ANY)
+    proposal_queryset = request.auth.proposal_set.filter(meetup_id=member.meetup_id)
+    if member.user_id == request.auth.id:
         with transaction.atomic():
             proposal_queryset.delete()
             member.delete()
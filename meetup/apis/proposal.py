@@ -1,22 +1,44 @@
 # -*- coding: utf-8 -*-
-from typing import List
+from datetime import datetime
+from typing import List, Optional
 
-from ninja import Router
+from django.db import transaction
+from django.db.models import Count, Q
+from django.utils import timezone
+from ninja import Query, Router
 from ninja.pagination import paginate
 
+from meetup.access import AccessLevel, load, require_access
 from meetup.apis.meetup import meetup_router
 from meetup.models import Meetup, Member
 from meetup.models.proposal import Proposal
+from meetup.proposal_state import (
+    create_proposal,
+    explain_failures,
+    transition,
+    transition_many,
+)
+from meetup.roster import invalidate_roster
 from meetup.schemas.proposal import (
+    ProposalBulkDecisionSchema,
+    ProposalBulkResultSchema,
     ProposalCreateSchema,
+    ProposalInboxSchema,
     ProposalListSchema,
     ProposalSchema,
 )
 from notification.models import Notification
-from placeholder.pagination import CustomPagination
+from placeholder.pagination import CustomPagination, decode_cursor, encode_cursor
 from placeholder.utils.auth import JWTAuth
 from placeholder.utils.decorators import handle_exceptions
-from placeholder.utils.exceptions import ForbiddenException, NotFoundException
+from placeholder.utils.exceptions import (
+    ForbiddenException,
+    InvalidCursorException,
+    NotFoundException,
+)
+from placeholder.utils.identity import get_by_pk
+from placeholder.utils.projection import project_queryset
+from user.dashboard import invalidate_dashboard
 
 proposal_router = Router(tags=["Proposal"])
 
@@ -29,18 +51,73 @@ proposal_router = Router(tags=["Proposal"])
     tags=["Proposal"],
 )
 @handle_exceptions
+@require_access(Meetup, "meetup_id", AccessLevel.ORGANIZER)
 @paginate(CustomPagination)
 def get_proposals(request, meetup_id):
-    meetup = Meetup.objects.filter(id=meetup_id).first()
-    if not meetup:
-        raise NotFoundException("존재 하지 않은 모임입니다.")
-    if not request.auth == meetup.organizer:
-        raise ForbiddenException()
-    proposals = Proposal.objects.prefetch_related("user").filter(meetup_id=meetup_id).all()
+    # 삭제 처리 중인 모임과 탈퇴 처리 중인 사용자의 신청은 내려주지 않습니다.
+    proposals = Proposal.objects.filter(
+        meetup_id=meetup_id, meetup__deleted_at__isnull=True, user__deleted_at__isnull=True
+    )
+    proposals = project_queryset(proposals, ProposalListSchema)
 
     return proposals
 
 
+def _inbox_cursor_filter(cursor):
+    # (status ASC, created_at DESC, id DESC) 순서에서 커서 다음 행들
+    last_status, last_created_at, last_id = decode_cursor(cursor, 3)
+    try:
+        last_created_at = datetime.fromisoformat(last_created_at)
+        last_id = int(last_id)
+    except (TypeError, ValueError):
+        raise InvalidCursorException()
+    return (
+        Q(status__gt=last_status)
+        | Q(status=last_status, created_at__lt=last_created_at)
+        | Q(status=last_status, created_at=last_created_at, id__lt=last_id)
+    )
+
+
+@meetup_router.get(
+    "{meetup_id}/proposal/inbox",
+    response=ProposalInboxSchema,
+    auth=JWTAuth(),
+    by_alias=True,
+    tags=["Proposal"],
+)
+@handle_exceptions
+@require_access(Meetup, "meetup_id", AccessLevel.ORGANIZER)
+def get_proposal_inbox(
+    request,
+    meetup_id: int,
+    status: Optional[Proposal.ProposalStatus] = Query(None, description="신청 상태"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next 값"),
+    size: int = Query(10, ge=1, le=50, description="페이지 크기"),
+):
+    """
+    모임장 신청함. 상태별 신청 수와 함께 신청서를 (status, created_at, id) 기준 keyset 커서로 나눠 내려줍니다.
+    """
+    meetup = load(request, Meetup, meetup_id, AccessLevel.ORGANIZER)
+    received = Proposal.objects.filter(
+        meetup_id=meetup_id, meetup__deleted_at__isnull=True, user__deleted_at__isnull=True
+    ).exclude(user_id=meetup.organizer_id)
+    counts = dict(received.order_by().values("status").annotate(count=Count("id")).values_list("status", "count"))
+
+    proposals = project_queryset(received, ProposalListSchema)
+    if status:
+        proposals = proposals.filter(status=status.value)
+    if cursor:
+        proposals = proposals.filter(_inbox_cursor_filter(cursor))
+    page = list(proposals.order_by("status", "-created_at", "-id")[: size + 1])
+
+    next_cursor = None
+    if len(page) > size:
+        page = page[:size]
+        last = page[-1]
+        next_cursor = encode_cursor([last.status, last.created_at, last.id])
+    return {"counts": counts, "result": page, "next": next_cursor}
+
+
 @meetup_router.get(
     "{meetup_id}/proposal/status",
     response=ProposalListSchema,
@@ -51,6 +128,8 @@ def get_proposal_status(request, meetup_id):
     user = request.auth
     proposal = Proposal.objects.filter(meetup_id=meetup_id, user=user).first()
     if proposal:
+        # 신청자는 요청한 사용자이므로 다시 조회하지 않고 인증된 인스턴스를 씁니다.
+        proposal.user = user
         return proposal
     return None
 
@@ -65,32 +144,95 @@ def get_proposal_status(request, meetup_id):
 @handle_exceptions
 def post_proposal(request, meetup_id, payload: ProposalCreateSchema):
     user = request.auth
-    meetup = Meetup.objects.select_related("organizer").filter(id=meetup_id).first()
+    meetup = get_by_pk(Meetup, meetup_id)
     if not meetup:
         raise NotFoundException("존재 하지 않은 모임입니다.")
-    if Proposal.objects.filter(user=user, meetup=meetup).exists():
+    proposal = create_proposal(user.id, meetup.id, payload.text)
+    if not proposal:
         raise NotFoundException("이미 신청한 모임입니다.")
-    proposal = Proposal.objects.create(user=user, meetup=meetup, text=payload.text)
 
     Notification.objects.create(
         type=Notification.NotificationType.RECEIVED_PROPOSAL.value,
         model_id=proposal.id,
         sender=user,
-        recipient=meetup.organizer,
+        recipient_id=meetup.organizer_id,
         message=f"{user.nickname}님이 {meetup.ad_title}에 신청서를 보냈습니다.",
     )
 
     return proposal
 
 
+DECISION_MESSAGES = {
+    Proposal.ProposalStatus.ACCEPTANCE.value: "{ad_title}에서 회원님의 신청서를 수락했습니다.",
+    Proposal.ProposalStatus.REFUSE.value: "{ad_title}에서 회원님의 신청서를 거절했습니다.",
+}
+
+
+def _after_decision(user, proposals, status):
+    """상태가 바뀐 신청서들에 대해 모임원 추가와 알림 생성을 bulk insert로 처리합니다."""
+    if status == Proposal.ProposalStatus.ACCEPTANCE.value:
+        Member.objects.bulk_create(
+            [Member(user_id=proposal.user_id, meetup_id=proposal.meetup_id) for proposal in proposals],
+            ignore_conflicts=True,
+        )
+        transaction.on_commit(lambda: invalidate_roster(*{proposal.meetup_id for proposal in proposals}))
+    if status in DECISION_MESSAGES:
+        ad_titles = dict(
+            Meetup.objects.filter(id__in={proposal.meetup_id for proposal in proposals}).values_list("id", "ad_title")
+        )
+        Notification.objects.bulk_create(
+            [
+                Notification(
+                    type=Notification.NotificationType.SENT_PROPOSAL.value,
+                    model_id=proposal.id,
+                    sender=user,
+                    recipient_id=proposal.user_id,
+                    message=DECISION_MESSAGES[status].format(ad_title=ad_titles.get(proposal.meetup_id, "")),
+                )
+                for proposal in proposals
+            ]
+        )
+    # 조건부 UPDATE와 bulk_create()는 signal을 보내지 않으므로 대시보드 캐시를 직접 비웁니다.
+    transaction.on_commit(
+        lambda: invalidate_dashboard(user.id, *{proposal.user_id for proposal in proposals}),
+    )
+
+
+def _decide(request, proposal_id, status):
+    # 단건 API는 기존처럼 현재 상태와 관계없이 바꿉니다. (전이 규칙은 bulk에만 적용합니다)
+    with transaction.atomic():
+        proposal = transition(proposal_id, request.auth.id, status, Proposal.ProposalStatus.values())
+        _after_decision(request.auth, [proposal], status)
+    return proposal
+
+
+# "{proposal_id}" 경로보다 먼저 등록해야 bulk가 신청 id로 해석되지 않습니다.
+@proposal_router.post("bulk", response=ProposalBulkResultSchema, auth=JWTAuth(), by_alias=True)
+@handle_exceptions
+def decide_proposals(request, payload: ProposalBulkDecisionSchema):
+    """
+    여러 신청서를 한 번에 수락/거절/무시합니다.
+    한 트랜잭션 안에서 조건부 UPDATE 한 번, 모임원/알림 bulk insert로 처리하고 id별 결과를 반환합니다.
+    """
+    user = request.auth
+    ids = list(dict.fromkeys(payload.ids))
+
+    with transaction.atomic():
+        proposals = transition_many(ids, user.id, payload.action)
+        if proposals:
+            _after_decision(user, proposals, payload.action)
+
+    outcomes = {proposal.id: "updated" for proposal in proposals}
+    if len(outcomes) < len(ids):
+        outcomes.update(explain_failures([proposal_id for proposal_id in ids if proposal_id not in outcomes], user.id))
+    return {"result": [{"id": proposal_id, "outcome": outcomes[proposal_id]} for proposal_id in ids]}
+
+
 @proposal_router.delete("{proposal_id}", response={204: None}, auth=JWTAuth(), by_alias=True)
 @handle_exceptions
 def delete_proposal(request, proposal_id):
-    user = request.auth
-    proposal = Proposal.objects.select_related("meetup").filter(id=proposal_id).first()
-    if not proposal:
-        raise NotFoundException("존재 하지 않은 신청 입니다.")
-    if user == proposal.meetup.organizer or user == proposal.user:
+    proposal = load(request, Proposal, proposal_id, AccessLevel.ANY)
+    if proposal.is_organizer or proposal.user_id == request.auth.id:
         proposal.delete()
         return None
     raise ForbiddenException()
@@ -103,27 +245,8 @@ def delete_proposal(request, proposal_id):
     by_alias=True,
 )
 @handle_exceptions
-def accept_proposal(request, proposal_id):
-    user = request.auth
-    proposal = Proposal.objects.select_related("meetup").filter(id=proposal_id).first()
-    if not proposal:
-        raise NotFoundException("존재 하지 않은 신청 입니다.")
-    meetup = proposal.meetup
-    if not request.auth == meetup.organizer:
-        raise ForbiddenException()
-    proposal.status = Proposal.ProposalStatus.ACCEPTANCE.value
-    proposal.save()
-    if not Member.objects.filter(user_id=proposal.user_id, meetup_id=meetup.id).exists():
-        Member.objects.create(user_id=proposal.user_id, meetup_id=meetup.id)
-
-    Notification.objects.create(
-        type=Notification.NotificationType.SENT_PROPOSAL.value,
-        model_id=proposal.id,
-        sender=user,
-        recipient=proposal.user,
-        message=f"{meetup.ad_title}에서 회원님의 신청서를 수락했습니다.",
-    )
-    return proposal
+def accept_proposal(request, proposal_id: int):
+    return _decide(request, proposal_id, Proposal.ProposalStatus.ACCEPTANCE.value)
 
 
 @proposal_router.post(
@@ -133,25 +256,8 @@ def accept_proposal(request, proposal_id):
     by_alias=True,
 )
 @handle_exceptions
-def refuse_proposal(request, proposal_id):
-    user = request.auth
-    proposal = Proposal.objects.select_related("meetup").filter(id=proposal_id).first()
-    if not proposal:
-        raise NotFoundException("존재 하지 않은 신청 입니다.")
-    meetup = proposal.meetup
-    if not user == meetup.organizer:
-        raise ForbiddenException()
-    proposal.status = Proposal.ProposalStatus.REFUSE.value
-    proposal.save()
-
-    Notification.objects.create(
-        type=Notification.NotificationType.SENT_PROPOSAL.value,
-        model_id=proposal.id,
-        sender=user,
-        recipient=proposal.user,
-        message=f"{meetup.ad_title}에서 회원님의 신청서를 거절했습니다.",
-    )
-    return proposal
+def refuse_proposal(request, proposal_id: int):
+    return _decide(request, proposal_id, Proposal.ProposalStatus.REFUSE.value)
 
 
 @proposal_router.post(
@@ -161,16 +267,8 @@ def refuse_proposal(request, proposal_id):
     by_alias=True,
 )
 @handle_exceptions
-def ignore_proposal(request, proposal_id):
-    user = request.auth
-    proposal = Proposal.objects.select_related("meetup").filter(id=proposal_id).first()
-    if not proposal:
-        raise NotFoundException("존재 하지 않은 신청 입니다.")
-    if not user == proposal.meetup.organizer:
-        raise ForbiddenException()
-    proposal.status = Proposal.ProposalStatus.IGNORE.value
-    proposal.save()
-    return proposal
+def ignore_proposal(request, proposal_id: int):
+    return _decide(request, proposal_id, Proposal.ProposalStatus.IGNORE.value)
 
 
 @proposal_router.post(
@@ -182,9 +280,8 @@ def ignore_proposal(request, proposal_id):
 @handle_exceptions
 def hide_proposal(request, proposal_id):
     user = request.auth
-    proposal = Proposal.objects.select_related("meetup").filter(id=proposal_id, user=user).first()
-    if not proposal:
+    if not Proposal.objects.filter(id=proposal_id, user=user).update(
+        is_hide_to_proposer=True, updated_at=timezone.now()
+    ):
         raise NotFoundException("존재 하지 않은 신청 입니다.")
-    proposal.is_hide_to_proposer = True
-    proposal.save()
     return None
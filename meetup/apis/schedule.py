@@ -1,47 +1,111 @@
 # -*- coding: utf-8 -*-
+from typing import List, Optional
+
+from django.conf import settings
 from django.db import transaction
-from django.db.models import Count, Q
-from ninja import Router
+from django.db.models import (
+    Count,
+    Exists,
+    F,
+    IntegerField,
+    OuterRef,
+    Q,
+    Subquery,
+    Window,
+)
+from django.db.models.functions import Coalesce, RowNumber
+from ninja import Query, Router
+from ninja.pagination import paginate
 
+from meetup.access import AccessLevel, load, require_access
 from meetup.apis.meetup import meetup_router
-from meetup.models import Meetup, Member, Schedule
-from meetup.schemas.schedule import ScheduleCreateSchema, ScheduleSchema
-from placeholder.schemas.base import PresignedUrlSchema, ResultSchema
-from placeholder.utils.auth import JWTAuth
+from meetup.models import Meetup, Schedule, ScheduleComment
+from meetup.nearby import find_in_viewport, find_nearby
+from meetup.schemas.schedule import (
+    NearbyResultSchema,
+    ScheduleCreateSchema,
+    ScheduleListResultSchema,
+    ScheduleSchema,
+)
+from placeholder.pagination import CustomPagination
+from placeholder.schemas.base import PresignedUrlSchema
+from placeholder.utils.auth import JWTAuth, anonymous_user
 from placeholder.utils.decorators import handle_exceptions
-from placeholder.utils.exceptions import ForbiddenException, NotFoundException
-from placeholder.utils.s3 import S3Service
+from placeholder.utils.exceptions import InvalidLocationException
+from placeholder.utils.images import schedule_image_derivatives
+from placeholder.utils.projection import project_queryset
+from placeholder.utils.storage import get_storage
+from user.models.user import User
+from user.schemas.user import UserProfileSchema
 
 schedule_router = Router(tags=["Schedule"])
 
 
+ScheduleParticipant = Schedule.participant.through
+
+
+def _with_comment_count(queryset):
+    return queryset.annotate(
+        comment_count=Count(
+            "schedulecomment",
+            filter=Q(schedulecomment__is_delete=False),
+        ),
+    )
+
+
+def _count(queryset):
+    """OuterRef로 일정에 묶인 queryset의 행 수를 스칼라 서브쿼리로 셉니다. (조인끼리 곱해지지 않습니다)"""
+    counts = queryset.order_by().values("schedule_id").annotate(count=Count("pk")).values("count")
+    return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+
+
+def _attach_participant_previews(schedules):
+    """일정별 먼저 참여한 N명을 ROW_NUMBER() 윈도 함수로 한 번에 가져와 participant_preview에 붙입니다."""
+    previews = {schedule.id: [] for schedule in schedules}
+    if not previews:
+        return schedules
+    rows = (
+        ScheduleParticipant.objects.filter(schedule_id__in=previews, user__deleted_at__isnull=True)
+        .annotate(rank=Window(RowNumber(), partition_by=F("schedule_id"), order_by=F("id").asc()))
+        .filter(rank__lte=settings.SCHEDULE_PARTICIPANT_PREVIEW_SIZE)
+        .select_related("user")
+        .only("schedule_id", "user__id", "user__nickname", "user__image", "user__derived_image")
+        .order_by("schedule_id", "rank")
+    )
+    for row in rows:
+        previews[row.schedule_id].append(row.user)
+    for schedule in schedules:
+        schedule.participant_preview = previews[schedule.id]
+    return schedules
+
+
+SCHEDULE_WITH_COMMENT_COUNT = _with_comment_count(Schedule.objects.all())
+
+
 @meetup_router.get(
     "{meetup_id}/schedule",
-    response=ResultSchema,
+    response=ScheduleListResultSchema,
     auth=JWTAuth(),
     by_alias=True,
     tags=["Schedule"],
 )
 @handle_exceptions
+@require_access(Meetup, "meetup_id", AccessLevel.MEMBER)
 def get_schedules(request, meetup_id):
-    meetup = Meetup.objects.filter(id=meetup_id).first()
-    if not meetup:
-        raise NotFoundException("존재 하지 않은 모임입니다.")
-    if not Member.objects.filter(meetup_id=meetup_id, user=request.auth).exists():
-        raise ForbiddenException()
-    schedules = (
-        Schedule.objects.prefetch_related("participant")
-        .filter(meetup_id=meetup_id)
-        .annotate(
-            comment_count=Count(
-                "schedulecomment",
-                filter=Q(schedulecomment__is_delete=False),
-            ),
-        )
-        .order_by("scheduled_at")
-        .all()
+    """
+    모임의 일정 목록. 참여자는 전체 목록 대신 인원 수와 앞의 몇 명(participant_preview)만 내려주며,
+    전체 참여자는 GET /schedule/{schedule_id}/participant 로 나눠 조회합니다.
+    """
+    schedules = Schedule.objects.filter(meetup_id=meetup_id).annotate(
+        comment_count=_count(ScheduleComment.objects.filter(schedule_id=OuterRef("pk"), is_delete=False)),
+        participant_count=_count(
+            ScheduleParticipant.objects.filter(schedule_id=OuterRef("pk"), user__deleted_at__isnull=True)
+        ),
+        is_participating=Exists(
+            ScheduleParticipant.objects.filter(schedule_id=OuterRef("pk"), user_id=request.auth.id)
+        ),
     )
-    return {"result": schedules}
+    return {"result": _attach_participant_previews(list(schedules.order_by("scheduled_at")))}
 
 
 @meetup_router.post(
@@ -52,79 +116,82 @@ def get_schedules(request, meetup_id):
     tags=["Schedule"],
 )
 @handle_exceptions
+@require_access(Meetup, "meetup_id", AccessLevel.MEMBER)
 def create_schedule(request, meetup_id, payload: ScheduleCreateSchema):
-    meetup = Meetup.objects.filter(id=meetup_id).first()
-    if not meetup:
-        raise NotFoundException("존재 하지 않은 모임입니다.")
-    if not Member.objects.filter(meetup_id=meetup_id, user=request.auth).exists():
-        raise ForbiddenException()
     with transaction.atomic():
         schedule = Schedule.objects.create(**payload.dict(by_alias=False), meetup_id=meetup_id)
         schedule.participant.set([request.auth])
         schedule.save()
+        schedule_image_derivatives(schedule.image)
     return schedule
 
 
 @schedule_router.get("presigned-url", response=PresignedUrlSchema, auth=JWTAuth(), by_alias=True)
 @handle_exceptions
 def get_presigned_url(request, filetype):
-    s3_service = S3Service()
     filetype_list = filetype.split(",")
-    result = s3_service.create_multi_presigned_url("schedule", filetype_list)
+    result = get_storage().create_batch_presigned_url("schedule", filetype_list)
     return result
 
 
+# "{schedule_id}" 경로보다 먼저 등록해야 nearby가 일정 id로 해석되지 않습니다.
+@schedule_router.get("nearby", response=NearbyResultSchema, auth=[JWTAuth(), anonymous_user], by_alias=True)
+@handle_exceptions
+def get_nearby_schedules(
+    request,
+    lat: Optional[float] = Query(None, ge=-90, le=90, description="중심 위도"),
+    lng: Optional[float] = Query(None, ge=-180, le=180, description="중심 경도"),
+    radius: Optional[float] = Query(None, gt=0, description="반경(km)"),
+    bbox: Optional[str] = Query(None, description="지도 화면 영역: minLat,minLng,maxLat,maxLng"),
+):
+    """
+    공개 모임의 예정된 일정을 반경(lat, lng, radius) 또는 지도 화면(bbox) 기준으로 찾습니다.
+    격자 칸 인덱스로 후보를 거른 뒤 실제 거리로 다시 거르며, 일정이 있는 모임을 함께 내려줍니다.
+    """
+    if bbox:
+        try:
+            min_lat, min_lng, max_lat, max_lng = (float(value) for value in bbox.split(","))
+        except ValueError:
+            raise InvalidLocationException()
+        if not (-90 <= min_lat <= max_lat <= 90 and -180 <= min_lng <= max_lng <= 180):
+            raise InvalidLocationException()
+        return find_in_viewport(min_lat, max_lat, min_lng, max_lng)
+    if lat is None or lng is None or radius is None:
+        raise InvalidLocationException()
+    return find_nearby(lat, lng, min(radius, settings.GEO_NEARBY_MAX_RADIUS_KM))
+
+
 @schedule_router.get("{schedule_id}", response=ScheduleSchema, auth=JWTAuth(), by_alias=True)
 @handle_exceptions
+@require_access(SCHEDULE_WITH_COMMENT_COUNT, "schedule_id", AccessLevel.MEMBER)
 def get_schedule(request, schedule_id):
-    if not Member.objects.filter(meetup__schedule__id=schedule_id, user=request.auth).exists():
-        raise ForbiddenException()
-    schedule = (
-        Schedule.objects.filter(id=schedule_id)
-        .order_by("-scheduled_at")
-        .annotate(
-            comment_count=Count(
-                "schedulecomment",
-                filter=Q(schedulecomment__is_delete=False),
-            ),
-        )
-        .first()
-    )
-    if not schedule:
-        raise NotFoundException("존재 하지 않은 스케쥴 입니다.")
-    return schedule
+    return load(request, SCHEDULE_WITH_COMMENT_COUNT, schedule_id)
+
+
+@schedule_router.get("{schedule_id}/participant", response=List[UserProfileSchema], auth=JWTAuth(), by_alias=True)
+@handle_exceptions
+@require_access(Schedule, "schedule_id", AccessLevel.MEMBER)
+@paginate(CustomPagination)
+def get_schedule_participants(request, schedule_id: int):
+    return project_queryset(User.objects.filter(schedule__id=schedule_id), UserProfileSchema).order_by("id")
 
 
 @schedule_router.put("{schedule_id}", response=ScheduleSchema, auth=JWTAuth(), by_alias=True)
 @handle_exceptions
+@require_access(SCHEDULE_WITH_COMMENT_COUNT, "schedule_id", AccessLevel.MEMBER)
 def update_schedule(request, schedule_id, payload: ScheduleCreateSchema):
-    if not Member.objects.filter(meetup__schedule__id=schedule_id, user=request.auth).exists():
-        raise ForbiddenException()
-    schedule = (
-        Schedule.objects.filter(id=schedule_id)
-        .annotate(
-            comment_count=Count(
-                "schedulecomment",
-                filter=Q(schedulecomment__is_delete=False),
-            ),
-        )
-        .first()
-    )
-    if not schedule:
-        raise NotFoundException("존재 하지 않은 스케쥴 입니다.")
+    schedule = load(request, SCHEDULE_WITH_COMMENT_COUNT, schedule_id)
+    previous_image = schedule.image
     for attr, value in payload.model_dump(by_alias=False).items():
         setattr(schedule, attr, value)
     schedule.save()
+    schedule_image_derivatives(schedule.image, previous_image)
     return schedule
 
 
 @schedule_router.delete("{schedule_id}", response=None, auth=JWTAuth(), by_alias=True)
 @handle_exceptions
+@require_access(Schedule, "schedule_id", AccessLevel.MEMBER)
 def delete_schedule(request, schedule_id):
-    if not Member.objects.filter(meetup__schedule__id=schedule_id, user=request.auth).exists():
-        raise ForbiddenException()
-    schedule = Schedule.objects.filter(id=schedule_id).order_by("-scheduled_at").first()
-    if not schedule:
-        raise NotFoundException("존재 하지 않은 스케쥴 입니다.")
-    schedule.delete()
+    load(request, Schedule, schedule_id).delete()
     return None
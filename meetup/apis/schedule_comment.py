@@ -1,8 +1,9 @@
 # -*- coding: utf-8 -*-
 from ninja import Router
 
+from meetup.access import AccessLevel, load, require_access
 from meetup.apis.schedule import schedule_router
-from meetup.models import Member, Schedule, ScheduleComment
+from meetup.models import Schedule, ScheduleComment
 from meetup.schemas.comment import (
     CommentListResultSchema,
     CommentSchema,
@@ -11,10 +12,12 @@ from meetup.schemas.comment import (
 from notification.models import Notification
 from placeholder.utils.auth import JWTAuth
 from placeholder.utils.decorators import handle_exceptions
-from placeholder.utils.exceptions import ForbiddenException, NotFoundException
+from placeholder.utils.exceptions import ForbiddenException
 
 schedule_comment_router = Router(tags=["ScheduleComment"])
 
+REPLY_TARGETS = ScheduleComment.objects.select_related("user").filter(is_delete=False)
+
 
 @schedule_router.post(
     "{schedule_id}/comment",
@@ -24,13 +27,10 @@ schedule_comment_router = Router(tags=["ScheduleComment"])
     tags=["ScheduleComment"],
 )
 @handle_exceptions
+@require_access(Schedule.objects.prefetch_related("participant"), "schedule_id", AccessLevel.MEMBER)
 def create_schedule_comment(request, schedule_id, payload: ScheduleCommentCreateSchema):
     user = request.auth
-    schedule = Schedule.objects.prefetch_related("participant").filter(id=schedule_id).first()
-    if not schedule:
-        raise NotFoundException("존재 하지 않은 스케줄 입니다.")
-    if not Member.objects.filter(meetup__schedule__id=schedule_id, user=user).exists():
-        raise ForbiddenException()
+    schedule = load(request, Schedule, schedule_id)
     comment = ScheduleComment.objects.select_related("user").create(
         user=user, schedule_id=schedule_id, **payload.dict(by_alias=False)
     )
@@ -39,11 +39,11 @@ def create_schedule_comment(request, schedule_id, payload: ScheduleCommentCreate
             type=Notification.NotificationType.SCHEDULE_COMMENT.value,
             model_id=schedule.id,
             sender=user,
-            recipient=member.organizer,
+            recipient=participant,
             message=f"{schedule.memo}에서 {user.nickname}님이 댓글을 달았습니다.",
         )
-        for member in schedule.participant.all()
-        if not member == user
+        for participant in schedule.participant.all()
+        if not participant == user
     ]
     if notifications:
         Notification.objects.bulk_create(notifications)
@@ -59,14 +59,11 @@ def create_schedule_comment(request, schedule_id, payload: ScheduleCommentCreate
     tags=["ScheduleComment"],
 )
 @handle_exceptions
+@require_access(Schedule, "schedule_id", AccessLevel.MEMBER)
 def get_schedules(request, schedule_id):
-    user = request.auth
-    schedule = Schedule.objects.filter(id=schedule_id).first()
-    if not schedule:
-        raise NotFoundException("존재 하지 않은 스케줄 입니다.")
-    if not Member.objects.filter(meetup__schedule__id=schedule_id, user=user).exists():
-        raise ForbiddenException()
-    comments = ScheduleComment.objects.select_related("user").order_by("root", "-created_at")
+    comments = (
+        ScheduleComment.objects.select_related("user").filter(schedule_id=schedule_id).order_by("root", "-created_at")
+    )
     return {"result": comments}
 
 
@@ -77,22 +74,20 @@ def get_schedules(request, schedule_id):
     by_alias=True,
 )
 @handle_exceptions
+@require_access(REPLY_TARGETS, "comment_id", AccessLevel.MEMBER)
 def create_schedule_reply(request, comment_id, payload: ScheduleCommentCreateSchema):
     user = request.auth
-    comment = ScheduleComment.objects.select_related("user", "schedule").filter(id=comment_id, is_delete=False).first()
-    if not comment:
-        raise NotFoundException("존재하지 않은 댓글 입니다")
-    schedule = comment.schedule
+    comment = load(request, ScheduleComment, comment_id)
     root = comment.root or comment_id
     recipient = comment.user.nickname
     reply = ScheduleComment.objects.create(
-        root=root, recipient=recipient, user=user, schedule=schedule, **payload.dict(by_alias=False)
+        root=root, recipient=recipient, user=user, schedule_id=comment.schedule_id, **payload.dict(by_alias=False)
     )
 
     if user != comment.user:
         Notification.objects.create(
             type=Notification.NotificationType.SCHEDULE_COMMENT.value,
-            model_id=schedule.id,
+            model_id=comment.schedule_id,
             sender=user,
             recipient=comment.user,
             message=f"{user.nickname}님이 회원님의 댓글에 댓글을 달았습니다.",
@@ -104,11 +99,8 @@ def create_schedule_reply(request, comment_id, payload: ScheduleCommentCreateSch
 @schedule_comment_router.put("{comment_id}", response=CommentSchema, auth=JWTAuth(), by_alias=True)
 @handle_exceptions
 def update_schedule(request, comment_id, payload: ScheduleCommentCreateSchema):
-    user = request.auth
-    comment = ScheduleComment.objects.select_related("user").filter(id=comment_id).first()
-    if not comment:
-        raise NotFoundException("존재 하지 않은 댓글 입니다.")
-    if user != comment.user:
+    comment = load(request, ScheduleComment, comment_id, AccessLevel.ANY)
+    if comment.user_id != request.auth.id:
         raise ForbiddenException()
     for attr, value in payload.model_dump(by_alias=False).items():
         setattr(comment, attr, value)
@@ -119,11 +111,8 @@ def update_schedule(request, comment_id, payload: ScheduleCommentCreateSchema):
 @schedule_comment_router.delete("{comment_id}", response=None, auth=JWTAuth(), by_alias=True)
 @handle_exceptions
 def delete_schedule(request, comment_id):
-    user = request.auth
-    comment = ScheduleComment.objects.select_related("user").filter(id=comment_id).first()
-    if not comment:
-        raise NotFoundException("존재 하지 않은 댓글 입니다.")
-    if user != comment.user:
+    comment = load(request, ScheduleComment, comment_id, AccessLevel.ANY)
+    if comment.user_id != request.auth.id:
         raise ForbiddenException()
     comment.delete()
     return None
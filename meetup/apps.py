@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class MeetupConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "meetup"
+
+    def ready(self):
+        from meetup import signals  # noqa: F401
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+import logging
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from meetup.models import (
+    DeletionJob,
+    Meetup,
+    MeetupComment,
+    MeetupLike,
+    Member,
+    Proposal,
+    Schedule,
+    ScheduleComment,
+)
+from notification.models import Notification
+from placeholder.utils.tasks import enqueue
+from user.models.user import User
+
+logger = logging.getLogger(__name__)
+
+MEETUP_TARGET = "meetup.meetup"
+USER_TARGET = "user.user"
+
+ScheduleParticipant = Schedule.participant.through
+NotificationType = Notification.NotificationType
+
+
+def _meetup_steps(meetup_id, prefix=""):
+    """모임 하나를 지우는 단계. 자식부터 지워 마지막 모임 삭제 시 cascade로 모을 행이 없게 합니다."""
+    schedule_ids = Schedule.objects.filter(meetup_id=meetup_id).values("pk")
+    proposal_ids = Proposal.objects.filter(meetup_id=meetup_id).values("pk")
+    proposal_types = [NotificationType.RECEIVED_PROPOSAL.value, NotificationType.SENT_PROPOSAL.value]
+    steps = [
+        (
+            "schedule_comment_notifications",
+            Notification.objects.filter(type=NotificationType.SCHEDULE_COMMENT.value, model_id__in=schedule_ids),
+        ),
+        ("proposal_notifications", Notification.objects.filter(type__in=proposal_types, model_id__in=proposal_ids)),
+        (
+            "meetup_comment_notifications",
+            Notification.objects.filter(type=NotificationType.MEETUP_COMMENT.value, model_id=meetup_id),
+        ),
+        ("schedule_comments", ScheduleComment.objects.filter(schedule__meetup_id=meetup_id)),
+        ("schedule_participants", ScheduleParticipant.objects.filter(schedule__meetup_id=meetup_id)),
+        ("schedules", Schedule.objects.filter(meetup_id=meetup_id)),
+        ("meetup_comments", MeetupComment.objects.filter(meetup_id=meetup_id)),
+        ("meetup_likes", MeetupLike.objects.filter(meetup_id=meetup_id)),
+        ("proposals", Proposal.objects.filter(meetup_id=meetup_id)),
+        ("members", Member.objects.filter(meetup_id=meetup_id)),
+        ("meetup", Meetup.all_objects.filter(pk=meetup_id)),
+    ]
+    return [(f"{prefix}{name}", queryset) for name, queryset in steps]
+
+
+def _user_steps(user_id):
+    steps = []
+    for meetup_id in Meetup.all_objects.filter(organizer_id=user_id).values_list("pk", flat=True):
+        steps += _meetup_steps(meetup_id, prefix=f"meetup:{meetup_id}:")
+    steps += [
+        ("notifications", Notification.objects.filter(Q(sender_id=user_id) | Q(recipient_id=user_id))),
+        ("schedule_comments", ScheduleComment.objects.filter(user_id=user_id)),
+        ("schedule_participants", ScheduleParticipant.objects.filter(user_id=user_id)),
+        ("meetup_comments", MeetupComment.objects.filter(user_id=user_id)),
+        ("meetup_likes", MeetupLike.objects.filter(user_id=user_id)),
+        ("proposals", Proposal.objects.filter(user_id=user_id)),
+        ("members", Member.objects.filter(user_id=user_id)),
+        ("user", User.all_objects.filter(pk=user_id)),
+    ]
+    return steps
+
+
+DELETION_PLANS = {
+    MEETUP_TARGET: _meetup_steps,
+    USER_TARGET: _user_steps,
+}
+
+
+def _delete_in_batches(job, step, queryset):
+    batch_size = settings.DELETION_BATCH_SIZE
+    model = queryset.model
+    while True:
+        # 배치마다 트랜잭션을 나눠 잠금을 짧게 유지합니다.
+        with transaction.atomic():
+            ids = list(queryset.order_by().values_list("pk", flat=True)[:batch_size])
+            if not ids:
+                return
+            deleted, _ = model._base_manager.filter(pk__in=ids).delete()
+        DeletionJob.objects.filter(pk=job.pk).update(step=step, deleted_count=F("deleted_count") + deleted)
+
+
+def run_deletion_job(job_id):
+    """
+    삭제 작업을 실행합니다. 각 단계는 남은 행을 다시 조회해 지우므로
+    중단된 작업을 처음부터 다시 실행해도 안전합니다.
+    """
+    job = DeletionJob.objects.filter(pk=job_id).exclude(status=DeletionJob.DeletionStatus.DONE.value).first()
+    if not job:
+        return
+    DeletionJob.objects.filter(pk=job.pk).update(status=DeletionJob.DeletionStatus.RUNNING.value, error="")
+    try:
+        for step, queryset in DELETION_PLANS[job.target](job.target_id):
+            _delete_in_batches(job, step, queryset)
+    except Exception as e:
+        logger.error(f"Deletion job {job.pk} ({job.target}:{job.target_id}) failed: {e}", exc_info=True)
+        DeletionJob.objects.filter(pk=job.pk).update(status=DeletionJob.DeletionStatus.FAILED.value, error=str(e))
+        return
+    DeletionJob.objects.filter(pk=job.pk).update(status=DeletionJob.DeletionStatus.DONE.value, step="")
+
+
+def _schedule(target, target_id):
+    job, _ = DeletionJob.objects.update_or_create(
+        target=target, target_id=target_id, defaults={"status": DeletionJob.DeletionStatus.PENDING.value}
+    )
+    enqueue(run_deletion_job, job.pk)
+    return job
+
+
+def delete_meetup_later(meetup):
+    """모임을 바로 숨기고(tombstone) 연관 데이터는 백그라운드에서 나눠 지웁니다."""
+    with transaction.atomic():
+        Meetup.objects.filter(pk=meetup.pk).update(deleted_at=timezone.now())
+        return _schedule(MEETUP_TARGET, meetup.pk)
+
+
+def delete_user_later(user):
+    """사용자와 사용자가 만든 모임을 바로 숨기고, 연관 데이터는 백그라운드에서 나눠 지웁니다."""
+    with transaction.atomic():
+        now = timezone.now()
+        User.objects.filter(pk=user.pk).update(deleted_at=now)
+        Meetup.objects.filter(organizer_id=user.pk).update(deleted_at=now)
+        return _schedule(USER_TARGET, user.pk)
+
+
+def resume_deletion_jobs():
+    """완료되지 않은 삭제 작업을 다시 실행합니다. (워커 재시작 등으로 중단된 작업)"""
+    job_ids = list(
+        DeletionJob.objects.exclude(status=DeletionJob.DeletionStatus.DONE.value).values_list("pk", flat=True)
+    )
+    for job_id in job_ids:
+        run_deletion_job(job_id)
+    return job_ids
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+from django.core.management.base import BaseCommand
+
+from placeholder.utils.images import (
+    IMAGE_DERIVATIVES,
+    generate_image_derivatives,
+    pending_images,
+)
+
+
+class Command(BaseCommand):
+    help = "Generate thumbnail/WebP derivatives for images that do not have them yet"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--limit", type=int, default=None, help="처리할 최대 원본 이미지 수")
+        parser.add_argument("--dry-run", action="store_true", help="파생 이미지를 만들지 않고 대상만 출력")
+
+    def handle(self, *args, **options):
+        images = pending_images()[: options["limit"]]
+        if options["dry_run"]:
+            for image in images:
+                self.stdout.write(image)
+            self.stdout.write(self.style.SUCCESS(f"{len(images)} image(s) need derivatives"))
+            return
+
+        failed = 0
+        for image in images:
+            if len(generate_image_derivatives(image)) < len(IMAGE_DERIVATIVES):
+                failed += 1
+                self.stderr.write(f"Failed to generate derivatives for {image}")
+        self.stdout.write(self.style.SUCCESS(f"Generated derivatives for {len(images) - failed} image(s)"))
+        if failed:
+            self.stdout.write(self.style.WARNING(f"{failed} image(s) failed"))
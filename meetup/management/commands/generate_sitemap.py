@@ -1,12 +1,69 @@
 # -*- coding: utf-8 -*-
+import hashlib
+import json
+import zlib
+from datetime import datetime, timedelta
 from io import BytesIO
-from xml.dom import minidom
-from xml.etree.ElementTree import Element, SubElement, tostring
+from itertools import groupby
+from tempfile import SpooledTemporaryFile
+from xml.sax.saxutils import escape
 
 from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Count, ExpressionWrapper, F, IntegerField, Max
 
 from meetup.models import Meetup
-from placeholder.utils.s3 import S3Service
+from placeholder.utils.storage import get_storage
+
+SITEMAP_XMLNS = "http://www.sitemaps.org/schemas/sitemap/0.9"
+# sitemap 프로토콜 제한: 파일 하나에 URL 50,000개(압축 전 50MB)까지
+MAX_URLS_PER_SITEMAP = 50000
+# 샤드 N은 id가 (N * SHARD_SPAN, (N + 1) * SHARD_SPAN] 인 모임을 담습니다.
+# 첫 샤드에는 홈페이지도 들어가므로 한 자리를 비워 둡니다.
+SHARD_SPAN = MAX_URLS_PER_SITEMAP - 1
+# gzip 압축기에 한 번에 넘기는 XML 크기
+COMPRESS_BATCH_SIZE = 64 * 1024
+# 증분 생성 상태(워터마크, 샤드별 URL 수/해시)를 저장하는 키
+MANIFEST_KEY = "sitemap-manifest.json"
+# 워터마크 직전에 수정됐지만 늦게 커밋된 모임을 놓치지 않도록 조금 앞에서부터 다시 확인합니다.
+WATERMARK_LOOKBACK = timedelta(minutes=5)
+# 증분 생성 시 해시 비교를 위해 샤드를 임시로 담아두는 메모리 한도 (넘으면 디스크 사용)
+SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
+
+def shard_key(shard):
+    return f"sitemap-{shard}.xml.gz"
+
+
+def shard_expression():
+    return ExpressionWrapper((F("id") - 1) / SHARD_SPAN, output_field=IntegerField())
+
+
+def url_entry(loc, lastmod=None, changefreq=None, priority=None):
+    lines = ["  <url>\n", f"    <loc>{escape(loc)}</loc>\n"]
+    if lastmod:
+        lines.append(f"    <lastmod>{lastmod}</lastmod>\n")
+    if changefreq:
+        lines.append(f"    <changefreq>{changefreq}</changefreq>\n")
+    if priority:
+        lines.append(f"    <priority>{priority}</priority>\n")
+    lines.append("  </url>\n")
+    return "".join(lines)
+
+
+def gzip_chunks(pieces, batch_size=COMPRESS_BATCH_SIZE):
+    """문자열 조각들을 gzip 스트림(bytes 조각)으로 압축합니다. mtime이 0이므로 같은 입력은 같은 출력을 냅니다."""
+    compressor = zlib.compressobj(9, zlib.DEFLATED, 31)
+    buffer = []
+    size = 0
+    for piece in pieces:
+        buffer.append(piece)
+        size += len(piece)
+        if size >= batch_size:
+            data = compressor.compress("".join(buffer).encode("utf-8"))
+            buffer, size = [], 0
+            if data:
+                yield data
+    yield compressor.compress("".join(buffer).encode("utf-8")) + compressor.flush()
 
 
 class Command(BaseCommand):
@@ -21,108 +78,251 @@ class Command(BaseCommand):
         )
         parser.add_argument("--bucket-name", type=str, default=None, help="S3 버킷 이름 (설정되지 않은 경우 기본값 사용)")
         parser.add_argument("--dry-run", action="store_true", help="실제 업로드 없이 sitemap만 생성하여 출력")
+        parser.add_argument("--chunk-size", type=int, default=2000, help="DB에서 한 번에 읽어올 모임 수 (기본값: 2000)")
+        parser.add_argument(
+            "--incremental",
+            action="store_true",
+            help="지난 실행 이후 바뀐 샤드만 다시 만들고, 내용이 같으면 업로드하지 않음",
+        )
 
     def handle(self, *args, **options):
         base_url = options["base_url"].rstrip("/")
         bucket_name = options["bucket_name"]
         dry_run = options["dry_run"]
+        chunk_size = options["chunk_size"]
+        incremental = options["incremental"]
 
         try:
-            # Sitemap XML 생성
-            sitemap_xml = self.generate_sitemap(base_url)
+            self.stdout.write("Generating sitemap...")
+            public_meetups = Meetup.objects.filter(is_public=True)
+            self.stdout.write(f"Found {public_meetups.count()} public meetups")
 
             if dry_run:
                 self.stdout.write("Generated sitemap:")
-                self.stdout.write(sitemap_xml)
+                for shard, rows in self.iter_shards(public_meetups, chunk_size):
+                    self.stdout.write("".join(self.shard_pieces(base_url, shard, rows, {})), ending="")
                 return
 
-            # S3에 업로드
-            self.upload_to_s3(sitemap_xml, bucket_name)
+            if incremental:
+                self.update_s3(base_url, public_meetups, chunk_size, bucket_name)
+            else:
+                self.upload_to_s3(base_url, public_meetups, chunk_size, bucket_name)
 
             self.stdout.write(self.style.SUCCESS("Successfully generated and uploaded sitemap to S3"))
 
         except Exception as e:
             raise CommandError(f"Error generating or uploading sitemap: {str(e)}")
 
-    def generate_sitemap(self, base_url):
-        """Sitemap XML을 생성합니다."""
-        self.stdout.write("Generating sitemap...")
-
-        # Root element 생성
-        urlset = Element("urlset")
-        urlset.set("xmlns", "http://www.sitemaps.org/schemas/sitemap/0.9")
-
-        # 홈페이지 추가
-        self.add_url(urlset, base_url, priority="1.0", changefreq="daily")
-
-        # 공개된 모임들 추가
-        public_meetups = Meetup.objects.filter(is_public=True).select_related("organizer")
-
-        self.stdout.write(f"Found {public_meetups.count()} public meetups")
-
-        for meetup in public_meetups:
-            meetup_url = f"{base_url}/ad/{meetup.id}"
-
-            # 모임의 마지막 수정 날짜 (updated_at이 있다면)
-            lastmod = None
-            if hasattr(meetup, "updated_at") and meetup.updated_at:
-                lastmod = meetup.updated_at.isoformat()
-            elif hasattr(meetup, "created_at") and meetup.created_at:
-                lastmod = meetup.created_at.isoformat()
-
-            self.add_url(urlset, meetup_url, lastmod=lastmod, priority="0.8", changefreq="weekly")
-
-        # XML을 예쁘게 포맷팅
-        rough_string = tostring(urlset, encoding="unicode")
-        reparsed = minidom.parseString(rough_string)
-        pretty_xml = reparsed.toprettyxml(indent="  ")
+    def iter_shards(self, queryset, chunk_size):
+        """
+        (샤드 번호, 해당 샤드의 (id, lastmod) 행 iterator)를 id 순서대로 내보냅니다.
+        모임은 한 번에 chunk_size개씩만 읽으므로 모임 수와 무관하게 메모리 사용량이 일정합니다.
+        홈페이지가 들어가는 첫 샤드는 모임이 없어도 항상 내보냅니다.
+        """
+        rows = queryset.order_by("id").values_list("id", "updated_at", "created_at").iterator(chunk_size=chunk_size)
+        first_shard_emitted = False
+        for shard, shard_rows in groupby(rows, key=lambda row: (row[0] - 1) // SHARD_SPAN):
+            if shard != 0 and not first_shard_emitted:
+                yield 0, iter(())
+            first_shard_emitted = True
+            yield shard, shard_rows
+        if not first_shard_emitted:
+            yield 0, iter(())
+
+    def shard_rows(self, queryset, shard, chunk_size):
+        """샤드 하나에 속한 모임의 행 iterator를 반환합니다."""
+        return (
+            queryset.filter(id__gt=shard * SHARD_SPAN, id__lte=(shard + 1) * SHARD_SPAN)
+            .order_by("id")
+            .values_list("id", "updated_at", "created_at")
+            .iterator(chunk_size=chunk_size)
+        )
 
-        # XML 선언부 정리 (minidom이 추가하는 불필요한 빈 줄 제거)
-        lines = pretty_xml.split("\n")
-        # 첫 번째 빈 줄 제거
-        if len(lines) > 1 and lines[1].strip() == "":
-            lines.pop(1)
+    def shard_pieces(self, base_url, shard, rows, stats):
+        """샤드 하나의 XML을 URL 단위 문자열 조각으로 내보내고, stats에 URL 수와 최신 lastmod를 기록합니다."""
+        count = 0
+        latest = None
+        yield '<?xml version="1.0" ?>\n'
+        yield f'<urlset xmlns="{SITEMAP_XMLNS}">\n'
+        if shard == 0:
+            yield url_entry(base_url, priority="1.0", changefreq="daily")
+        for meetup_id, updated_at, created_at in rows:
+            modified_at = updated_at or created_at
+            if modified_at and (latest is None or modified_at > latest):
+                latest = modified_at
+            count += 1
+            lastmod = modified_at.isoformat() if modified_at else None
+            yield url_entry(f"{base_url}/ad/{meetup_id}", lastmod=lastmod, priority="0.8", changefreq="weekly")
+        yield "</urlset>\n"
+        stats.update(count=count, lastmod=latest.isoformat() if latest else None)
+
+    def index_xml(self, base_url, shards):
+        """샤드 목록 [(샤드 번호, lastmod 문자열)]로 sitemap index XML을 만듭니다."""
+        lines = ['<?xml version="1.0" ?>\n', f'<sitemapindex xmlns="{SITEMAP_XMLNS}">\n']
+        for shard, lastmod in shards:
+            lines.append("  <sitemap>\n")
+            lines.append(f"    <loc>{escape(base_url)}/{shard_key(shard)}</loc>\n")
+            if lastmod:
+                lines.append(f"    <lastmod>{lastmod}</lastmod>\n")
+            lines.append("  </sitemap>\n")
+        lines.append("</sitemapindex>\n")
+        return "".join(lines)
+
+    def upload_to_s3(self, base_url, queryset, chunk_size, bucket_name=None):
+        """
+        샤드를 만드는 동시에 gzip으로 압축해 스트리밍 업로드하고, 마지막으로 sitemap index를 sitemap.xml로 올립니다.
+        """
+        self.stdout.write("Uploading sitemap to S3...")
 
-        return "\n".join(lines)
+        try:
+            storage = get_storage()
+            watermark = self.current_watermark()
+            shards = {}
+            for shard, rows in self.iter_shards(queryset, chunk_size):
+                stats = {}
+                result = storage.upload_stream(
+                    gzip_chunks(self.shard_pieces(base_url, shard, rows, stats)),
+                    key=shard_key(shard),
+                    content_type="application/gzip",
+                    bucket_name=bucket_name,
+                )
+                if not result:
+                    raise Exception(f"S3 upload of {shard_key(shard)} failed")
+                self.stdout.write(f"Uploaded {shard_key(shard)} ({stats['count']} meetups, {result.size} bytes)")
+                shards[shard] = {**stats, "sha256": result.sha256}
+
+            self.upload_index(storage, base_url, shards, bucket_name)
+            self.upload_manifest(storage, base_url, watermark, shards, bucket_name)
 
-    def add_url(self, urlset, url, lastmod=None, priority=None, changefreq=None):
-        """URL element를 sitemap에 추가합니다."""
-        url_elem = SubElement(urlset, "url")
+            self.stdout.write("Sitemap uploaded successfully to S3")
 
-        loc = SubElement(url_elem, "loc")
-        loc.text = url
+        except Exception as e:
+            self.stdout.write(self.style.ERROR(f"Failed to upload sitemap to S3: {str(e)}"))
+            raise
 
-        if lastmod:
-            lastmod_elem = SubElement(url_elem, "lastmod")
-            lastmod_elem.text = lastmod
+    def upload_index(self, storage, base_url, shards, bucket_name=None):
+        index_file = BytesIO(self.index_xml(base_url, [(n, shards[n]["lastmod"]) for n in sorted(shards)]).encode())
+        success = storage.upload_file(
+            file=index_file, key="sitemap.xml", content_type="application/xml", bucket_name=bucket_name
+        )
 
-        if changefreq:
-            changefreq_elem = SubElement(url_elem, "changefreq")
-            changefreq_elem.text = changefreq
+        if not success:
+            raise Exception("S3 upload returned False")
 
-        if priority:
-            priority_elem = SubElement(url_elem, "priority")
-            priority_elem.text = priority
+    def current_watermark(self):
+        """이번 실행이 반영하는 마지막 수정 시각입니다. 생성 전에 읽어 두므로 생성 중 수정은 다음 실행에 반영됩니다."""
+        return Meetup.objects.aggregate(watermark=Max("updated_at"))["watermark"]
 
-    def upload_to_s3(self, sitemap_xml, bucket_name=None):
-        """생성된 sitemap을 S3에 업로드합니다."""
+    def load_manifest(self, storage, base_url, bucket_name=None):
+        """이전 실행의 manifest를 읽습니다. 없거나 base URL이 다르면 None을 반환합니다."""
+        data = storage.read_file(MANIFEST_KEY, bucket_name=bucket_name)
+        if not data:
+            return None
+        try:
+            manifest = json.loads(data)
+        except ValueError:
+            return None
+        if manifest.get("base_url") != base_url:
+            return None
+        manifest["shards"] = {int(shard): info for shard, info in manifest.get("shards", {}).items()}
+        return manifest
+
+    def upload_manifest(self, storage, base_url, watermark, shards, bucket_name=None):
+        manifest = {
+            "base_url": base_url,
+            "watermark": watermark.isoformat() if watermark else None,
+            "shards": {str(shard): shards[shard] for shard in sorted(shards)},
+        }
+        success = storage.upload_file(
+            file=BytesIO(json.dumps(manifest).encode("utf-8")),
+            key=MANIFEST_KEY,
+            content_type="application/json",
+            bucket_name=bucket_name,
+        )
+        if not success:
+            raise Exception("S3 upload of sitemap manifest failed")
+
+    def dirty_shards(self, queryset, manifest):
+        """
+        다시 만들어야 하는 샤드와 현재 샤드별 공개 모임 수를 반환합니다.
+        워터마크 이후 수정된 모임이 있는 샤드(공개 여부와 무관)와, 공개 모임 수가 바뀐 샤드
+        (삭제되거나 update()로 비공개 전환된 경우)가 대상입니다.
+        """
+        counts = dict(
+            queryset.order_by()
+            .annotate(shard=shard_expression())
+            .values("shard")
+            .annotate(count=Count("id"))
+            .values_list("shard", "count")
+        )
+        counts.setdefault(0, 0)
+
+        dirty = {
+            shard
+            for shard in counts.keys() | manifest["shards"].keys()
+            if manifest["shards"].get(shard, {}).get("count") != counts.get(shard)
+        }
+        if manifest.get("watermark"):
+            since = datetime.fromisoformat(manifest["watermark"]) - WATERMARK_LOOKBACK
+            changed = Meetup.objects.filter(updated_at__gt=since).annotate(shard=shard_expression())
+            dirty |= set(changed.order_by().values_list("shard", flat=True).distinct())
+        else:
+            dirty |= counts.keys()
+        return dirty, counts
+
+    def build_shard(self, base_url, shard, rows):
+        """샤드를 gzip으로 압축해 임시 파일에 쓰고 (파일, sha256, stats)를 반환합니다."""
+        stats = {}
+        sha256 = hashlib.sha256()
+        spool = SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+        for chunk in gzip_chunks(self.shard_pieces(base_url, shard, rows, stats)):
+            spool.write(chunk)
+            sha256.update(chunk)
+        spool.seek(0)
+        return spool, sha256.hexdigest(), stats
+
+    def update_s3(self, base_url, queryset, chunk_size, bucket_name=None):
+        """
+        이전 manifest와 비교해 바뀐 샤드만 다시 만들고, 내용 해시가 같으면 업로드를 건너뜁니다.
+        manifest는 샤드와 index를 모두 올린 뒤 마지막에 갱신하므로 중간에 실패하면 다음 실행이 같은 작업을 다시 합니다.
+        """
         self.stdout.write("Uploading sitemap to S3...")
 
         try:
-            s3_service = S3Service(bucket_name=bucket_name)
-
-            # XML 문자열을 bytes로 변환
-            sitemap_bytes = sitemap_xml.encode("utf-8")
-
-            # BytesIO 객체 생성
-            sitemap_file = BytesIO(sitemap_bytes)
-
-            # S3에 업로드 (sitemap.xml로 저장)
-            success = s3_service.upload_file(file=sitemap_file, key="sitemap.xml", content_type="application/xml")
-
-            if not success:
-                raise Exception("S3 upload returned False")
-
+            storage = get_storage()
+            manifest = self.load_manifest(storage, base_url, bucket_name)
+            if manifest is None:
+                self.stdout.write("No sitemap manifest found, regenerating all shards")
+                manifest = {"watermark": None, "shards": {}}
+
+            watermark = self.current_watermark()
+            dirty, counts = self.dirty_shards(queryset, manifest)
+            shards = {shard: info for shard, info in manifest["shards"].items() if shard in counts}
+            uploaded = 0
+
+            for shard in sorted(dirty & counts.keys()):
+                spool, sha256, stats = self.build_shard(base_url, shard, self.shard_rows(queryset, shard, chunk_size))
+                with spool:
+                    if shards.get(shard, {}).get("sha256") != sha256:
+                        success = storage.upload_file(
+                            file=spool, key=shard_key(shard), content_type="application/gzip", bucket_name=bucket_name
+                        )
+                        if not success:
+                            raise Exception(f"S3 upload of {shard_key(shard)} failed")
+                        uploaded += 1
+                        self.stdout.write(f"Uploaded {shard_key(shard)} ({stats['count']} meetups)")
+                shards[shard] = {**stats, "sha256": sha256}
+
+            for shard in sorted(manifest["shards"].keys() - counts.keys()):
+                storage.delete_file(shard_key(shard), bucket_name=bucket_name)
+                self.stdout.write(f"Deleted {shard_key(shard)}")
+
+            previous_index = {shard: info.get("lastmod") for shard, info in manifest["shards"].items()}
+            if {shard: info["lastmod"] for shard, info in shards.items()} != previous_index:
+                self.upload_index(storage, base_url, shards, bucket_name)
+            self.upload_manifest(storage, base_url, watermark, shards, bucket_name)
+
+            self.stdout.write(f"Checked {len(dirty)} shard(s), uploaded {uploaded}")
             self.stdout.write("Sitemap uploaded successfully to S3")
 
         except Exception as e:
@@ -0,0 +1,12 @@
+# -*- coding: utf-8 -*-
+from django.core.management.base import BaseCommand
+
+from meetup.deletion import resume_deletion_jobs
+
+
+class Command(BaseCommand):
+    help = "Resume unfinished background deletion jobs (tombstoned meetups and users)"
+
+    def handle(self, *args, **options):
+        job_ids = resume_deletion_jobs()
+        self.stdout.write(self.style.SUCCESS(f"Processed {len(job_ids)} deletion job(s)"))
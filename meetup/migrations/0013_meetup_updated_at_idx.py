@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 5.2.2 on 2026-10-19 11:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("meetup", "0012_alter_meetup_image_alter_schedule_image"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="meetup",
+            index=models.Index(fields=["updated_at"], name="meetup_updated_at_idx"),
+        ),
+    ]
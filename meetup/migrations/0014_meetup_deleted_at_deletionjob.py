@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 5.2.2 on 2026-10-19 12:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("meetup", "0013_meetup_updated_at_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="meetup",
+            name="deleted_at",
+            field=models.DateTimeField(blank=True, default=None, null=True, verbose_name="삭제 요청 시각"),
+        ),
+        migrations.CreateModel(
+            name="DeletionJob",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("target", models.CharField(max_length=32, verbose_name="대상 모델")),
+                ("target_id", models.PositiveBigIntegerField(verbose_name="대상 ID")),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[("pending", "대기"), ("running", "진행 중"), ("done", "완료"), ("failed", "실패")],
+                        default="pending",
+                        max_length=16,
+                        verbose_name="상태",
+                    ),
+                ),
+                ("step", models.CharField(blank=True, default="", max_length=64, verbose_name="진행 단계")),
+                ("deleted_count", models.PositiveBigIntegerField(default=0, verbose_name="삭제한 행 수")),
+                ("error", models.TextField(blank=True, default="", verbose_name="오류")),
+            ],
+            options={
+                "indexes": [models.Index(fields=["status"], name="deletion_job_status_idx")],
+                "constraints": [
+                    models.UniqueConstraint(fields=("target", "target_id"), name="unique_deletion_job_target")
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 5.2.2 on 2026-10-19 12:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("meetup", "0014_meetup_deleted_at_deletionjob"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="proposal",
+            index=models.Index(fields=["meetup", "status", "created_at"], name="proposal_inbox_idx"),
+        ),
+    ]
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 5.2.2 on 2026-10-19 13:40
+
+from django.db import migrations, models
+
+from placeholder.utils.geo import cell_for, parse_coordinates
+
+
+def fill_coordinates(apps, schema_editor):
+    Schedule = apps.get_model("meetup", "Schedule")
+    batch = []
+    for schedule in Schedule.objects.only("id", "latitude", "longitude").iterator(chunk_size=1000):
+        schedule.lat, schedule.lng = parse_coordinates(schedule.latitude, schedule.longitude)
+        schedule.geo_cell = cell_for(schedule.lat, schedule.lng)
+        batch.append(schedule)
+        if len(batch) >= 1000:
+            Schedule.objects.bulk_update(batch, ["lat", "lng", "geo_cell"])
+            batch = []
+    if batch:
+        Schedule.objects.bulk_update(batch, ["lat", "lng", "geo_cell"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("meetup", "0015_proposal_inbox_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="schedule",
+            name="lat",
+            field=models.FloatField(blank=True, default=None, null=True, verbose_name="위도(숫자)"),
+        ),
+        migrations.AddField(
+            model_name="schedule",
+            name="lng",
+            field=models.FloatField(blank=True, default=None, null=True, verbose_name="경도(숫자)"),
+        ),
+        migrations.AddField(
+            model_name="schedule",
+            name="geo_cell",
+            field=models.BigIntegerField(blank=True, default=None, null=True, verbose_name="격자 칸"),
+        ),
+        migrations.RunPython(fill_coordinates, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="schedule",
+            index=models.Index(fields=["geo_cell"], name="schedule_geo_cell_idx"),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 5.2.2 on 2026-10-19 14:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("meetup", "0016_schedule_geo"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="schedule",
+            index=models.Index(fields=["meetup", "scheduled_at"], name="schedule_meetup_date_idx"),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 5.2.2 on 2026-10-19 12:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("meetup", "0017_schedule_meetup_date_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="meetup",
+            name="derived_image",
+            field=models.CharField(blank=True, default="", null=True, verbose_name="파생 이미지 원본"),
+        ),
+        migrations.AddField(
+            model_name="schedule",
+            name="derived_image",
+            field=models.CharField(blank=True, default="", null=True, verbose_name="파생 이미지 원본"),
+        ),
+    ]
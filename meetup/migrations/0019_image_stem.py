@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 5.2.2 on 2026-10-19 12:59
+
+from django.db import migrations, models
+
+from placeholder.utils.images import image_stem
+
+
+def fill_image_stems(apps, schema_editor):
+    for name in ("Meetup", "Schedule"):
+        model = apps.get_model("meetup", name)
+        rows = model._base_manager.exclude(image__isnull=True).exclude(image="").only("id", "image")
+        batch = []
+        for row in rows.iterator(chunk_size=1000):
+            row.image_stem = image_stem(row.image)
+            batch.append(row)
+            if len(batch) >= 1000:
+                model._base_manager.bulk_update(batch, ["image_stem"])
+                batch = []
+        if batch:
+            model._base_manager.bulk_update(batch, ["image_stem"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("meetup", "0018_derived_image"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="meetup",
+            name="image_stem",
+            field=models.CharField(blank=True, default="", verbose_name="이미지 키"),
+        ),
+        migrations.AddField(
+            model_name="schedule",
+            name="image_stem",
+            field=models.CharField(blank=True, default="", verbose_name="이미지 키"),
+        ),
+        migrations.AddIndex(
+            model_name="meetup",
+            index=models.Index(fields=["image_stem"], name="meetup_image_stem_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="schedule",
+            index=models.Index(fields=["image_stem"], name="schedule_image_stem_idx"),
+        ),
+        migrations.RunPython(fill_image_stems, migrations.RunPython.noop),
+    ]
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 from meetup.models.comment import MeetupComment, ScheduleComment
+from meetup.models.deletion import DeletionJob
 from meetup.models.meetup import Meetup, MeetupLike
 from meetup.models.member import Member
 from meetup.models.proposal import Proposal
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+from django.db import models
+
+from placeholder.models.base import BaseModel
+from placeholder.utils.enums import StrEnum
+
+
+class DeletionJob(BaseModel):
+    """tombstone 처리된 모임/사용자의 연관 데이터를 나눠 지우는 작업과 진행 상황입니다."""
+
+    class DeletionStatus(StrEnum):
+        PENDING = "pending", "대기"
+        RUNNING = "running", "진행 중"
+        DONE = "done", "완료"
+        FAILED = "failed", "실패"
+
+    target = models.CharField(verbose_name="대상 모델", max_length=32)
+    target_id = models.PositiveBigIntegerField(verbose_name="대상 ID")
+    status = models.CharField(
+        verbose_name="상태", choices=DeletionStatus.choices(), default=DeletionStatus.PENDING.value, max_length=16
+    )
+    step = models.CharField(verbose_name="진행 단계", max_length=64, blank=True, default="")
+    deleted_count = models.PositiveBigIntegerField(verbose_name="삭제한 행 수", default=0)
+    error = models.TextField(verbose_name="오류", blank=True, default="")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(name="unique_deletion_job_target", fields=["target", "target_id"]),
+        ]
+        indexes = [models.Index(fields=["status"], name="deletion_job_status_idx")]
@@ -2,15 +2,26 @@
 from django.db import models
 
 from placeholder.models.base import BaseModel
+from placeholder.utils.images import image_stem
 from user.models.user import User
 
 
+class MeetupManager(models.Manager):
+    def get_queryset(self):
+        # 삭제 대기(tombstone) 중인 모임은 모든 조회에서 제외합니다.
+        return super().get_queryset().filter(deleted_at__isnull=True)
+
+
 class Meetup(BaseModel):
     name = models.CharField(max_length=255)
     description = models.TextField()
     place = models.CharField(max_length=255)
     place_description = models.TextField()
     image = models.CharField(verbose_name="이미지", null=True, blank=True, default="")
+    # 썸네일/WebP 파생 이미지를 만든 원본 image 값 (image와 같을 때만 파생 이미지 URL을 내려줍니다)
+    derived_image = models.CharField(verbose_name="파생 이미지 원본", null=True, blank=True, default="")
+    # 보호된 미디어 권한 확인용 원본 이미지 키 (확장자 제외). image에서 저장 시 계산합니다.
+    image_stem = models.CharField(verbose_name="이미지 키", blank=True, default="")
     started_at = models.DateField(null=True, default=None)
     ended_at = models.DateField(null=True, default=None)
     ad_title = models.CharField(max_length=255)
@@ -19,10 +30,28 @@ class Meetup(BaseModel):
     category = models.CharField(max_length=255, null=True, blank=True, default=None)
     organizer = models.ForeignKey(User, on_delete=models.CASCADE, related_name="organized_meetups")
     like_count = models.PositiveIntegerField(blank=True, default=0)
+    deleted_at = models.DateTimeField(verbose_name="삭제 요청 시각", null=True, blank=True, default=None)
+
+    objects = MeetupManager()
+    all_objects = models.Manager()
+
+    class Meta:
+        # sitemap 증분 생성 시 워터마크 이후 수정된 모임을 찾습니다.
+        indexes = [
+            models.Index(fields=["updated_at"], name="meetup_updated_at_idx"),
+            models.Index(fields=["image_stem"], name="meetup_image_stem_idx"),
+        ]
 
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        self.image_stem = image_stem(self.image)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "image" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "image_stem"}
+        return super().save(*args, **kwargs)
+
 
 class MeetupLike(BaseModel):
     user = models.ForeignKey(User, on_delete=models.CASCADE)
@@ -14,6 +14,13 @@ class Proposal(BaseModel):
         REFUSE = "refuse", "거절"
         IGNORE = "ignore", "무시"
 
+    # 목표 상태별로 전이할 수 있는 현재 상태. 수락/거절된 신청은 다시 바꾸지 않습니다.
+    TRANSITIONS = {
+        ProposalStatus.ACCEPTANCE.value: (ProposalStatus.PENDING.value, ProposalStatus.IGNORE.value),
+        ProposalStatus.REFUSE.value: (ProposalStatus.PENDING.value, ProposalStatus.IGNORE.value),
+        ProposalStatus.IGNORE.value: (ProposalStatus.PENDING.value,),
+    }
+
     user = models.ForeignKey(User, on_delete=models.CASCADE, verbose_name="회원")
     meetup = models.ForeignKey(Meetup, on_delete=models.CASCADE, verbose_name="모임")
     text = models.CharField(verbose_name="내용", blank=True, default="")
@@ -29,3 +36,5 @@ class Proposal(BaseModel):
                 fields=["user", "meetup"],
             ),
         ]
+        # 모임장 신청함: 모임별 상태 집계와 (status, created_at, id) keyset 페이지네이션
+        indexes = [models.Index(fields=["meetup", "status", "created_at"], name="proposal_inbox_idx")]
@@ -3,6 +3,8 @@ from django.db import models
 
 from meetup.models.meetup import Meetup
 from placeholder.models.base import BaseModel
+from placeholder.utils.geo import cell_for, parse_coordinates
+from placeholder.utils.images import image_stem
 from user.models.user import User
 
 
@@ -16,3 +18,30 @@ class Schedule(BaseModel):
     longitude = models.CharField(max_length=50, verbose_name="경도")
     memo = models.CharField(max_length=50, verbose_name="메모")
     image = models.CharField(verbose_name="이미지", null=True, blank=True, default="")
+    # 썸네일/WebP 파생 이미지를 만든 원본 image 값 (image와 같을 때만 파생 이미지 URL을 내려줍니다)
+    derived_image = models.CharField(verbose_name="파생 이미지 원본", null=True, blank=True, default="")
+    # 보호된 미디어 권한 확인용 원본 이미지 키 (확장자 제외). image에서 저장 시 계산합니다.
+    image_stem = models.CharField(verbose_name="이미지 키", blank=True, default="")
+    # 위치 검색용 숫자 좌표와 격자 칸 번호. latitude/longitude 문자열에서 저장 시 계산합니다.
+    lat = models.FloatField(verbose_name="위도(숫자)", null=True, blank=True, default=None)
+    lng = models.FloatField(verbose_name="경도(숫자)", null=True, blank=True, default=None)
+    geo_cell = models.BigIntegerField(verbose_name="격자 칸", null=True, blank=True, default=None)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["geo_cell"], name="schedule_geo_cell_idx"),
+            # 캘린더: 사용자가 속한 모임들의 기간별 일정
+            models.Index(fields=["meetup", "scheduled_at"], name="schedule_meetup_date_idx"),
+            models.Index(fields=["image_stem"], name="schedule_image_stem_idx"),
+        ]
+
+    def save(self, *args, **kwargs):
+        self.lat, self.lng = parse_coordinates(self.latitude, self.longitude)
+        self.geo_cell = cell_for(self.lat, self.lng)
+        self.image_stem = image_stem(self.image)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and {"latitude", "longitude"} & set(update_fields):
+            kwargs["update_fields"] = {*update_fields, "lat", "lng", "geo_cell"}
+        if update_fields is not None and "image" in update_fields:
+            kwargs["update_fields"] = {*kwargs["update_fields"], "image_stem"}
+        return super().save(*args, **kwargs)
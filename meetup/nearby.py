@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+import math
+
+from django.conf import settings
+from django.db.models import ExpressionWrapper, F, FloatField, Q
+from django.utils import timezone
+
+from meetup.models import Meetup, Schedule
+from placeholder.utils.geo import bounding_box, cell_ranges, haversine_km
+
+
+def _candidates(min_lat, max_lat, min_lng, max_lng):
+    """격자 칸 범위(인덱스)로 후보를 먼저 거르고, 숫자 좌표로 사각형 밖의 행을 뺍니다."""
+    cells = Q()
+    for start, end in cell_ranges(min_lat, max_lat, min_lng, max_lng):
+        cells |= Q(geo_cell__range=(start, end))
+    return (
+        Schedule.objects.filter(cells)
+        .filter(
+            lat__range=(min_lat, max_lat),
+            lng__range=(min_lng, max_lng),
+            # 지도에는 공개 모임의 예정된 일정만 보여줍니다.
+            meetup__is_public=True,
+            meetup__deleted_at__isnull=True,
+            scheduled_at__gte=timezone.now(),
+        )
+        .only("id", "meetup_id", "scheduled_at", "place", "address", "lat", "lng")
+        .order_by()
+    )
+
+
+def _with_meetups(schedules):
+    meetups = {}
+    for schedule in schedules:
+        summary = meetups.setdefault(schedule.meetup_id, {"schedule_count": 0, "distance": schedule.distance})
+        summary["schedule_count"] += 1
+        if schedule.distance is not None and (summary["distance"] is None or schedule.distance < summary["distance"]):
+            summary["distance"] = schedule.distance
+    rows = Meetup.objects.filter(id__in=meetups).only("id", "name", "ad_title")
+    result = [
+        {"id": meetup.id, "name": meetup.name, "ad_title": meetup.ad_title, **meetups[meetup.id]} for meetup in rows
+    ]
+    result.sort(key=lambda meetup: (meetup["distance"] is None, meetup["distance"] or 0, meetup["id"]))
+    return {"result": schedules, "meetups": result}
+
+
+def find_nearby(lat, lng, radius_km):
+    """중심에서 radius_km 안의 일정과 그 일정이 있는 모임을 가까운 순으로 반환합니다."""
+    # 후보는 평면 근사 거리(경도 차에 cos(위도)를 곱한 값의 제곱합) 순으로 GEO_NEARBY_MAX_CANDIDATES개까지만 가져옵니다.
+    cos_lat = math.cos(math.radians(lat))
+    delta_lat, delta_lng = F("lat") - lat, (F("lng") - lng) * cos_lat
+    candidates = (
+        _candidates(*bounding_box(lat, lng, radius_km))
+        .annotate(
+            approx_distance=ExpressionWrapper(delta_lat * delta_lat + delta_lng * delta_lng, output_field=FloatField())
+        )
+        .order_by("approx_distance", "id")
+    )
+    schedules = list(candidates[: settings.GEO_NEARBY_MAX_CANDIDATES])
+    # 사각형 후보를 실제 거리로 다시 거릅니다.
+    for schedule, distance in zip(schedules, haversine_km(lat, lng, [(s.lat, s.lng) for s in schedules])):
+        schedule.distance = round(distance, 3)
+    schedules = sorted((s for s in schedules if s.distance <= radius_km), key=lambda s: (s.distance, s.id))
+    return _with_meetups(schedules[: settings.GEO_NEARBY_MAX_RESULTS])
+
+
+def find_in_viewport(min_lat, max_lat, min_lng, max_lng):
+    """지도 화면(사각형) 안의 일정과 모임을 반환합니다."""
+    candidates = _candidates(min_lat, max_lat, min_lng, max_lng).order_by("scheduled_at", "id")
+    schedules = list(candidates[: settings.GEO_NEARBY_MAX_RESULTS])
+    for schedule in schedules:
+        schedule.distance = None
+    return _with_meetups(schedules)
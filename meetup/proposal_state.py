@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+from django.db import connections, router, transaction
+from django.utils import timezone
+
+from meetup.models import Meetup, Proposal
+from meetup.relationships import invalidate_relationships
+from placeholder.utils.exceptions import (
+    ForbiddenException,
+    InvalidProposalStatusException,
+    NotFoundException,
+)
+
+
+def _connection():
+    return connections[router.db_for_write(Proposal)]
+
+
+def _returning(connection):
+    fields = Proposal._meta.concrete_fields
+    return ", ".join(connection.ops.quote_name(field.column) for field in fields)
+
+
+def _execute(connection, sql, params):
+    """RETURNING 결과를 ORM과 같은 변환(db converter)을 거쳐 Proposal 인스턴스로 만듭니다."""
+    fields = Proposal._meta.concrete_fields
+    columns = [field.get_col(Proposal._meta.db_table) for field in fields]
+    converters = [connection.ops.get_db_converters(col) + col.get_db_converters(connection) for col in columns]
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+
+    proposals = []
+    for row in rows:
+        values = []
+        for value, col, column_converters in zip(row, columns, converters):
+            for converter in column_converters:
+                value = converter(value, col, connection)
+            values.append(value)
+        proposals.append(Proposal.from_db(connection.alias, [field.attname for field in fields], values))
+    return proposals
+
+
+def _invalidate(proposals):
+    # 직접 실행한 SQL은 signal을 보내지 않으므로 관계 캐시를 여기서 비웁니다.
+    if proposals:
+        pairs = [(proposal.user_id, proposal.meetup_id) for proposal in proposals]
+        transaction.on_commit(lambda: invalidate_relationships(*pairs), using=proposals[0]._state.db)
+
+
+def _placeholders(values):
+    return ", ".join(["%s"] * len(values))
+
+
+def transition_many(proposal_ids, organizer_id, status, allowed=None):
+    """
+    모임장이 처리할 수 있고 현재 상태가 allowed에 속한 신청서만 status로 바꾸고, 바뀐 신청서를 반환합니다.
+    allowed를 주지 않으면 Proposal.TRANSITIONS를 따릅니다.
+    UPDATE ... WHERE 조건으로 한 번에 처리하므로 행을 읽고 쓰는 사이에 다른 요청이 끼어들 틈이 없습니다.
+    """
+    if allowed is None:
+        allowed = Proposal.TRANSITIONS[status]
+    proposal_ids = list(proposal_ids)
+    if not proposal_ids:
+        return []
+    connection = _connection()
+    qn = connection.ops.quote_name
+    sql = (
+        f"UPDATE {qn(Proposal._meta.db_table)} SET {qn('status')} = %s, {qn('updated_at')} = %s "
+        f"WHERE {qn('id')} IN ({_placeholders(proposal_ids)}) AND {qn('status')} IN ({_placeholders(allowed)}) "
+        f"AND {qn('meetup_id')} IN (SELECT {qn('id')} FROM {qn(Meetup._meta.db_table)} "
+        f"WHERE {qn('organizer_id')} = %s AND {qn('deleted_at')} IS NULL) "
+        f"RETURNING {_returning(connection)}"
+    )
+    now = connection.ops.adapt_datetimefield_value(timezone.now())
+    proposals = _execute(connection, sql, [status, now, *proposal_ids, *allowed, organizer_id])
+    _invalidate(proposals)
+    return proposals
+
+
+def explain_failures(proposal_ids, organizer_id):
+    """전이되지 않은 신청서마다 이유(not_found/forbidden/invalid_status)를 돌려줍니다."""
+    rows = {
+        row["id"]: row
+        for row in Proposal.objects.using(_connection().alias)
+        .filter(id__in=proposal_ids, meetup__deleted_at__isnull=True)
+        .values("id", "status", "meetup__organizer_id")
+    }
+    reasons = {}
+    for proposal_id in proposal_ids:
+        row = rows.get(proposal_id)
+        if not row:
+            reasons[proposal_id] = "not_found"
+        elif row["meetup__organizer_id"] != organizer_id:
+            reasons[proposal_id] = "forbidden"
+        else:
+            reasons[proposal_id] = "invalid_status"
+    return reasons
+
+
+def transition(proposal_id, organizer_id, status, allowed=None):
+    """신청서 하나의 상태를 바꿉니다. 실패한 경우에만 이유를 확인하려고 한 번 더 조회합니다."""
+    proposals = transition_many([proposal_id], organizer_id, status, allowed)
+    if proposals:
+        return proposals[0]
+    reason = explain_failures([proposal_id], organizer_id)[proposal_id]
+    if reason == "not_found":
+        raise NotFoundException("존재 하지 않은 신청 입니다.")
+    if reason == "forbidden":
+        raise ForbiddenException()
+    raise InvalidProposalStatusException()
+
+
+def create_proposal(user_id, meetup_id, text):
+    """
+    신청서를 만듭니다. 이미 신청한 경우 unique 제약에 걸려도 오류 없이 None을 반환합니다.
+    (INSERT ... ON CONFLICT DO NOTHING RETURNING)
+    """
+    connection = _connection()
+    qn = connection.ops.quote_name
+    now = connection.ops.adapt_datetimefield_value(timezone.now())
+    values = {
+        "user_id": user_id,
+        "meetup_id": meetup_id,
+        "text": text,
+        "status": Proposal.ProposalStatus.PENDING.value,
+        "is_hide_to_proposer": False,
+        "created_at": now,
+        "updated_at": now,
+    }
+    sql = (
+        f"INSERT INTO {qn(Proposal._meta.db_table)} ({', '.join(qn(column) for column in values)}) "
+        f"VALUES ({_placeholders(values)}) "
+        f"ON CONFLICT ({qn('user_id')}, {qn('meetup_id')}) DO NOTHING "
+        f"RETURNING {_returning(connection)}"
+    )
+    proposals = _execute(connection, sql, list(values.values()))
+    _invalidate(proposals)
+    return proposals[0] if proposals else None
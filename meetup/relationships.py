@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+from django.conf import settings
+from django.core.cache import cache
+
+from meetup.models import Meetup, MeetupLike, Member, Proposal
+
+
+def _cache_key(user_id, meetup_id):
+    return f"meetup:relationship:{user_id}:{meetup_id}"
+
+
+def _load(user_id, meetup_ids):
+    """모임 수와 관계없이 Meetup/Member/Proposal/MeetupLike 네 번의 조회로 관계를 만듭니다."""
+    organizers = dict(Meetup.objects.filter(id__in=meetup_ids).values_list("id", "organizer_id"))
+    if not organizers:
+        return {}
+    meetup_ids = list(organizers)
+    # 아래 조회도 삭제 처리 중인 모임과의 관계는 제외합니다.
+    alive = {"user_id": user_id, "meetup_id__in": meetup_ids, "meetup__deleted_at__isnull": True}
+    roles = dict(Member.objects.filter(**alive).values_list("meetup_id", "role"))
+    statuses = dict(Proposal.objects.filter(**alive).values_list("meetup_id", "status"))
+    likes = set(MeetupLike.objects.filter(**alive).values_list("meetup_id", flat=True))
+    return {
+        meetup_id: {
+            "meetup_id": meetup_id,
+            "is_member": meetup_id in roles,
+            "role": roles.get(meetup_id),
+            "proposal_status": statuses.get(meetup_id),
+            "is_like": meetup_id in likes,
+            "is_organizer": organizer_id == user_id,
+        }
+        for meetup_id, organizer_id in organizers.items()
+    }
+
+
+def get_relationships(user, meetup_ids):
+    """
+    여러 모임에 대한 사용자의 관계(모임원/역할/신청 상태/좋아요/모임장 여부)를 요청 순서대로 반환합니다.
+    모임별로 캐시하고 캐시에 없는 모임만 한꺼번에 조회합니다. 없는 모임은 결과에서 빠집니다.
+    """
+    meetup_ids = list(dict.fromkeys(meetup_ids))
+    keys = {meetup_id: _cache_key(user.pk, meetup_id) for meetup_id in meetup_ids}
+    cached = cache.get_many(keys.values())
+    relationships = {meetup_id: cached[key] for meetup_id, key in keys.items() if key in cached}
+
+    missing = [meetup_id for meetup_id in meetup_ids if meetup_id not in relationships]
+    if missing:
+        loaded = _load(user.pk, missing)
+        cache.set_many(
+            {keys[meetup_id]: relationship for meetup_id, relationship in loaded.items()},
+            timeout=settings.MEETUP_RELATIONSHIP_CACHE_SECONDS,
+        )
+        relationships.update(loaded)
+    return [relationships[meetup_id] for meetup_id in meetup_ids if meetup_id in relationships]
+
+
+def invalidate_relationships(*pairs):
+    """(user_id, meetup_id) 쌍의 캐시를 지웁니다. 모임원/신청/좋아요가 바뀌면 호출합니다."""
+    cache.delete_many([_cache_key(user_id, meetup_id) for user_id, meetup_id in pairs])
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Q
+
+from meetup.models import Member
+from meetup.schemas.member import MemberListSchema
+from placeholder.pagination import decode_cursor, encode_cursor
+from placeholder.utils.exceptions import InvalidCursorException
+from placeholder.utils.projection import project_queryset
+
+
+def _version_key(meetup_id):
+    return f"meetup:roster:{meetup_id}:version"
+
+
+def _roster_version(meetup_id):
+    key = _version_key(meetup_id)
+    version = cache.get(key)
+    if version is None:
+        version = time.time_ns()
+        cache.add(key, version, timeout=None)
+        version = cache.get(key, version)
+    return version
+
+
+def invalidate_roster(*meetup_ids):
+    """모임원 가입/탈퇴 시 호출합니다. 버전을 바꿔 해당 모임의 캐시된 모든 페이지를 무효화합니다."""
+    cache.set_many({_version_key(meetup_id): time.time_ns() for meetup_id in meetup_ids}, timeout=None)
+
+
+def _roster_queryset(meetup_id):
+    # 탈퇴 처리 중인 사용자는 명단에서 뺍니다.
+    return Member.objects.filter(meetup_id=meetup_id, meetup__deleted_at__isnull=True, user__deleted_at__isnull=True)
+
+
+def _cursor_filter(cursor):
+    # (role DESC, id ASC) 순서에서 커서 다음 행들. 모임장(organizer)이 먼저 옵니다.
+    last_role, last_id = decode_cursor(cursor, 2)
+    if not isinstance(last_role, str) or not isinstance(last_id, int):
+        raise InvalidCursorException()
+    return Q(role__lt=last_role) | Q(role=last_role, id__gt=last_id)
+
+
+def _build_page(meetup_id, cursor, size):
+    members = _roster_queryset(meetup_id)
+    counts = dict(members.order_by().values("role").annotate(count=Count("id")).values_list("role", "count"))
+
+    # 프로필 컬럼은 select_related로 같은 쿼리에서 읽습니다.
+    page = project_queryset(members, MemberListSchema)
+    if cursor:
+        page = page.filter(_cursor_filter(cursor))
+    page = list(page.order_by("-role", "id")[: size + 1])
+
+    next_cursor = None
+    if len(page) > size:
+        page = page[:size]
+        next_cursor = encode_cursor([page[-1].role, page[-1].id])
+    return {"counts": counts, "total": sum(counts.values()), "result": page, "next": next_cursor}
+
+
+def get_roster_page(meetup_id, cursor=None, size=20):
+    """
+    모임원 명단 한 페이지와 역할별 인원 수를 반환합니다.
+    페이지는 모임별 버전 키와 함께 캐시하며, 모임원이 바뀌면 invalidate_roster로 버전을 올립니다.
+    """
+    key = f"meetup:roster:{meetup_id}:{_roster_version(meetup_id)}:{cursor or ''}:{size}"
+    page = cache.get(key)
+    if page is None:
+        page = _build_page(meetup_id, cursor, size)
+        cache.set(key, page, timeout=settings.MEETUP_ROSTER_CACHE_SECONDS)
+    return page
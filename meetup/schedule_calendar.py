@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+import hashlib
+import secrets
+from datetime import datetime, time, timedelta
+from datetime import timezone as dt_timezone
+
+from django.conf import settings
+from django.db.models import Count, F, Max, Sum
+from django.http import Http404, StreamingHttpResponse
+from django.utils import timezone
+from django.views.decorators.http import condition, require_GET
+
+from meetup.models import Member, Schedule
+from placeholder.utils.exceptions import InvalidDateRangeException
+from user.models.user import User
+
+
+def user_schedules(user_id):
+    """사용자가 속한 모든 모임의 일정. (meetup_id, scheduled_at) 인덱스로 모임별 기간 조회를 합니다."""
+    return Schedule.objects.filter(meetup__member__user_id=user_id, meetup__deleted_at__isnull=True)
+
+
+def get_calendar(user, start, end):
+    """start~end(날짜, 양 끝 포함) 사이의 내 일정을 모든 모임에서 한 번의 쿼리로 가져옵니다."""
+    if end < start or (end - start).days >= settings.CALENDAR_MAX_RANGE_DAYS:
+        raise InvalidDateRangeException()
+    start_at = timezone.make_aware(datetime.combine(start, time.min))
+    end_at = timezone.make_aware(datetime.combine(end + timedelta(days=1), time.min))
+    return (
+        user_schedules(user.pk)
+        .filter(scheduled_at__gte=start_at, scheduled_at__lt=end_at)
+        .annotate(meetup_name=F("meetup__name"))
+        .only("id", "meetup_id", "scheduled_at", "place", "address", "memo")
+        .order_by("scheduled_at", "id")
+    )
+
+
+def issue_calendar_token(user):
+    """캘린더 구독 토큰을 새로 발급합니다. 이전 토큰으로 만든 구독 주소는 더 이상 쓸 수 없습니다."""
+    user.calendar_token = secrets.token_urlsafe(32)
+    User.objects.filter(pk=user.pk).update(calendar_token=user.calendar_token)
+    return user.calendar_token
+
+
+TEXT_ESCAPES = str.maketrans({"\\": "\\\\", ";": "\\;", ",": "\\,", "\n": "\\n", "\r": None})
+
+
+def _escape(value):
+    return str(value).translate(TEXT_ESCAPES)
+
+
+def _line(name, value):
+    """RFC 5545에 맞춰 75바이트마다 줄을 접습니다."""
+    encoded = f"{name}:{value}".encode()
+    chunks = []
+    while len(encoded) > 75:
+        cut = 75 if not chunks else 74
+        # UTF-8 문자 중간에서 자르지 않도록 continuation byte를 피합니다.
+        while encoded[cut] & 0xC0 == 0x80:
+            cut -= 1
+        chunks.append(encoded[:cut])
+        encoded = encoded[cut:]
+    chunks.append(encoded)
+    return b"\r\n ".join(chunks) + b"\r\n"
+
+
+def _format_datetime(value):
+    return value.astimezone(dt_timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def _feed_queryset(user_id):
+    since = timezone.now() - timedelta(days=settings.CALENDAR_FEED_PAST_DAYS)
+    return user_schedules(user_id).filter(scheduled_at__gte=since)
+
+
+def _feed_state(request, token):
+    """
+    피드의 ETag 계산에 필요한 값을 요청당 한 번만 조회합니다.
+    일정 삭제/교체와 모임 가입/탈퇴는 max(updated_at)를 바꾸지 않을 수 있으므로
+    일정 id 합계와 모임원 상태(수, 마지막 가입 시각)도 함께 담습니다.
+    """
+    if not hasattr(request, "_calendar_feed_state"):
+        user_id = User.objects.filter(calendar_token=token).values_list("pk", flat=True).first()
+        if user_id is None:
+            raise Http404
+        state = _feed_queryset(user_id).aggregate(
+            count=Count("id"),
+            id_sum=Sum("id"),
+            updated_at=Max("updated_at"),
+            meetup_updated_at=Max("meetup__updated_at"),
+        )
+        state.update(
+            Member.objects.filter(user_id=user_id).aggregate(member_count=Count("id"), joined_at=Max("created_at"))
+        )
+        state["user_id"] = user_id
+        request._calendar_feed_state = state
+    return request._calendar_feed_state
+
+
+def _feed_etag(request, token):
+    state = _feed_state(request, token)
+    key = ":".join(str(state[name]) for name in sorted(state))
+    return hashlib.md5(key.encode()).hexdigest()
+
+
+def _events(request, user_id):
+    host = request.get_host()
+    now = _format_datetime(timezone.now())
+    yield b"BEGIN:VCALENDAR\r\n"
+    yield _line("VERSION", "2.0")
+    yield _line("PRODID", "-//Placeholder//Meetup Schedules//KO")
+    yield _line("X-WR-CALNAME", _escape("Placeholder 모임 일정"))
+    schedules = (
+        _feed_queryset(user_id)
+        .order_by("scheduled_at", "id")
+        .values_list("id", "scheduled_at", "updated_at", "place", "address", "memo", "meetup__name")
+    )
+    for schedule_id, scheduled_at, updated_at, place, address, memo, meetup_name in schedules.iterator(chunk_size=500):
+        yield b"BEGIN:VEVENT\r\n"
+        yield _line("UID", f"schedule-{schedule_id}@{host}")
+        yield _line("DTSTAMP", now)
+        yield _line("DTSTART", _format_datetime(scheduled_at))
+        yield _line("LAST-MODIFIED", _format_datetime(updated_at))
+        yield _line("SUMMARY", _escape(f"[{meetup_name}] {memo}" if memo else meetup_name))
+        yield _line("LOCATION", _escape(" ".join(value for value in (place, address) if value)))
+        yield b"END:VEVENT\r\n"
+    yield b"END:VCALENDAR\r\n"
+
+
+@require_GET
+@condition(etag_func=_feed_etag)
+def calendar_feed(request, token):
+    """
+    캘린더 앱이 구독하는 iCalendar 피드. 토큰으로 사용자를 찾고 일정을 generator로 나눠 보냅니다.
+    일정과 가입한 모임이 바뀌지 않았으면 If-None-Match에 304로 답합니다.
+    """
+    state = _feed_state(request, token)
+    response = StreamingHttpResponse(_events(request, state["user_id"]), content_type="text/calendar; charset=utf-8")
+    response["Cache-Control"] = "private, max-age=300"
+    return response
@@ -2,10 +2,10 @@
 from datetime import date, datetime
 from typing import List
 
-from placeholder.schemas.base import BaseSchema
+from placeholder.schemas.base import BaseSchema, ImageDerivativeSchema
 
 
-class OrganizerSchema(BaseSchema):
+class OrganizerSchema(ImageDerivativeSchema):
     nickname: str
     image: str | None = None
 
@@ -24,7 +24,7 @@ class MeetupCreateSchema(BaseSchema):
     image: str | None = ""
 
 
-class MeetupSchema(BaseSchema):
+class MeetupSchema(ImageDerivativeSchema):
     id: int
     is_organizer: bool | None = True
     organizer: OrganizerSchema
@@ -44,7 +44,7 @@ class MeetupSchema(BaseSchema):
     comment_count: int | None = 0
 
 
-class MeetupListSchema(BaseSchema):
+class MeetupListSchema(ImageDerivativeSchema):
     id: int
     is_organizer: bool | None = False
     organizer: OrganizerSchema
@@ -70,3 +70,16 @@ class MeetupListResultSchema(BaseSchema):
 class MeetupLikeSchema(BaseSchema):
     is_like: bool
     like_count: int
+
+
+class MeetupRelationshipSchema(BaseSchema):
+    meetup_id: int
+    is_member: bool
+    role: str | None = None
+    proposal_status: str | None = None
+    is_like: bool
+    is_organizer: bool
+
+
+class MeetupRelationshipResultSchema(BaseSchema):
+    result: List[MeetupRelationshipSchema]
@@ -14,3 +14,15 @@ class MemberListSchema(BaseSchema):
 
 class MemberListResultSchema(BaseSchema):
     result: List[MemberListSchema]
+
+
+class MemberRoleCountSchema(BaseSchema):
+    organizer: int = 0
+    member: int = 0
+
+
+class MemberRosterSchema(BaseSchema):
+    counts: MemberRoleCountSchema
+    total: int
+    result: List[MemberListSchema]
+    next: str | None = None
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from datetime import datetime
-from typing import List
+from typing import List, Literal
 
 from ninja.orm import create_schema
 from pydantic import Field
@@ -27,3 +27,30 @@ ProposalSchema = create_schema(Proposal, fields=["id", "user", "meetup", "text",
 
 class ProposalListResultSchema(BaseSchema):
     result: List[ProposalListSchema]
+
+
+class ProposalStatusCountSchema(BaseSchema):
+    pending: int = 0
+    acceptance: int = 0
+    refuse: int = 0
+    ignore: int = 0
+
+
+class ProposalInboxSchema(BaseSchema):
+    counts: ProposalStatusCountSchema
+    result: List[ProposalListSchema]
+    next: str | None = None
+
+
+class ProposalBulkDecisionSchema(BaseSchema):
+    ids: List[int] = Field(min_length=1, max_length=100)
+    action: Literal["acceptance", "refuse", "ignore"]
+
+
+class ProposalBulkOutcomeSchema(BaseSchema):
+    id: int
+    outcome: Literal["updated", "not_found", "forbidden", "invalid_status"]
+
+
+class ProposalBulkResultSchema(BaseSchema):
+    result: List[ProposalBulkOutcomeSchema]
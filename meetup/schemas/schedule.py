@@ -5,11 +5,11 @@ from typing import List
 from ninja.orm import create_schema
 
 from meetup.models import Schedule
-from placeholder.schemas.base import BaseSchema
+from placeholder.schemas.base import BaseSchema, ImageDerivativeSchema
 from user.schemas.user import UserProfileSchema
 
 
-class ScheduleSchema(BaseSchema):
+class ScheduleSchema(ImageDerivativeSchema):
     id: int
     meetup_id: int
     participant: List[UserProfileSchema]
@@ -23,6 +23,52 @@ class ScheduleSchema(BaseSchema):
     comment_count: int | None = 0
 
 
+class ScheduleListSchema(ImageDerivativeSchema):
+    id: int
+    meetup_id: int
+    scheduled_at: datetime | None = None
+    place: str
+    address: str
+    latitude: str
+    longitude: str
+    memo: str
+    image: str | None = None
+    comment_count: int | None = 0
+    participant_count: int = 0
+    participant_preview: List[UserProfileSchema] = []
+    is_participating: bool = False
+
+
+class ScheduleListResultSchema(BaseSchema):
+    result: List[ScheduleListSchema]
+
+
 ScheduleCreateSchema = create_schema(
-    Schedule, exclude=["id", "created_at", "updated_at", "meetup", "participant"], base_class=BaseSchema
+    Schedule,
+    exclude=["id", "created_at", "updated_at", "meetup", "participant", "lat", "lng", "geo_cell"],
+    base_class=BaseSchema,
 )
+
+
+class NearbyScheduleSchema(BaseSchema):
+    id: int
+    meetup_id: int
+    scheduled_at: datetime
+    place: str
+    address: str
+    lat: float
+    lng: float
+    distance: float | None = None
+
+
+class NearbyMeetupSchema(BaseSchema):
+    id: int
+    name: str
+    ad_title: str
+    schedule_count: int
+    distance: float | None = None
+
+
+class NearbyResultSchema(BaseSchema):
+    result: List[NearbyScheduleSchema]
+    meetups: List[NearbyMeetupSchema]
@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from meetup.models import MeetupLike, Member, Proposal
+from meetup.relationships import invalidate_relationships
+from meetup.roster import invalidate_roster
+
+
+@receiver([post_save, post_delete], sender=Member)
+def invalidate_member_roster(sender, instance, **kwargs):
+    invalidate_roster(instance.meetup_id)
+
+
+@receiver([post_save, post_delete], sender=Member)
+@receiver([post_save, post_delete], sender=Proposal)
+@receiver([post_save, post_delete], sender=MeetupLike)
+def invalidate_meetup_relationship(sender, instance, **kwargs):
+    invalidate_relationships((instance.user_id, instance.meetup_id))
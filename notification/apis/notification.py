@@ -6,6 +6,7 @@ from notification.schemas.notification import NotificationListResultSchema
 from placeholder.schemas.base import ErrorSchema
 from placeholder.utils.auth import JWTAuth
 from placeholder.utils.decorators import handle_exceptions
+from user.dashboard import invalidate_dashboard
 
 notification_router = Router(tags=["notification"])
 
@@ -27,4 +28,6 @@ def read_notification(request, notification_id):
     result = Notification.objects.filter(id=notification_id, recipient=user).update(is_read=True)
     if not result:
         return 404, {"message": "존재하지 않은 알림 입니다."}
+    # update()는 signal을 보내지 않으므로 읽지 않은 알림 수를 직접 무효화합니다.
+    invalidate_dashboard(user.id)
     return 204, None
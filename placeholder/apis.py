@@ -12,13 +12,15 @@ from meetup.apis.proposal import proposal_router
 from meetup.apis.schedule import schedule_router
 from meetup.apis.schedule_comment import schedule_comment_router
 from notification.apis.notification import notification_router
+from placeholder.batch import batch_router
+from placeholder.renderers import ORJSONParser, ORJSONRenderer
 from placeholder.utils.enums import APIStatus
 from user.apis.auth import auth_router
 from user.apis.user import user_router
 
 logger = logging.getLogger(__name__)
 
-api = NinjaAPI(docs=Swagger(settings={"by_alias": True}))
+api = NinjaAPI(docs=Swagger(settings={"by_alias": True}), renderer=ORJSONRenderer(), parser=ORJSONParser())
 
 api.add_router("/auth", auth_router)
 api.add_router("/user", user_router)
@@ -29,6 +31,7 @@ api.add_router("/schedule", schedule_router)
 api.add_router("/meetup-comment", meetup_comment_router)
 api.add_router("/schedule-comment", schedule_comment_router)
 api.add_router("/notification", notification_router)
+api.add_router("/batch", batch_router)
 
 
 def global_exception_handler(request, exc):
@@ -10,8 +10,34 @@ https://docs.djangoproject.com/en/5.1/howto/deployment/asgi/
 
 import os
 
+from asgiref.sync import sync_to_async
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "placeholder.settings")
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+
+async def lifespan(scope, receive, send):
+    """
+    ASGI lifespan 이벤트를 처리합니다.
+    startup 시점에 워밍업을 수행해 워커 재시작/배포 직후 첫 요청의 지연을 없앱니다.
+    """
+    from placeholder.warmup import close_db_connections, warm_up
+
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            await sync_to_async(warm_up, thread_sensitive=True)()
+            await sync_to_async(close_db_connections, thread_sensitive=True)()
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+
+async def application(scope, receive, send):
+    if scope["type"] == "lifespan":
+        await lifespan(scope, receive, send)
+        return
+    await django_application(scope, receive, send)
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+import orjson
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.db import close_old_connections
+from django.http import HttpRequest, QueryDict
+from django.urls import Resolver404, resolve
+from ninja import Router
+
+from placeholder.schemas.base import ErrorSchema
+from placeholder.schemas.batch import BatchRequestSchema, BatchResponseSchema
+from placeholder.utils.auth import JWTAuth, anonymous_user, batch_user
+from placeholder.utils.enums import APIStatus
+from placeholder.utils.exceptions import BatchTooLargeException
+from placeholder.utils.identity import identity_map, remember
+
+API_PREFIX = "/api/v1/"
+BATCH_PATH = f"{API_PREFIX}batch"
+
+batch_router = Router(tags=["Batch"])
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.BATCH_CONCURRENT_WORKERS, thread_name_prefix="batch-request"
+                )
+    return _executor
+
+
+def _error_result(path, status):
+    return {"path": path, "status": status.code, "body": ErrorSchema(message=status.message).model_dump()}
+
+
+def _build_sub_request(request, path):
+    parts = urlsplit(path)
+    full_path = API_PREFIX + parts.path.lstrip("/")
+    sub_request = HttpRequest()
+    sub_request.method = "GET"
+    sub_request.path = sub_request.path_info = full_path
+    sub_request.META = {
+        **request.META,
+        "REQUEST_METHOD": "GET",
+        "PATH_INFO": full_path,
+        "QUERY_STRING": parts.query,
+    }
+    sub_request.GET = QueryDict(parts.query)
+    sub_request.COOKIES = request.COOKIES
+    return sub_request
+
+
+def _dispatch(request, path):
+    """하위 GET 요청 하나를 Ninja 라우터로 보내고 {path, status, body}를 반환합니다."""
+    parts = urlsplit(path)
+    if parts.scheme or parts.netloc:
+        return _error_result(path, APIStatus.BAD_REQUEST)
+    sub_request = _build_sub_request(request, path)
+    if sub_request.path.rstrip("/") == BATCH_PATH:
+        return _error_result(path, APIStatus.BAD_REQUEST)
+    try:
+        match = resolve(sub_request.path)
+    except Resolver404:
+        return _error_result(path, APIStatus.NOT_FOUND)
+
+    sub_request.resolver_match = match
+    # 상위 요청에서 인증한 사용자를 그대로 사용해 하위 요청마다 토큰을 다시 검증하지 않습니다.
+    with batch_user(request.auth if request.auth.is_authenticated else None):
+        response = match.func(sub_request, *match.args, **match.kwargs)
+    body = None
+    if not response.streaming and response.content and response["Content-Type"].startswith("application/json"):
+        body = orjson.loads(response.content)
+    return {"path": path, "status": response.status_code, "body": body}
+
+
+def _dispatch_in_thread(request, path):
+    close_old_connections()
+    try:
+        return _dispatch(request, path)
+    finally:
+        close_old_connections()
+
+
+@batch_router.post("", response=BatchResponseSchema, auth=[JWTAuth(), anonymous_user], by_alias=True)
+def batch(request, payload: BatchRequestSchema):
+    """
+    여러 GET 요청을 한 번에 처리합니다. 결과는 요청 순서대로 반환합니다.
+    인증은 한 번만 수행하고, 하위 요청들은 Meetup/User 조회 결과(identity map)를 공유합니다.
+    ASGI에서 BATCH_CONCURRENT_WORKERS가 1 이상이면 하위 요청을 워커 스레드에서 동시에 실행합니다.
+    """
+    paths = [item.path for item in payload.requests]
+    if len(paths) > settings.BATCH_MAX_REQUESTS:
+        raise BatchTooLargeException()
+
+    with identity_map():
+        if request.auth.is_authenticated:
+            remember(request.auth)
+        if settings.BATCH_CONCURRENT_WORKERS > 0 and isinstance(request, ASGIRequest) and len(paths) > 1:
+            # 각 작업에 현재 context를 복사해 identity map과 읽기 DB alias를 그대로 사용합니다.
+            futures = [
+                _get_executor().submit(contextvars.copy_context().run, _dispatch_in_thread, request, path)
+                for path in paths
+            ]
+            result = [future.result() for future in futures]
+        else:
+            result = [_dispatch(request, path) for path in paths]
+    return {"result": result}
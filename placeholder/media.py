@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+import mimetypes
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse, Http404, HttpResponse, JsonResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_GET, require_POST
+from ninja.errors import HttpError
+
+from meetup.access import AccessLevel, load
+from meetup.models import Meetup, Schedule
+from placeholder.utils.auth import JWTAuth
+from placeholder.utils.enums import APIStatus
+from placeholder.utils.images import image_stem
+from placeholder.utils.local_storage import LocalStorage
+
+# 보호된 경로의 첫 디렉터리 -> 이미지를 가진 모델 (모임원만 받을 수 있습니다)
+PROTECTED_MEDIA_OWNERS = {"schedule": Schedule, "meetup": Meetup}
+
+# presigned POST form에 반드시 있어야 하는 필드
+UPLOAD_FIELDS = ("key", "Content-Type", "expires", "signature")
+
+
+def _error(status):
+    return JsonResponse({"detail": status.message}, status=status.code)
+
+
+def is_protected(key):
+    return any(key.startswith(prefix) for prefix in settings.MEDIA_PROTECTED_PREFIXES)
+
+
+def _find_owner(key):
+    """키의 이미지를 가진 (모델, pk)를 찾습니다. 없으면 None을 반환합니다."""
+    model = PROTECTED_MEDIA_OWNERS.get(key.split("/", 1)[0])
+    if model is None:
+        return None
+    pk = model.objects.filter(image_stem=image_stem(key)).values_list("pk", flat=True).first()
+    return None if pk is None else (model, pk)
+
+
+@csrf_exempt
+@require_POST
+def upload_media(request):
+    """
+    LocalStorage의 presigned POST를 받는 엔드포인트입니다. (S3 POST 업로드와 같은 form 필드를 사용합니다)
+    서명이 요청 권한을 대신하므로 별도 인증은 하지 않습니다.
+    """
+    storage = LocalStorage()
+    file = request.FILES.get("file")
+    if file is None or any(not request.POST.get(field) for field in UPLOAD_FIELDS):
+        return _error(APIStatus.BAD_REQUEST)
+    if not storage.verify_presigned_fields(request.POST, file.size):
+        return _error(APIStatus.FORBIDDEN)
+
+    key = request.POST["key"]
+    try:
+        storage.path(key)
+    except SuspiciousFileOperation:
+        return _error(APIStatus.BAD_REQUEST)
+    if not storage.upload_file(file, key, content_type=request.POST["Content-Type"]):
+        return _error(APIStatus.INTERNAL_SERVER_ERROR)
+    # 서명한 정책의 success_action_status는 항상 201이므로 클라이언트가 보낸 값은 쓰지 않습니다.
+    return JsonResponse({"key": key, "url": storage.url(key)}, status=201)
+
+
+@require_GET
+def serve_media(request, key):
+    """
+    MEDIA_ROOT의 파일을 내려줍니다. 보호된 경로는 그 이미지를 가진 일정(모임)의 모임원만 받을 수 있습니다.
+    MEDIA_X_ACCEL_REDIRECT가 켜져 있으면 파일은 nginx가 sendfile로 직접 보내고
+    Django는 권한 확인 후 X-Accel-Redirect 헤더만 돌려줍니다.
+    """
+    storage = LocalStorage()
+    try:
+        path = storage.path(key)
+    except SuspiciousFileOperation:
+        raise Http404
+
+    if is_protected(key):
+        try:
+            request.auth = JWTAuth()(request)
+            if request.auth is None:
+                return _error(APIStatus.UNAUTHORIZED)
+            owner = _find_owner(key)
+            if owner is None:
+                raise Http404
+            load(request, *owner, AccessLevel.MEMBER)
+        except HttpError as e:
+            return JsonResponse({"detail": e.message}, status=e.status_code)
+
+    content_type, _ = mimetypes.guess_type(key)
+    if settings.MEDIA_X_ACCEL_REDIRECT:
+        response = HttpResponse(content_type=content_type or "application/octet-stream")
+        response["X-Accel-Redirect"] = f"{settings.MEDIA_X_ACCEL_PREFIX}{quote(key)}"
+    else:
+        try:
+            response = FileResponse(open(path, "rb"), content_type=content_type)
+        except (FileNotFoundError, IsADirectoryError):
+            raise Http404
+
+    # 보호된 파일은 공유 캐시(CDN, 프록시)에 남지 않도록 합니다.
+    response["Cache-Control"] = "private, max-age=3600" if is_protected(key) else "public, max-age=2592000"
+    return response
@@ -1,4 +1,15 @@
+from django.conf import settings
 from django.utils.deprecation import MiddlewareMixin
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import AccessToken
+
+from placeholder.utils.db import (
+    choose_replica,
+    is_primary_sticky,
+    mark_primary_sticky,
+    set_read_db_alias,
+)
 
 
 class PutPatchWithFileFormMiddleware(MiddlewareMixin):
@@ -15,4 +26,47 @@ class PutPatchWithFileFormMiddleware(MiddlewareMixin):
                 request.META['REQUEST_METHOD'] = initial_method # 원래 메서드로 되돌림
                 request.method = initial_method # 원래 메서드로 되돌림
             except Exception:
-                pass
\ No newline at end of file
+                pass
+
+
+class ReplicaRoutingMiddleware(MiddlewareMixin):
+    """
+    GET 요청의 읽기 쿼리를 레플리카로 보냅니다.
+    쓰기에 성공한 사용자는 잠시 동안 primary에서 읽도록 고정해 자신이 쓴 내용을 바로 볼 수 있게 합니다.
+    """
+
+    SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+    def process_request(self, request):
+        request._replica_user_id = self._get_token_user_id(request)
+        alias = None
+        if (
+            self._is_read_request(request)
+            and request.path.startswith(tuple(settings.DATABASE_REPLICA_READ_PATHS))
+            and not is_primary_sticky(request._replica_user_id)
+        ):
+            alias = choose_replica()
+        # ASGI에서는 process_request/process_response가 서로 다른 context에서 실행될 수 있어
+        # token 기반 reset 대신 매 요청마다 값을 새로 지정합니다.
+        set_read_db_alias(alias)
+
+    def process_response(self, request, response):
+        set_read_db_alias(None)
+        if not self._is_read_request(request) and response.status_code < 400:
+            mark_primary_sticky(getattr(request, "_replica_user_id", None))
+        return response
+
+    def _is_read_request(self, request):
+        return request.method in self.SAFE_METHODS or (
+            request.method == "POST" and request.path in settings.DATABASE_REPLICA_READ_ONLY_POST_PATHS
+        )
+
+    def _get_token_user_id(self, request):
+        # DB 조회 없이 서명만 검증해 사용자 식별자를 얻습니다.
+        auth = request.headers.get("Authorization")
+        if not auth or not auth.startswith("Bearer "):
+            return None
+        try:
+            return AccessToken(auth[7:]).get(api_settings.USER_ID_CLAIM)
+        except TokenError:
+            return None
@@ -1,10 +1,30 @@
 # -*- coding: utf-8 -*-
+import base64
 from typing import Any, List
 from urllib.parse import urlencode, urlparse, urlunparse
 
+import orjson
 from ninja import Schema
 from ninja.pagination import PaginationBase
 
+from placeholder.utils.exceptions import InvalidCursorException
+
+
+def encode_cursor(values):
+    """keyset 페이지네이션의 마지막 정렬 키 값들을 URL에 넣을 수 있는 문자열로 만듭니다."""
+    return base64.urlsafe_b64encode(orjson.dumps(list(values))).decode().rstrip("=")
+
+
+def decode_cursor(cursor, length):
+    """encode_cursor로 만든 값을 되돌립니다. 형식이 맞지 않으면 InvalidCursorException을 냅니다."""
+    try:
+        values = orjson.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except ValueError:
+        raise InvalidCursorException()
+    if not isinstance(values, list) or len(values) != length:
+        raise InvalidCursorException()
+    return values
+
 
 class CustomPagination(PaginationBase):
     items_attribute: str = "result"
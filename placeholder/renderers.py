@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+import orjson
+from ninja.parser import Parser
+from ninja.renderers import BaseRenderer
+from ninja.responses import NinjaJSONEncoder
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    orjson으로 응답을 바로 bytes로 직렬화합니다.
+    date/datetime/UUID는 orjson이 직접 처리하고, 그 밖의 타입(Decimal, lazy 문자열, pydantic 모델 등)만
+    Ninja 기본 인코더로 넘깁니다. UTC datetime은 기본 렌더러처럼 "Z"로 끝납니다.
+    """
+
+    media_type = "application/json"
+    option = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+    def __init__(self):
+        self._default = NinjaJSONEncoder().default
+
+    def render(self, request, data, *, response_status):
+        return orjson.dumps(data, default=self._default, option=self.option)
+
+
+class ORJSONParser(Parser):
+    """요청 body를 orjson으로 파싱합니다. 잘못된 JSON은 기본 파서와 같이 JSONDecodeError를 냅니다."""
+
+    def parse_body(self, request):
+        return orjson.loads(request.body)
@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from typing import List
+from typing import ClassVar, List
 
 from ninja import Schema
 from pydantic.alias_generators import to_camel
@@ -11,10 +11,11 @@ class BaseSchema(Schema):
         populate_by_name = True
 
     def model_dump(self, **kwargs):
-        return super().model_dump(by_alias=kwargs.get("by_alias", True))
+        kwargs.setdefault("by_alias", True)
+        return super().model_dump(**kwargs)
 
     def dict(self, **kwargs):
-        return super().model_dump(by_alias=kwargs.get("by_alias", True))
+        return self.model_dump(**kwargs)
 
 
 class ResultSchema(BaseSchema):
@@ -27,3 +28,38 @@ class ErrorSchema(BaseSchema):
 
 class PresignedUrlSchema(BaseSchema):
     result: List
+
+
+def _get(obj, name):
+    return obj.get(name) if isinstance(obj, dict) else getattr(obj, name, None)
+
+
+def _derived_image(obj):
+    """파생 이미지가 만들어진 원본 image. 아직 만들어지지 않았거나 원본이 바뀌었으면 None"""
+    image = _get(obj, "image")
+    return image if image and _get(obj, "derived_image") == image else None
+
+
+class ImageDerivativeSchema(BaseSchema):
+    """원본 image와 함께 썸네일/WebP 파생 이미지 URL을 내려줍니다. 파생 이미지가 아직 없으면 None입니다."""
+
+    image_thumbnail: str | None = None
+    image_webp: str | None = None
+
+    # resolver가 읽는 모델 컬럼 (컬럼 프로젝션에서 함께 불러옵니다)
+    resolver_sources: ClassVar[dict] = {
+        "image_thumbnail": ("image", "derived_image"),
+        "image_webp": ("image", "derived_image"),
+    }
+
+    @staticmethod
+    def resolve_image_thumbnail(obj):
+        from placeholder.utils.images import derivative_url
+
+        return derivative_url(_derived_image(obj), "thumbnail")
+
+    @staticmethod
+    def resolve_image_webp(obj):
+        from placeholder.utils.images import derivative_url
+
+        return derivative_url(_derived_image(obj), "webp")
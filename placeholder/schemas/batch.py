@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+from typing import Any, List
+
+from pydantic import Field
+
+from placeholder.schemas.base import BaseSchema
+
+
+class BatchRequestItemSchema(BaseSchema):
+    path: str = Field(..., description="/api/v1/ 기준 상대 경로 (예: meetup/1/like?size=5)")
+
+
+class BatchRequestSchema(BaseSchema):
+    requests: List[BatchRequestItemSchema]
+
+
+class BatchResponseItemSchema(BaseSchema):
+    path: str
+    status: int
+    body: Any = None
+
+
+class BatchResponseSchema(BaseSchema):
+    result: List[BatchResponseItemSchema]
@@ -50,6 +50,7 @@ MIDDLEWARE = [
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "placeholder.middleware.PutPatchWithFileFormMiddleware",
+    "placeholder.middleware.ReplicaRoutingMiddleware",
 ]
 
 CORS_ALLOWED_ORIGINS = [
@@ -91,9 +92,56 @@ DATABASES = {
         "PASSWORD": env("DATABASE_DEFAULT_PASSWORD", default=""),
         "HOST": env("DATABASE_DEFAULT_HOST", default=""),
         "PORT": env("DATABASE_DEFAULT_PORT", default=5432),
+        # ASGI에서는 커넥션이 스레드마다 따로 열리므로 기본값 0으로 요청이 끝나면 닫습니다.
+        "CONN_MAX_AGE": env.int("DATABASE_CONN_MAX_AGE", default=0),
+        "CONN_HEALTH_CHECKS": True,
     }
 }
 
+# 읽기 전용 레플리카 (DATABASE_REPLICA_HOSTS=host1,host2)
+# 나머지 접속 정보는 default와 동일하게 사용합니다.
+DATABASE_REPLICAS = []
+for index, replica_host in enumerate(env.list("DATABASE_REPLICA_HOSTS", default=[]), start=1):
+    alias = f"replica_{index}"
+    DATABASES[alias] = {
+        **DATABASES["default"],
+        "HOST": replica_host,
+        "TEST": {"MIRROR": "default"},
+    }
+    DATABASE_REPLICAS.append(alias)
+
+DATABASE_ROUTERS = ["placeholder.utils.db.PrimaryReplicaRouter"]
+
+# 쓰기 요청 이후 해당 사용자의 읽기를 primary로 고정하는 시간(초)
+DATABASE_REPLICA_STICKY_SECONDS = env.int("DATABASE_REPLICA_STICKY_SECONDS", default=5)
+
+# 레플리카에서 읽어도 되는 GET 요청 경로
+DATABASE_REPLICA_READ_PATHS = [
+    "/api/v1/meetup",
+    "/api/v1/member",
+    "/api/v1/proposal",
+    "/api/v1/schedule",
+    "/api/v1/meetup-comment",
+    "/api/v1/schedule-comment",
+    "/api/v1/user",
+    "/api/v1/notification",
+    "/api/v1/batch",
+]
+
+# GET 요청만 묶어 보내는 POST 경로. 레플리카에서 읽고, 응답 후 primary 고정을 하지 않습니다.
+DATABASE_REPLICA_READ_ONLY_POST_PATHS = [
+    "/api/v1/batch",
+]
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+# 워커 간 상태 공유가 필요하므로 운영 환경에서는 CACHE_URL로 공유 캐시를 지정합니다.
+
+CACHES = {
+    "default": env.cache("CACHE_URL", default="locmemcache://"),
+}
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
@@ -153,6 +201,13 @@ APPEND_SLASH = False
 # 미디어 파일 설정
 MEDIA_URL = "/media/"
 MEDIA_ROOT = os.path.join(BASE_DIR, "media")
+# 미디어 저장소: "s3" 또는 "local"(MEDIA_ROOT)
+MEDIA_STORAGE_BACKEND = env("MEDIA_STORAGE_BACKEND", default="s3")
+# 로그인한 사용자만 받을 수 있는 미디어 키 prefix
+MEDIA_PROTECTED_PREFIXES = env.list("MEDIA_PROTECTED_PREFIXES", default=["schedule/"])
+# nginx 뒤에서는 권한 확인 후 X-Accel-Redirect로 파일 전송을 nginx에 넘깁니다.
+MEDIA_X_ACCEL_REDIRECT = env.bool("MEDIA_X_ACCEL_REDIRECT", default=False)
+MEDIA_X_ACCEL_PREFIX = "/protected-media/"
 
 LOGGING = {
     "version": 1,
@@ -174,3 +229,55 @@ LOGGING = {
 AWS_ACCESS_KEY_ID = env("AWS_ACCESS_KEY_ID", default="")
 AWS_SECRET_ACCESS_KEY = env("AWS_SECRET_ACCESS_KEY", default="")
 AWS_S3_MEDIA_BUCKET_NAME = env("AWS_S3_MEDIA_BUCKET_NAME", default="")
+AWS_S3_REGION_NAME = env("AWS_S3_REGION_NAME", default="ap-southeast-2")
+# MinIO 등 로컬 S3 호환 서버를 사용할 때 지정합니다.
+AWS_S3_ENDPOINT_URL = env("AWS_S3_ENDPOINT_URL", default=None)
+# 공유 S3 클라이언트를 다시 만드는 주기(초). 교체된 자격 증명을 반영합니다.
+AWS_S3_CLIENT_MAX_AGE = env.int("AWS_S3_CLIENT_MAX_AGE", default=3600)
+# 큰 파일/스트림 업로드 시 multipart 파트 크기(바이트, 최소 5MiB)와 동시에 올리는 파트 수입니다.
+AWS_S3_MULTIPART_PART_SIZE = env.int("AWS_S3_MULTIPART_PART_SIZE", default=8 * 1024 * 1024)
+AWS_S3_MAX_CONCURRENCY = env.int("AWS_S3_MAX_CONCURRENCY", default=4)
+
+# Background tasks
+# 커밋 이후 요청 스레드 밖에서 실행할 작업(이미지 파생본 생성 등)의 워커 수입니다.
+BACKGROUND_TASK_WORKERS = env.int("BACKGROUND_TASK_WORKERS", default=2)
+# True면 백그라운드 작업을 커밋 직후 같은 스레드에서 바로 실행합니다. (테스트용)
+BACKGROUND_TASKS_EAGER = env.bool("BACKGROUND_TASKS_EAGER", default=False)
+
+# 마이 스페이스 대시보드 카운트 캐시 시간(초). 모임원/신청/알림 변경 시에는 바로 무효화됩니다.
+USER_DASHBOARD_CACHE_SECONDS = env.int("USER_DASHBOARD_CACHE_SECONDS", default=300)
+
+# 모임원 명단 페이지 캐시 시간(초). 가입/탈퇴 시에는 바로 무효화되고, 프로필 변경은 이 시간 뒤에 반영됩니다.
+MEETUP_ROSTER_CACHE_SECONDS = env.int("MEETUP_ROSTER_CACHE_SECONDS", default=300)
+
+# 모임 관계 일괄 조회: 한 번에 조회할 수 있는 모임 수와 사용자/모임별 캐시 시간(초)
+MEETUP_RELATIONSHIP_MAX_IDS = env.int("MEETUP_RELATIONSHIP_MAX_IDS", default=50)
+MEETUP_RELATIONSHIP_CACHE_SECONDS = env.int("MEETUP_RELATIONSHIP_CACHE_SECONDS", default=300)
+
+# 주변 일정 검색: 최대 반경(km)과 한 번에 내려주는 최대 일정 수
+GEO_NEARBY_MAX_RADIUS_KM = env.int("GEO_NEARBY_MAX_RADIUS_KM", default=50)
+GEO_NEARBY_MAX_RESULTS = env.int("GEO_NEARBY_MAX_RESULTS", default=200)
+# 반경 검색에서 실제 거리를 계산할 후보(가까운 순) 최대 수
+GEO_NEARBY_MAX_CANDIDATES = env.int("GEO_NEARBY_MAX_CANDIDATES", default=1000)
+
+# 캘린더: 한 번에 조회할 수 있는 최대 기간(일)과 iCalendar 피드에 포함할 지난 일정 기간(일)
+CALENDAR_MAX_RANGE_DAYS = env.int("CALENDAR_MAX_RANGE_DAYS", default=93)
+CALENDAR_FEED_PAST_DAYS = env.int("CALENDAR_FEED_PAST_DAYS", default=30)
+
+# 일정 목록에서 미리 보여줄 참여자 수
+SCHEDULE_PARTICIPANT_PREVIEW_SIZE = env.int("SCHEDULE_PARTICIPANT_PREVIEW_SIZE", default=5)
+
+# 이메일/닉네임 availability index (프로세스별 Bloom filter)
+# 재생성 주기(초), 목표 오탐률, 재생성 전까지 추가될 값을 위한 여유 크기입니다.
+AVAILABILITY_INDEX_REBUILD_SECONDS = env.int("AVAILABILITY_INDEX_REBUILD_SECONDS", default=600)
+AVAILABILITY_INDEX_ERROR_RATE = env.float("AVAILABILITY_INDEX_ERROR_RATE", default=0.01)
+AVAILABILITY_INDEX_HEADROOM = env.int("AVAILABILITY_INDEX_HEADROOM", default=10000)
+
+# 모임/사용자 삭제 시 연관 데이터를 한 트랜잭션에서 지우는 행 수입니다.
+DELETION_BATCH_SIZE = env.int("DELETION_BATCH_SIZE", default=500)
+
+# Batch API
+# 한 번의 /api/v1/batch 요청에 담을 수 있는 하위 GET 요청 수입니다.
+BATCH_MAX_REQUESTS = env.int("BATCH_MAX_REQUESTS", default=10)
+# ASGI에서 하위 요청을 동시에 실행할 워커 스레드 수 (0이면 순서대로 실행)
+BATCH_CONCURRENT_WORKERS = env.int("BATCH_CONCURRENT_WORKERS", default=0)
@@ -20,3 +20,6 @@ STATIC_URL = "static/"
 STATICFILES_DIRS = [
     BASE_DIR / "static",  # noqa: F405
 ]
+
+# nginx의 internal location(/protected-media/)이 미디어 파일을 전송합니다.
+MEDIA_X_ACCEL_REDIRECT = True
@@ -1,14 +1,17 @@
 # -*- coding: utf-8 -*-
 from django.contrib import admin
 from django.urls import path
-from django.conf import settings
-from django.conf.urls.static import static
+
+from meetup.schedule_calendar import calendar_feed
 from placeholder.apis import api
+from placeholder.media import serve_media, upload_media
 
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("api/v1/", api.urls),
+    # MEDIA_URL: LocalStorage 업로드(POST)와 미디어 파일 제공(GET)
+    path("media/", upload_media),
+    path("media/<path:key>", serve_media),
+    # 캘린더 앱 구독용 iCalendar 피드 (토큰으로 인증)
+    path("calendar/<str:token>.ics", calendar_feed, name="calendar_feed"),
 ]
-
-if settings.DEBUG:
-    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
@@ -1,4 +1,7 @@
 # -*- coding: utf-8 -*-
+from contextlib import contextmanager
+from contextvars import ContextVar
+
 from django.contrib.auth.models import AnonymousUser
 from ninja.security import HttpBearer
 from rest_framework_simplejwt.authentication import JWTAuthentication
@@ -8,9 +11,26 @@ from placeholder.utils.exceptions import (
     UnauthorizedAccessException,
 )
 
+# batch 하위 요청을 처리하는 동안 상위 요청에서 인증한 사용자 (그 밖에서는 None)
+_batch_user: ContextVar = ContextVar("batch_user", default=None)
+
+
+@contextmanager
+def batch_user(user):
+    """블록 안의 JWTAuth는 토큰을 다시 검증하지 않고 user를 사용합니다."""
+    token = _batch_user.set(user)
+    try:
+        yield
+    finally:
+        _batch_user.reset(token)
+
 
 class JWTAuth(HttpBearer):
     def authenticate(self, request, token):
+        # batch 하위 요청은 상위 요청에서 인증한 사용자를 그대로 사용합니다.
+        batch_auth = _batch_user.get()
+        if batch_auth is not None:
+            return batch_auth
         jwt_auth = JWTAuthentication()
         try:
             validated_token = jwt_auth.get_validated_token(token)
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+import random
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import cache
+
+PRIMARY_DB_ALIAS = "default"
+
+# 현재 요청에서 읽기 쿼리를 보낼 DB alias (None이면 primary)
+_read_db_alias: ContextVar[str | None] = ContextVar("read_db_alias", default=None)
+
+
+def get_read_db_alias():
+    return _read_db_alias.get()
+
+
+def set_read_db_alias(alias):
+    _read_db_alias.set(alias)
+
+
+def choose_replica():
+    """설정된 레플리카 중 하나를 고릅니다. 레플리카가 없으면 None을 반환합니다."""
+    replicas = getattr(settings, "DATABASE_REPLICAS", [])
+    if not replicas:
+        return None
+    return random.choice(replicas)
+
+
+def _sticky_cache_key(user_id):
+    return f"db:sticky:{user_id}"
+
+
+def mark_primary_sticky(user_id):
+    """쓰기 직후 잠시 동안 해당 사용자의 읽기를 primary로 고정합니다."""
+    timeout = getattr(settings, "DATABASE_REPLICA_STICKY_SECONDS", 5)
+    if user_id and timeout > 0:
+        cache.set(_sticky_cache_key(user_id), True, timeout=timeout)
+
+
+def is_primary_sticky(user_id):
+    if not user_id:
+        return False
+    return cache.get(_sticky_cache_key(user_id), False)
+
+
+class PrimaryReplicaRouter:
+    """쓰기는 항상 primary로, 읽기는 요청 단위로 지정된 레플리카로 보냅니다."""
+
+    def db_for_read(self, model, **hints):
+        return get_read_db_alias() or PRIMARY_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        return PRIMARY_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # 레플리카는 primary의 복제본이므로 모든 alias 간 관계를 허용합니다.
+        aliases = {PRIMARY_DB_ALIAS, *getattr(settings, "DATABASE_REPLICAS", [])}
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db in getattr(settings, "DATABASE_REPLICAS", []):
+            return False
+        return None
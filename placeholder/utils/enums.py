@@ -56,11 +56,17 @@ class APIStatus(StrEnum):
     BAD_REQUEST = (400, "잘못된 요청입니다.")
     EMAIL_ALREADY_EXISTS = (400, "이미 사용 중인 이메일입니다.")
     NICKNAME_ALREADY_EXISTS = (400, "이미 사용 중인 닉네임입니다.")
+    INVALID_FIELDS = (400, "요청할 수 없는 필드입니다.")
+    INVALID_CURSOR = (400, "유효하지 않은 페이지 커서입니다.")
+    BATCH_TOO_LARGE = (400, "한 번에 보낼 수 있는 요청 수를 초과했습니다.")
+    INVALID_LOCATION = (400, "유효하지 않은 위치 범위입니다.")
+    INVALID_DATE_RANGE = (400, "유효하지 않은 기간입니다.")
     UNAUTHORIZED = (401, "인증되지 않았습니다.")
     INVALID_CREDENTIALS = (401, "유효하지 않은 자격 증명입니다.")
     INVALID_TOKEN = (401, "유효하지 않은 토큰입니다.")
     FORBIDDEN = (403, "권한이 없습니다.")
     NOT_FOUND = (404, "리소스를 찾을 수 없습니다.")
+    INVALID_PROPOSAL_STATUS = (409, "현재 상태에서는 처리할 수 없는 신청입니다.")
     UNPROCESSABLE = (422, "유효하지 않은 요청입니다.")
     INTERNAL_SERVER_ERROR = (500, "서버 내부 오류가 발생했습니다.")
 
@@ -19,6 +19,36 @@ class NicknameAlreadyExistsException(CustomException):
         super().__init__(APIStatus.NICKNAME_ALREADY_EXISTS)
 
 
+class InvalidFieldsException(CustomException):
+    def __init__(self):
+        super().__init__(APIStatus.INVALID_FIELDS)
+
+
+class InvalidCursorException(CustomException):
+    def __init__(self):
+        super().__init__(APIStatus.INVALID_CURSOR)
+
+
+class BatchTooLargeException(CustomException):
+    def __init__(self):
+        super().__init__(APIStatus.BATCH_TOO_LARGE)
+
+
+class InvalidLocationException(CustomException):
+    def __init__(self):
+        super().__init__(APIStatus.INVALID_LOCATION)
+
+
+class InvalidDateRangeException(CustomException):
+    def __init__(self):
+        super().__init__(APIStatus.INVALID_DATE_RANGE)
+
+
+class InvalidProposalStatusException(CustomException):
+    def __init__(self):
+        super().__init__(APIStatus.INVALID_PROPOSAL_STATUS)
+
+
 class InvalidCredentialsException(CustomException):
     def __init__(self):
         super().__init__(APIStatus.INVALID_CREDENTIALS)
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+import inspect
+from copy import copy
+from functools import lru_cache, wraps
+
+from django.http import HttpResponse
+from ninja import Query, Schema
+from ninja.utils import contribute_operation_args
+from pydantic import Field
+
+from placeholder.pagination import CustomPagination
+from placeholder.schemas.base import BaseSchema
+from placeholder.utils.exceptions import InvalidFieldsException
+
+
+class FieldsInput(Schema):
+    fields: str | None = Field(None, description="응답에 포함할 필드 (쉼표로 구분, 예: id,adTitle,likeCount)")
+
+
+def parse_fields(schema, raw):
+    """
+    `fields=` 값을 검증해 스키마 필드 이름의 frozenset으로 바꿉니다.
+    camelCase alias와 필드 이름을 모두 받으며, 값이 없으면 None(전체 필드)을 반환합니다.
+    """
+    if not raw:
+        return None
+    lookup = {}
+    for name, info in schema.model_fields.items():
+        lookup[name] = name
+        if info.alias:
+            lookup[info.alias] = name
+
+    requested = set()
+    for token in raw.split(","):
+        token = token.strip()
+        if not token:
+            continue
+        if token not in lookup:
+            raise InvalidFieldsException()
+        requested.add(lookup[token])
+    return frozenset(requested) or None
+
+
+def get_requested_fields(request):
+    return getattr(request, "sparse_fields", None)
+
+
+def is_field_requested(request, name):
+    """fields=로 필드를 고른 요청에서 name이 빠져 있으면 False를 반환합니다."""
+    fields = get_requested_fields(request)
+    return fields is None or name in fields
+
+
+@lru_cache(maxsize=None)
+def get_sparse_schema(schema, fields):
+    """schema에서 fields만 남긴 스키마를 만듭니다. resolver도 함께 옮깁니다."""
+    annotations = {}
+    namespace = {"__module__": schema.__module__, "__annotations__": annotations}
+    for name in sorted(fields):
+        info = schema.model_fields[name]
+        annotations[name] = info.annotation
+        namespace[name] = copy(info)
+        resolver = inspect.getattr_static(schema, f"resolve_{name}", None)
+        if resolver is not None:
+            namespace[f"resolve_{name}"] = resolver
+    return type(f"Sparse{schema.__name__}", (BaseSchema,), namespace)
+
+
+def _render_sparse(request, schema, fields, result):
+    from placeholder.apis import api
+
+    sparse_schema = get_sparse_schema(schema, fields)
+    items_attribute = CustomPagination.items_attribute
+    if isinstance(result, dict) and items_attribute in result:
+        items = [sparse_schema.from_orm(item).model_dump() for item in result[items_attribute]]
+        data = {**result, items_attribute: items}
+    else:
+        data = sparse_schema.from_orm(result).model_dump()
+    return api.create_response(request, data, status=200)
+
+
+def sparse_fields(schema):
+    """
+    GET 라우트에 `fields=` 쿼리 파라미터를 추가합니다.
+    요청한 필드는 request.sparse_fields 로 뷰에 전달되어 annotate/컬럼 로딩을 건너뛰는 데 쓰이고,
+    응답은 요청한 필드만 남긴 스키마로 직렬화합니다. 목록 응답은 `result` 항목을 기준으로 자릅니다.
+    """
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(request, *args, ninja_fields, **kwargs):
+            fields = parse_fields(schema, ninja_fields.fields)
+            request.sparse_fields = fields
+            result = func(request, *args, **kwargs)
+            if fields is None or isinstance(result, HttpResponse):
+                return result
+            return _render_sparse(request, schema, fields, result)
+
+        # wraps가 복사한 리스트를 공유하지 않도록 새로 만든 뒤 추가합니다.
+        wrapper._ninja_contribute_args = list(getattr(func, "_ninja_contribute_args", []))
+        contribute_operation_args(wrapper, "ninja_fields", FieldsInput, Query(...))
+        return wrapper
+
+    return decorator
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+import math
+
+EARTH_RADIUS_KM = 6371.0088
+
+# 격자 한 칸의 크기(도). 저장된 geo_cell 값이 이 값에 의존하므로 바꾸면 데이터를 다시 계산해야 합니다.
+CELL_DEGREES = 0.01
+CELL_COLUMNS = int(round(360 / CELL_DEGREES))
+
+# 범위가 이보다 많은 행에 걸치면 행별 범위 대신 전체를 하나의 범위로 묶습니다.
+# 최대 반경(GEO_NEARBY_MAX_RADIUS_KM=50km)의 사각형은 위도 약 0.9도(90여 행)에 걸치므로 그보다 넉넉하게 잡습니다.
+MAX_CELL_ROWS = 128
+
+
+def parse_coordinates(latitude, longitude):
+    """문자열 위도/경도를 숫자로 바꿉니다. 비어 있거나 범위를 벗어나면 (None, None)을 반환합니다."""
+    try:
+        lat, lng = float(latitude), float(longitude)
+    except (TypeError, ValueError):
+        return None, None
+    if not (-90 <= lat <= 90 and -180 <= lng <= 180) or math.isnan(lat) or math.isnan(lng):
+        return None, None
+    return lat, lng
+
+
+def _row(lat):
+    return min(int(math.floor((lat + 90) / CELL_DEGREES)), int(round(180 / CELL_DEGREES)) - 1)
+
+
+def _column(lng):
+    return min(int(math.floor((lng + 180) / CELL_DEGREES)), CELL_COLUMNS - 1)
+
+
+def cell_for(lat, lng):
+    """위도/경도가 속한 격자 칸 번호. 같은 위도 행의 칸들은 연속된 번호를 가집니다."""
+    if lat is None or lng is None:
+        return None
+    return _row(lat) * CELL_COLUMNS + _column(lng)
+
+
+def bounding_box(lat, lng, radius_km):
+    """중심과 반경을 감싸는 (min_lat, max_lat, min_lng, max_lng)"""
+    delta_lat = math.degrees(radius_km / EARTH_RADIUS_KM)
+    min_lat, max_lat = max(lat - delta_lat, -90.0), min(lat + delta_lat, 90.0)
+    cos_lat = math.cos(math.radians(max(abs(min_lat), abs(max_lat))))
+    if cos_lat < 1e-6:
+        return min_lat, max_lat, -180.0, 180.0
+    delta_lng = math.degrees(radius_km / (EARTH_RADIUS_KM * cos_lat))
+    if delta_lng >= 180:
+        return min_lat, max_lat, -180.0, 180.0
+    return min_lat, max_lat, max(lng - delta_lng, -180.0), min(lng + delta_lng, 180.0)
+
+
+def cell_ranges(min_lat, max_lat, min_lng, max_lng):
+    """
+    사각형 영역을 덮는 격자 칸 번호 범위 [(start, end), ...]를 반환합니다.
+    행마다 열 번호가 연속이므로 행 하나가 범위 하나가 되어 인덱스 범위 조회로 후보를 거를 수 있습니다.
+    """
+    first_row, last_row = _row(min_lat), _row(max_lat)
+    first_column, last_column = _column(min_lng), _column(max_lng)
+    if last_row - first_row + 1 > MAX_CELL_ROWS:
+        return [(first_row * CELL_COLUMNS + first_column, last_row * CELL_COLUMNS + last_column)]
+    return [
+        (row * CELL_COLUMNS + first_column, row * CELL_COLUMNS + last_column) for row in range(first_row, last_row + 1)
+    ]
+
+
+def haversine_km(lat, lng, points):
+    """중심에서 points [(lat, lng), ...] 각각까지의 거리(km) 목록"""
+    lat1, lng1 = math.radians(lat), math.radians(lng)
+    cos_lat1 = math.cos(lat1)
+    distances = []
+    for point_lat, point_lng in points:
+        lat2, lng2 = math.radians(point_lat), math.radians(point_lng)
+        a = math.sin((lat2 - lat1) / 2) ** 2 + cos_lat1 * math.cos(lat2) * math.sin((lng2 - lng1) / 2) ** 2
+        distances.append(2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a))))
+    return distances
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# 배치 요청 동안 (모델, pk) -> 인스턴스를 담아두는 identity map (배치 밖에서는 None)
+_identity_map: ContextVar[dict | None] = ContextVar("identity_map", default=None)
+
+
+@contextmanager
+def identity_map():
+    """블록 안에서 get_by_pk로 조회한 객체를 공유합니다. 같은 객체는 한 번만 조회합니다."""
+    token = _identity_map.set({})
+    try:
+        yield
+    finally:
+        _identity_map.reset(token)
+
+
+def _key(model, pk):
+    return model._meta.concrete_model, str(pk)
+
+
+def remember(instance):
+    """이미 불러온 인스턴스를 identity map에 등록합니다. (배치 밖에서는 아무 것도 하지 않습니다)"""
+    cache = _identity_map.get()
+    if cache is not None and instance is not None:
+        cache[_key(type(instance), instance.pk)] = instance
+
+
+def get_by_pk(model, pk):
+    """pk로 객체를 조회합니다. 없으면 None을 반환하며, 배치 안에서는 결과를 재사용합니다."""
+    cache = _identity_map.get()
+    if cache is None:
+        return model.objects.filter(pk=pk).first()
+    key = _key(model, pk)
+    if key not in cache:
+        cache[key] = model.objects.filter(pk=pk).first()
+    return cache[key]
+
+
+def shared(key, loader):
+    """
+    배치 안에서는 key로 loader 결과를 한 번만 만들어 하위 요청들이 함께 씁니다.
+    배치 밖에서는 매번 loader를 호출합니다. (모델 인스턴스 키와 겹치지 않도록 key는 튜플로 구분합니다)
+    """
+    cache = _identity_map.get()
+    if cache is None:
+        return loader()
+    if key not in cache:
+        cache[key] = loader()
+    return cache[key]
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+import logging
+from dataclasses import dataclass
+from io import BytesIO
+from urllib.parse import urlsplit, urlunsplit
+
+from django.conf import settings
+
+from placeholder.utils.storage import get_storage
+from placeholder.utils.tasks import enqueue
+
+logger = logging.getLogger(__name__)
+
+# presigned POST의 content-length-range 상한과 같습니다.
+MAX_ORIGINAL_SIZE = 10485760
+
+
+@dataclass(frozen=True)
+class ImageDerivative:
+    max_size: int
+    format: str
+    suffix: str
+    content_type: str
+    quality: int = 80
+
+
+IMAGE_DERIVATIVES = {
+    "thumbnail": ImageDerivative(max_size=320, format="WEBP", suffix="thumb.webp", content_type="image/webp"),
+    "webp": ImageDerivative(max_size=1280, format="WEBP", suffix="webp", content_type="image/webp"),
+}
+
+
+def _with_suffix(path, suffix):
+    head, _, filename = path.rpartition("/")
+    stem = filename.rsplit(".", 1)[0] if "." in filename else filename
+    return f"{head}/{stem}.{suffix}" if head else f"{stem}.{suffix}"
+
+
+def derivative_url(image, name):
+    """
+    원본 이미지 값(URL 또는 키)으로부터 파생 이미지의 URL(또는 키)을 만듭니다.
+    파생 이미지는 원본과 같은 경로에 `{이름}.{suffix}` 형태로 저장됩니다.
+    """
+    if not image:
+        return None
+    suffix = IMAGE_DERIVATIVES[name].suffix
+    parts = urlsplit(image)
+    if parts.scheme:
+        return urlunsplit(parts._replace(path=_with_suffix(parts.path, suffix), query="", fragment=""))
+    return _with_suffix(image, suffix)
+
+
+def image_key(image):
+    """이미지 값(URL 또는 키)에서 저장소 키를 추출합니다."""
+    parts = urlsplit(image)
+    # LocalStorage URL(MEDIA_URL + 키)이면 MEDIA_URL을 제거합니다.
+    if parts.path.startswith(settings.MEDIA_URL):
+        return parts.path[len(settings.MEDIA_URL) :]  # noqa: E203
+    if not parts.scheme:
+        return image.lstrip("/")
+    path = parts.path.lstrip("/")
+    # path-style URL(https://endpoint/bucket/key)이면 버킷 이름을 제거합니다.
+    bucket = settings.AWS_S3_MEDIA_BUCKET_NAME
+    if bucket and path.startswith(f"{bucket}/"):
+        path = path[len(bucket) + 1 :]  # noqa: E203
+    return path
+
+
+def image_stem(image):
+    """
+    원본 또는 파생 이미지 값에서 확장자를 뺀 원본 키를 구합니다. (schedule/a.thumb.webp -> schedule/a)
+    보호된 미디어의 주인을 인덱스로 찾을 수 있도록 모델의 image_stem 컬럼에 저장합니다.
+    """
+    if not image:
+        return ""
+    key = image_key(image)
+    for derivative in IMAGE_DERIVATIVES.values():
+        if key.endswith(f".{derivative.suffix}"):
+            return key.removesuffix(f".{derivative.suffix}")
+    return key.rsplit(".", 1)[0]
+
+
+# image 컬럼에 원본 이미지를 저장하는 모델. 파생 이미지를 모두 올리면 derived_image에 원본 값을 기록합니다.
+IMAGE_MODELS = ("meetup.Meetup", "meetup.Schedule", "user.User")
+
+
+def mark_image_derived(image):
+    """image를 원본으로 쓰는 행에 파생 이미지가 준비되었음을 기록합니다."""
+    from django.apps import apps
+
+    for label in IMAGE_MODELS:
+        model = apps.get_model(label)
+        # save()를 거치지 않아 updated_at과 저장 시그널에 영향을 주지 않습니다.
+        model._base_manager.filter(image=image).exclude(derived_image=image).update(derived_image=image)
+
+
+def pending_images():
+    """파생 이미지가 아직 기록되지 않은 원본 image 값들을 정렬해 반환합니다."""
+    from django.apps import apps
+    from django.db.models import F
+
+    images = set()
+    for label in IMAGE_MODELS:
+        queryset = apps.get_model(label)._default_manager.exclude(image__isnull=True).exclude(image="")
+        images.update(queryset.exclude(derived_image=F("image")).values_list("image", flat=True).distinct())
+    return sorted(images)
+
+
+def generate_image_derivatives(image):
+    """원본 이미지를 읽어 썸네일과 WebP 변환본을 만들고 저장소에 올립니다. 모두 올리면 derived_image를 기록합니다."""
+    from PIL import Image, ImageOps, UnidentifiedImageError
+
+    storage = get_storage()
+    key = image_key(image)
+    data = storage.read_file(key, max_size=MAX_ORIGINAL_SIZE)
+    if not data:
+        logger.warning(f"Skip image derivatives: cannot read {key}")
+        return []
+
+    try:
+        original = Image.open(BytesIO(data))
+        original = ImageOps.exif_transpose(original)
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError) as e:
+        logger.warning(f"Skip image derivatives: invalid image {key}: {e}")
+        return []
+
+    if original.mode not in ("RGB", "RGBA"):
+        original = original.convert("RGBA" if "transparency" in original.info else "RGB")
+
+    created = []
+    for name, derivative in IMAGE_DERIVATIVES.items():
+        resized = original.copy()
+        resized.thumbnail((derivative.max_size, derivative.max_size), Image.Resampling.LANCZOS)
+        buffer = BytesIO()
+        resized.save(buffer, format=derivative.format, quality=derivative.quality)
+        buffer.seek(0)
+
+        derivative_key = derivative_url(key, name)
+        if storage.upload_file(buffer, derivative_key, content_type=derivative.content_type):
+            created.append(derivative_key)
+    if len(created) == len(IMAGE_DERIVATIVES):
+        mark_image_derived(image)
+    return created
+
+
+def schedule_image_derivatives(image, previous_image=None):
+    """이미지가 새로 지정되었을 때 파생 이미지 생성을 백그라운드 작업으로 예약합니다."""
+    if image and image != previous_image:
+        enqueue(generate_image_derivatives, image)
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+import hashlib
+import logging
+import os
+import tempfile
+import time
+import uuid
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.utils._os import safe_join
+from django.utils.crypto import constant_time_compare, salted_hmac
+
+from placeholder.utils.storage import BaseStorage, UploadResult
+
+logger = logging.getLogger(__name__)
+
+PRESIGN_SALT = "placeholder.utils.local_storage.presign"
+# S3 presigned POST 정책과 같은 제약을 적용합니다.
+CONTENT_TYPE_PREFIX = "image/"
+CONTENT_LENGTH_RANGE = (1024, 10485760)
+
+
+def _sign(key, content_type, expires):
+    return salted_hmac(PRESIGN_SALT, f"{key}\n{content_type}\n{expires}", algorithm="sha256").hexdigest()
+
+
+class LocalStorage(BaseStorage):
+    """
+    MEDIA_ROOT 아래에 파일을 저장하는 저장소입니다.
+    presigned POST는 S3와 같은 응답 형식으로 HMAC 서명한 필드를 내려주며, 업로드는 MEDIA_URL로 받습니다.
+    네트워크 없이 동작하므로 로컬 개발과 업로드 경로 벤치마크에도 사용합니다.
+    """
+
+    def __init__(self, root=None):
+        self.root = root or settings.MEDIA_ROOT
+
+    def path(self, key):
+        """키에 해당하는 파일 경로를 반환합니다. MEDIA_ROOT 밖을 가리키면 SuspiciousFileOperation이 발생합니다."""
+        if not key or key.endswith("/"):
+            raise SuspiciousFileOperation(f"Invalid media key: {key!r}")
+        return safe_join(self.root, key)
+
+    def url(self, key):
+        return f"{settings.MEDIA_URL}{key}"
+
+    def read_file(self, key, max_size=None, bucket_name=None):
+        try:
+            path = self.path(key)
+            if max_size is not None and os.path.getsize(path) > max_size:
+                return None
+            with open(path, "rb") as f:
+                return f.read()
+        except (OSError, SuspiciousFileOperation) as e:
+            logger.warning(f"Error reading {key} from local storage: {e}")
+            return None
+
+    def _write(self, key, chunks):
+        # 임시 파일에 쓴 뒤 rename 하므로 읽는 쪽에서 쓰다 만 파일을 보지 않습니다.
+        path = self.path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        sha256 = hashlib.sha256()
+        size = 0
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".upload-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for chunk in chunks:
+                    f.write(chunk)
+                    sha256.update(chunk)
+                    size += len(chunk)
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return size, sha256.hexdigest()
+
+    def upload_file(self, file, key, content_type="application/octet-stream", bucket_name=None):
+        try:
+            self._write(key, iter(lambda: file.read(1024 * 1024), b""))
+            return True
+        except (OSError, SuspiciousFileOperation) as e:
+            logger.error(f"Error uploading {key} to local storage: {e}")
+            return False
+
+    def upload_stream(self, chunks, key, content_type="application/octet-stream", bucket_name=None, **kwargs):
+        started = time.perf_counter()
+        try:
+            size, sha256 = self._write(key, chunks)
+        except (OSError, SuspiciousFileOperation) as e:
+            logger.error(f"Error uploading {key} to local storage: {e}")
+            return None
+        return UploadResult(key=key, size=size, parts=1, sha256=sha256, elapsed=time.perf_counter() - started)
+
+    def delete_file(self, key, bucket_name=None):
+        try:
+            os.remove(self.path(key))
+            return True
+        except FileNotFoundError:
+            return True
+        except (OSError, SuspiciousFileOperation) as e:
+            logger.error(f"Error deleting {key} from local storage: {e}")
+            return False
+
+    def create_presigned_url(self, object_name, content_type, bucket_name=None, expiration=10):
+        expires = str(int(time.time()) + expiration)
+        fields = {
+            "Content-Type": content_type,
+            "success_action_status": "201",
+            "key": object_name,
+            "expires": expires,
+            "signature": _sign(object_name, content_type, expires),
+        }
+        return {"url": settings.MEDIA_URL, "fields": fields}
+
+    def create_batch_presigned_url(self, filepath, filetype_list: list, bucket_name=None, expiration=10):
+        context = {"result": []}
+        for type_ in filetype_list:
+            ext = type_parts[1] if len(type_parts := type_.split("/")) == 2 else "jpg"
+            key = f"{filepath}/{uuid.uuid4()}.{ext}"
+            context["result"].append(self.create_presigned_url(key, type_, expiration=expiration))
+        return context
+
+    def verify_presigned_fields(self, fields, size):
+        """업로드 요청의 서명, 만료 시각과 정책(이미지 타입, 크기 범위)을 검증합니다."""
+        key = fields.get("key", "")
+        content_type = fields.get("Content-Type", "")
+        expires = fields.get("expires", "")
+        if not (key and expires.isdigit() and int(expires) >= time.time()):
+            return False
+        if not constant_time_compare(fields.get("signature", ""), _sign(key, content_type, expires)):
+            return False
+        return content_type.startswith(CONTENT_TYPE_PREFIX) and (
+            CONTENT_LENGTH_RANGE[0] <= size <= CONTENT_LENGTH_RANGE[1]
+        )
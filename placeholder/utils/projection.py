@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+import types
+from functools import lru_cache
+from typing import Union, get_args, get_origin
+
+from pydantic import BaseModel
+
+
+def _unwrap_schema(annotation):
+    """`Schema | None` 같은 타입에서 중첩 스키마 클래스를 꺼냅니다. 스키마가 아니면 None을 반환합니다."""
+    if get_origin(annotation) in (Union, types.UnionType):
+        schemas = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(schemas) != 1:
+            return None
+        annotation = schemas[0]
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    return None
+
+
+def _collect(model, schema, prefix, only_fields, related, fields=None):
+    concrete = {}
+    for field in model._meta.concrete_fields:
+        concrete[field.name] = field
+        concrete[field.attname] = field
+
+    only_fields.add(f"{prefix}{model._meta.pk.name}")
+    names = schema.model_fields if fields is None else fields
+    # resolver가 읽는 컬럼도 함께 불러와야 객체마다 지연 로딩이 일어나지 않습니다.
+    sources = getattr(schema, "resolver_sources", {})
+    for name in names:
+        for source in sources.get(name, ()):
+            only_fields.add(f"{prefix}{source}")
+        info = schema.model_fields[name]
+        field = concrete.get(name)
+        if field is None:
+            # annotate 값이나 resolver로 채우는 필드는 DB 컬럼이 아닙니다.
+            continue
+        nested = _unwrap_schema(info.annotation)
+        if nested is not None and field.is_relation and (field.many_to_one or field.one_to_one):
+            path = f"{prefix}{field.name}"
+            only_fields.add(path)
+            related.append(path)
+            _collect(field.related_model, nested, f"{path}__", only_fields, related)
+            continue
+        only_fields.add(f"{prefix}{field.name}")
+
+
+@lru_cache(maxsize=None)
+def get_projection(model, schema, fields=None):
+    """
+    응답 스키마가 직렬화하는 컬럼만 골라 (only 필드, select_related 경로)를 반환합니다.
+    정방향 FK/OneToOne에 중첩 스키마가 붙어 있으면 select_related로 함께 읽고 하위 스키마의 컬럼만 남깁니다.
+    fields(frozenset)를 넘기면 최상위 스키마에서 해당 필드만 대상으로 합니다.
+    """
+    only_fields = set()
+    related = []
+    _collect(model, schema, "", only_fields, related, fields)
+    return tuple(sorted(only_fields)), tuple(related)
+
+
+def project_queryset(queryset, schema, extra=(), fields=None):
+    """
+    queryset에 schema 기준의 `.only()`/`select_related` 를 적용합니다.
+    resolver가 스키마에 없는 컬럼을 읽는다면 extra로 넘겨 함께 불러옵니다.
+    """
+    only_fields, related = get_projection(queryset.model, schema, fields)
+    if related:
+        queryset = queryset.select_related(*related)
+    return queryset.only(*only_fields, *extra)
@@ -1,31 +1,121 @@
 # -*- coding: utf-8 -*-
+import base64
+import hashlib
+import hmac
+import json
+import logging
+import threading
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
 
-import boto3
-from botocore.config import Config
-from botocore.exceptions import ClientError
 from django.conf import settings
 
+from placeholder.utils.storage import BaseStorage, UploadResult
 
-class S3Service:
+logger = logging.getLogger(__name__)
+
+PRESIGNED_POST_CONDITIONS = [
+    {"success_action_status": "201"},
+    ["starts-with", "$Content-Type", "image/"],
+    ["content-length-range", 1024, 10485760],
+]
+
+# S3 multipart 업로드에서 마지막 파트를 제외한 파트의 최소 크기입니다.
+MULTIPART_MIN_PART_SIZE = 5 * 1024 * 1024
+
+
+@dataclass
+class _PooledClient:
+    session: object
+    client: object
+    created_at: float
+    post_urls: dict = field(default_factory=dict)
+
+
+_client_pool: dict = {}
+_client_pool_lock = threading.Lock()
+
+
+def _client_pool_key():
+    # 자격 증명이 교체되면 키가 바뀌어 새 클라이언트가 만들어집니다.
+    secret_digest = hashlib.sha256(settings.AWS_SECRET_ACCESS_KEY.encode()).hexdigest()
+    return (
+        settings.AWS_ACCESS_KEY_ID,
+        secret_digest,
+        settings.AWS_S3_REGION_NAME,
+        settings.AWS_S3_ENDPOINT_URL,
+    )
+
+
+def _create_pooled_client():
+    # boto3/botocore는 import 비용이 크므로 실제로 S3를 사용할 때 불러옵니다.
+    import boto3
+    from botocore.config import Config
+
+    my_config = Config(
+        region_name=settings.AWS_S3_REGION_NAME,
+        signature_version="s3v4",
+        retries={"max_attempts": 10, "mode": "standard"},
+    )
+    session = boto3.session.Session(
+        aws_access_key_id=settings.AWS_ACCESS_KEY_ID or None,
+        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY or None,
+    )
+    client = session.client("s3", config=my_config, endpoint_url=settings.AWS_S3_ENDPOINT_URL)
+    return _PooledClient(session=session, client=client, created_at=time.monotonic())
+
+
+def get_pooled_client():
+    """
+    프로세스 전역에서 공유하는 S3 클라이언트를 반환합니다.
+    boto3 클라이언트는 스레드 안전하지만 생성은 그렇지 않으므로 생성 구간만 잠급니다.
+    AWS_S3_CLIENT_MAX_AGE가 지나면 새로 만들어 갱신된 자격 증명을 다시 읽습니다.
+    """
+    key = _client_pool_key()
+    pooled = _client_pool.get(key)
+    if pooled and time.monotonic() - pooled.created_at < settings.AWS_S3_CLIENT_MAX_AGE:
+        return pooled
+
+    with _client_pool_lock:
+        pooled = _client_pool.get(key)
+        if pooled is None or time.monotonic() - pooled.created_at >= settings.AWS_S3_CLIENT_MAX_AGE:
+            pooled = _create_pooled_client()
+            _client_pool.clear()
+            _client_pool[key] = pooled
+        return pooled
+
+
+def clear_client_pool():
+    with _client_pool_lock:
+        _client_pool.clear()
+
+
+def _hmac_sha256(key, message):
+    return hmac.new(key, message.encode("utf-8"), hashlib.sha256).digest()
+
+
+class S3Service(BaseStorage):
     def __init__(self, bucket_name=None):
         self.bucket_name = bucket_name or settings.AWS_S3_MEDIA_BUCKET_NAME
 
     def _get_s3_client(self):
-        my_config = Config(
-            region_name="ap-southeast-2", signature_version="s3v4", retries={"max_attempts": 10, "mode": "standard"}
-        )
-        return boto3.client(
-            "s3",
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-            config=my_config,
-        )
+        return get_pooled_client().client
 
     def upload_file(self, file, key, content_type="application/octet-stream", bucket_name=None):
-        """파일을 S3에 직접 업로드합니다."""
+        """파일을 S3에 직접 업로드합니다. 큰 파일은 여러 파트로 나눠 동시에 올립니다."""
+        from boto3.s3.transfer import TransferConfig
+        from botocore.exceptions import ClientError
+
         bucket = bucket_name or self.bucket_name
         s3_client = self._get_s3_client()
+        config = TransferConfig(
+            multipart_threshold=settings.AWS_S3_MULTIPART_PART_SIZE,
+            multipart_chunksize=settings.AWS_S3_MULTIPART_PART_SIZE,
+            max_concurrency=settings.AWS_S3_MAX_CONCURRENCY,
+        )
 
         try:
             s3_client.upload_fileobj(
@@ -36,23 +126,156 @@ class S3Service:
                     "ContentType": content_type
                     # ACL 제거: 버킷이 ACL을 지원하지 않음
                 },
+                Config=config,
             )
             return True
         except ClientError as e:
-            print(f"Error uploading file to S3: {e}")
+            logger.error(f"Error uploading {key} to S3: {e}")
+            return False
+
+    def upload_stream(
+        self,
+        chunks,
+        key,
+        content_type="application/octet-stream",
+        bucket_name=None,
+        part_size=None,
+        max_concurrency=None,
+    ):
+        """
+        bytes를 내보내는 iterator/generator를 S3에 스트리밍 업로드합니다.
+        데이터가 생성되는 동안 part_size 단위로 잘라 최대 max_concurrency개의 파트를 동시에 올리며,
+        메모리에는 진행 중인 파트만 유지합니다. 한 파트에 못 미치는 작은 데이터는 put_object 한 번으로 올립니다.
+        실패하면 multipart 업로드를 중단(abort)하고 None을 반환합니다.
+        """
+        from botocore.exceptions import ClientError
+
+        bucket = bucket_name or self.bucket_name
+        s3_client = self._get_s3_client()
+        part_size = max(part_size or settings.AWS_S3_MULTIPART_PART_SIZE, MULTIPART_MIN_PART_SIZE)
+        max_concurrency = max_concurrency or settings.AWS_S3_MAX_CONCURRENCY
+
+        started = time.perf_counter()
+        sha256 = hashlib.sha256()
+        size = 0
+        upload_id = None
+        futures = []
+        slots = threading.BoundedSemaphore(max_concurrency)
+        executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="s3-upload")
+
+        def upload_part(part_number, body):
+            try:
+                response = s3_client.upload_part(
+                    Bucket=bucket,
+                    Key=key,
+                    UploadId=upload_id,
+                    PartNumber=part_number,
+                    Body=body,
+                    ContentMD5=base64.b64encode(hashlib.md5(body).digest()).decode(),
+                )
+                return {"PartNumber": part_number, "ETag": response["ETag"]}
+            finally:
+                slots.release()
+
+        def submit(body):
+            nonlocal upload_id
+            if upload_id is None:
+                response = s3_client.create_multipart_upload(Bucket=bucket, Key=key, ContentType=content_type)
+                upload_id = response["UploadId"]
+            # 동시에 메모리에 올라가는 파트 수를 max_concurrency로 제한합니다.
+            slots.acquire()
+            # 이미 실패한 파트가 있으면 나머지 데이터를 만들기 전에 중단합니다.
+            for future in futures:
+                if future.done() and future.exception():
+                    slots.release()
+                    raise future.exception()
+            futures.append(executor.submit(upload_part, len(futures) + 1, body))
+
+        try:
+            buffer = bytearray()
+            for chunk in chunks:
+                if not chunk:
+                    continue
+                sha256.update(chunk)
+                size += len(chunk)
+                buffer += chunk
+                while len(buffer) >= part_size:
+                    submit(bytes(buffer[:part_size]))
+                    del buffer[:part_size]
+
+            if upload_id is None:
+                s3_client.put_object(Bucket=bucket, Key=key, Body=bytes(buffer), ContentType=content_type)
+                parts = 1
+            else:
+                if buffer:
+                    submit(bytes(buffer))
+                completed = [future.result() for future in futures]
+                s3_client.complete_multipart_upload(
+                    Bucket=bucket, Key=key, UploadId=upload_id, MultipartUpload={"Parts": completed}
+                )
+                parts = len(completed)
+        except BaseException as e:
+            for future in futures:
+                future.cancel()
+            if upload_id is not None:
+                try:
+                    s3_client.abort_multipart_upload(Bucket=bucket, Key=key, UploadId=upload_id)
+                except ClientError as abort_error:
+                    logger.warning(f"Error aborting multipart upload of {key}: {abort_error}")
+            if isinstance(e, ClientError):
+                logger.error(f"Error uploading {key} to S3: {e}")
+                return None
+            raise
+        finally:
+            executor.shutdown(wait=True)
+
+        result = UploadResult(
+            key=key, size=size, parts=parts, sha256=sha256.hexdigest(), elapsed=time.perf_counter() - started
+        )
+        logger.info(
+            f"Uploaded {key}: {result.size} bytes in {result.parts} part(s), "
+            f"{result.elapsed:.2f}s ({result.throughput / 1048576:.2f} MiB/s)"
+        )
+        return result
+
+    def read_file(self, key, max_size=None, bucket_name=None):
+        """S3 객체를 읽어 bytes로 반환합니다."""
+        from botocore.exceptions import ClientError
+
+        bucket = bucket_name or self.bucket_name
+        s3_client = self._get_s3_client()
+
+        try:
+            response = s3_client.get_object(Bucket=bucket, Key=key)
+        except ClientError as e:
+            logger.warning(f"Error reading {key} from S3: {e}")
+            return None
+
+        if max_size is not None and response["ContentLength"] > max_size:
+            response["Body"].close()
+            return None
+        return response["Body"].read()
+
+    def delete_file(self, key, bucket_name=None):
+        from botocore.exceptions import ClientError
+
+        bucket = bucket_name or self.bucket_name
+        try:
+            self._get_s3_client().delete_object(Bucket=bucket, Key=key)
+            return True
+        except ClientError as e:
+            logger.error(f"Error deleting {key} from S3: {e}")
             return False
 
     def create_presigned_url(self, object_name, content_type, bucket_name=None, expiration=10):
+        from botocore.exceptions import ClientError
+
         bucket = bucket_name or self.bucket_name
         s3_client = self._get_s3_client()
 
         try:
             fields = {"Content-Type": content_type, "success_action_status": "201"}
-            conditions = [
-                {"success_action_status": "201"},
-                ["starts-with", "$Content-Type", "image/"],
-                ["content-length-range", 1024, 10485760],
-            ]
+            conditions = list(PRESIGNED_POST_CONDITIONS)
             response = s3_client.generate_presigned_post(
                 bucket, object_name, Fields=fields, Conditions=conditions, ExpiresIn=expiration
             )
@@ -69,3 +292,59 @@ class S3Service:
             response = self.create_presigned_url(path, type_)
             context["result"].append(response)
         return context
+
+    def create_batch_presigned_url(self, filepath, filetype_list: list, bucket_name=None, expiration=10):
+        """
+        여러 파일의 presigned POST를 한 번에 서명합니다.
+        하나의 클라이언트와 한 번 유도한 SigV4 서명 키로 모든 정책에 서명하므로
+        create_multi_presigned_url과 응답 형식은 같지만 파일 수만큼 botocore를 거치지 않습니다.
+        """
+        from botocore.exceptions import BotoCoreError, ClientError
+
+        bucket = bucket_name or self.bucket_name
+        pooled = get_pooled_client()
+        try:
+            url = self._get_post_url(pooled, bucket)
+            credentials = pooled.session.get_credentials().get_frozen_credentials()
+        except (BotoCoreError, ClientError, AttributeError):
+            return {"result": [None for _ in filetype_list]}
+
+        now = datetime.now(timezone.utc)
+        amz_date = now.strftime("%Y%m%dT%H%M%SZ")
+        datestamp = amz_date[:8]
+        region = pooled.client.meta.region_name
+        credential = f"{credentials.access_key}/{datestamp}/{region}/s3/aws4_request"
+        expires_at = (now + timedelta(seconds=expiration)).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+        signing_key = _hmac_sha256(f"AWS4{credentials.secret_key}".encode("utf-8"), datestamp)
+        for part in (region, "s3", "aws4_request"):
+            signing_key = _hmac_sha256(signing_key, part)
+
+        context = {"result": []}
+        for type_ in filetype_list:
+            ext = type_parts[1] if len(type_parts := type_.split("/")) == 2 else "jpg"
+            key = f"{filepath}/{uuid.uuid4()}.{ext}"
+
+            fields = {"Content-Type": type_, "success_action_status": "201", "key": key}
+            conditions = [*PRESIGNED_POST_CONDITIONS, {"bucket": bucket}, {"key": key}]
+            fields["x-amz-algorithm"] = "AWS4-HMAC-SHA256"
+            fields["x-amz-credential"] = credential
+            fields["x-amz-date"] = amz_date
+            conditions.append({"x-amz-algorithm": "AWS4-HMAC-SHA256"})
+            conditions.append({"x-amz-credential": credential})
+            conditions.append({"x-amz-date": amz_date})
+            if credentials.token is not None:
+                fields["x-amz-security-token"] = credentials.token
+                conditions.append({"x-amz-security-token": credentials.token})
+
+            policy = {"expiration": expires_at, "conditions": conditions}
+            fields["policy"] = base64.b64encode(json.dumps(policy).encode("utf-8")).decode("utf-8")
+            fields["x-amz-signature"] = _hmac_sha256(signing_key, fields["policy"]).hex()
+            context["result"].append({"url": url, "fields": fields})
+        return context
+
+    def _get_post_url(self, pooled, bucket):
+        # POST 대상 URL은 키와 무관하므로 버킷별로 한 번만 botocore의 엔드포인트 규칙으로 계산합니다.
+        if bucket not in pooled.post_urls:
+            pooled.post_urls[bucket] = pooled.client.generate_presigned_post(bucket, "_")["url"]
+        return pooled.post_urls[bucket]
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+import hashlib
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from io import BytesIO
+
+from django.conf import settings
+
+
+@dataclass(frozen=True)
+class UploadResult:
+    key: str
+    size: int
+    parts: int
+    sha256: str
+    elapsed: float
+
+    @property
+    def throughput(self):
+        """초당 업로드한 바이트 수"""
+        return self.size / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class BaseStorage(ABC):
+    """미디어 파일 저장소 인터페이스"""
+
+    @abstractmethod
+    def read_file(self, key, max_size=None, bucket_name=None):
+        """key의 내용을 bytes로 반환합니다. 없거나 max_size를 넘으면 None을 반환합니다."""
+
+    @abstractmethod
+    def upload_file(self, file, key, content_type="application/octet-stream", bucket_name=None):
+        """파일 객체를 key에 저장하고 성공 여부를 반환합니다."""
+
+    @abstractmethod
+    def delete_file(self, key, bucket_name=None):
+        """key의 파일을 삭제하고 성공 여부를 반환합니다."""
+
+    @abstractmethod
+    def create_batch_presigned_url(self, filepath, filetype_list: list, bucket_name=None, expiration=10):
+        """클라이언트가 직접 업로드할 수 있도록 파일 타입별 presigned POST 정보를 만듭니다."""
+
+    def upload_stream(self, chunks, key, content_type="application/octet-stream", bucket_name=None, **kwargs):
+        """
+        bytes iterator를 key에 저장하고 UploadResult를 반환합니다. 실패하면 None을 반환합니다.
+        기본 구현은 메모리에 모은 뒤 upload_file로 올리며, 저장소별로 스트리밍 구현을 제공합니다.
+        """
+        started = time.perf_counter()
+        sha256 = hashlib.sha256()
+        buffer = BytesIO()
+        for chunk in chunks:
+            sha256.update(chunk)
+            buffer.write(chunk)
+        size = buffer.tell()
+        buffer.seek(0)
+        if not self.upload_file(buffer, key, content_type=content_type, bucket_name=bucket_name):
+            return None
+        elapsed = time.perf_counter() - started
+        return UploadResult(key=key, size=size, parts=1, sha256=sha256.hexdigest(), elapsed=elapsed)
+
+
+def get_storage():
+    """MEDIA_STORAGE_BACKEND 설정에 맞는 저장소를 반환합니다."""
+    if settings.MEDIA_STORAGE_BACKEND == "local":
+        from placeholder.utils.local_storage import LocalStorage
+
+        return LocalStorage()
+
+    from placeholder.utils.s3 import S3Service
+
+    return S3Service()
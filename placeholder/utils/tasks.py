@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.BACKGROUND_TASK_WORKERS, thread_name_prefix="background-task"
+                )
+    return _executor
+
+
+def _run(func, args, kwargs):
+    close_old_connections()
+    try:
+        return func(*args, **kwargs)
+    except Exception as e:
+        logger.error(f"Background task {func.__name__} failed: {e}", exc_info=True)
+    finally:
+        close_old_connections()
+
+
+def enqueue(func, *args, **kwargs):
+    """
+    현재 트랜잭션이 커밋된 뒤 워커 스레드에서 func를 실행합니다.
+    BACKGROUND_TASKS_EAGER가 켜져 있으면 커밋 직후 같은 스레드에서 실행합니다. (테스트용)
+    """
+    if settings.BACKGROUND_TASKS_EAGER:
+        transaction.on_commit(lambda: func(*args, **kwargs))
+    else:
+        transaction.on_commit(lambda: _get_executor().submit(_run, func, args, kwargs))
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+import logging
+import time
+
+from django.db import connections
+from django.urls import get_resolver
+
+logger = logging.getLogger(__name__)
+
+
+def load_routes():
+    """URLConf와 모든 Ninja 라우터를 불러옵니다."""
+    get_resolver().url_patterns
+
+
+def build_response_schemas():
+    """모든 요청/응답 스키마의 JSON 스키마와 OpenAPI 문서를 미리 만들어 둡니다."""
+    from placeholder.apis import api
+
+    api.get_openapi_schema()
+
+
+def build_availability_indexes():
+    """이메일/닉네임 중복 확인에 쓰는 availability index를 만듭니다."""
+    from user.availability import build_availability_indexes
+
+    build_availability_indexes()
+
+
+WARMUP_STEPS = [
+    load_routes,
+    build_response_schemas,
+    build_availability_indexes,
+]
+
+
+def warm_up():
+    """
+    워커가 첫 요청을 받기 전에 초기화 비용을 미리 지불합니다.
+    워밍업은 최적화일 뿐이므로 실패한 단계는 기록만 하고 계속 진행합니다.
+    """
+    timings = {}
+    for step in WARMUP_STEPS:
+        started = time.perf_counter()
+        try:
+            step()
+        except Exception as e:
+            logger.warning(f"Warm-up step {step.__name__} failed: {e}", exc_info=True)
+        timings[step.__name__] = time.perf_counter() - started
+
+    logger.info("Worker warm-up finished: " + ", ".join(f"{name}={sec * 1000:.1f}ms" for name, sec in timings.items()))
+    return timings
+
+
+def close_db_connections():
+    """
+    워밍업 단계에서 연 DB 커넥션을 닫습니다.
+    lifespan 스레드의 커넥션은 요청 처리에 재사용되지 않으므로 남겨두면 유휴 커넥션만 늘어납니다.
+    """
+    connections.close_all()
@@ -25,6 +25,12 @@ def django_db_setup(django_db_setup, django_db_blocker):
         call_command("migrate", "--run-syncdb")
 
 
+@pytest.fixture(autouse=True)
+def eager_background_tasks(settings):
+    """백그라운드 작업(삭제 등)을 같은 스레드에서 실행해 테스트 DB 정리와 겹치지 않게 합니다."""
+    settings.BACKGROUND_TASKS_EAGER = True
+
+
 @pytest.fixture(autouse=True)
 def clean_db_after_test(transactional_db):
     """각 테스트 후 트랜잭션 롤백으로 데이터베이스 정리"""
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.test import Client, RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from meetup.access import AccessLevel, load
+from meetup.models import Member, Schedule, ScheduleComment
+from placeholder.utils.exceptions import ForbiddenException, NotFoundException
+from tests.conftest import APITestCase
+
+
+@pytest.fixture
+def schedule(create_meetup):
+    return Schedule.objects.create(
+        meetup=create_meetup,
+        scheduled_at=timezone.now() + timedelta(days=1),
+        place="강남역",
+        address="서울",
+        latitude="37.4979",
+        longitude="127.0276",
+        memo="첫 모임",
+    )
+
+
+def _request(user):
+    request = RequestFactory().get("/")
+    request.auth = user
+    return request
+
+
+@pytest.mark.django_db
+class TestAccessLoader:
+    """권한 로더 테스트"""
+
+    def test_loads_object_with_flags_in_one_query(self, schedule, create_organizer):
+        """대상 객체와 모임원/모임장 여부를 한 번에 가져오고 같은 요청에서는 다시 조회하지 않는다"""
+        request = _request(create_organizer)
+
+        with CaptureQueriesContext(connection) as ctx:
+            loaded = load(request, Schedule, schedule.id)
+            assert load(request, Schedule, schedule.id) is loaded
+
+        assert len(ctx.captured_queries) == 1
+        assert loaded.is_member and loaded.is_organizer
+        assert loaded.access_role == Member.MemberRole.ORGANIZER.value
+
+    def test_rejects_missing_object_and_non_member(self, schedule, create_user):
+        """없는 객체는 404, 모임원이 아니면 403, 모임장 전용이면 모임원도 403"""
+        request = _request(create_user)
+
+        with pytest.raises(NotFoundException):
+            load(request, Schedule, 999999)
+        with pytest.raises(ForbiddenException):
+            load(request, Schedule, schedule.id)
+
+        Member.objects.create(user=create_user, meetup=schedule.meetup)
+        with pytest.raises(ForbiddenException):
+            load(_request(create_user), Schedule, schedule.id, AccessLevel.ORGANIZER)
+
+
+@pytest.mark.django_db
+class TestScheduleCommentAccessAPI(APITestCase):
+    """스케줄 댓글 권한 API 테스트"""
+
+    def setup_method(self):
+        self.client = Client()
+
+    def test_reply_requires_membership(self, schedule, create_organizer, create_user):
+        """모임원이 아니면 다른 사람의 댓글에 답글을 달 수 없다"""
+        comment = ScheduleComment.objects.create(user=create_organizer, schedule=schedule, text="안녕하세요")
+
+        response = self.client.post(
+            f"/api/v1/schedule-comment/{comment.id}/reply",
+            {"text": "답글"},
+            content_type="application/json",
+            **self.get_auth_headers(create_user),
+        )
+
+        assert response.status_code == 403
+
+    def test_comment_list_only_contains_schedule_comments(self, schedule, create_organizer):
+        """댓글 목록은 해당 스케줄의 댓글만 내려준다"""
+        other = Schedule.objects.create(
+            meetup=schedule.meetup,
+            scheduled_at=schedule.scheduled_at,
+            place="역삼역",
+            address="서울",
+            latitude="37.5",
+            longitude="127.03",
+            memo="두 번째 모임",
+        )
+        ScheduleComment.objects.create(user=create_organizer, schedule=schedule, text="첫 번째")
+        ScheduleComment.objects.create(user=create_organizer, schedule=other, text="두 번째")
+
+        response = self.client.get(
+            f"/api/v1/schedule/{schedule.id}/comment", **self.get_auth_headers(create_organizer)
+        )
+
+        assert [comment["text"] for comment in response.json()["result"]] == ["첫 번째"]
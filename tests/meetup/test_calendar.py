@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+from datetime import timedelta
+
+import pytest
+from django.test import Client
+from django.utils import timezone
+
+from meetup.models import Meetup, Member, Schedule
+from tests.conftest import APITestCase
+
+
+def _schedule(meetup, days, memo="정기 모임"):
+    return Schedule.objects.create(
+        meetup=meetup,
+        scheduled_at=timezone.now() + timedelta(days=days),
+        place="강남역",
+        address="서울, 강남구",
+        latitude="37.4979",
+        longitude="127.0276",
+        memo=memo,
+    )
+
+
+@pytest.mark.django_db
+class TestCalendarAPI(APITestCase):
+    """캘린더 API 테스트"""
+
+    def setup_method(self):
+        self.client = Client()
+
+    def test_calendar_returns_schedules_of_my_meetups_in_range(self, create_meetup, create_user):
+        """내가 속한 모임의 기간 안 일정만 시간순으로 내려준다"""
+        Member.objects.create(user=create_user, meetup=create_meetup)
+        soon = _schedule(create_meetup, 1)
+        _schedule(create_meetup, 60)
+        today = timezone.localdate()
+
+        response = self.client.get(
+            "/api/v1/user/me/calendar",
+            {"start": today.isoformat(), "end": (today + timedelta(days=7)).isoformat()},
+            **self.get_auth_headers(create_user),
+        )
+
+        assert response.status_code == 200
+        assert [(item["id"], item["meetupName"]) for item in response.json()["result"]] == [
+            (soon.id, create_meetup.name)
+        ]
+
+    def test_calendar_rejects_too_long_range(self, create_user):
+        """최대 기간을 넘으면 400을 반환한다"""
+        today = timezone.localdate()
+
+        response = self.client.get(
+            "/api/v1/user/me/calendar",
+            {"start": today.isoformat(), "end": (today + timedelta(days=400)).isoformat()},
+            **self.get_auth_headers(create_user),
+        )
+
+        assert response.status_code == 400
+
+    def test_feed_streams_events_and_supports_conditional_get(self, create_meetup, create_organizer):
+        """구독 주소로 iCalendar를 받고 변경이 없으면 304를 받는다"""
+        _schedule(create_meetup, 1, memo="첫 모임; 준비물, 없음")
+        response = self.client.post("/api/v1/user/me/calendar/feed", **self.get_auth_headers(create_organizer))
+        url = response.json()["url"]
+        path = url.split("testserver", 1)[1]
+
+        response = self.client.get(path)
+        assert response.status_code == 200
+        body = b"".join(response.streaming_content).decode()
+        assert body.startswith("BEGIN:VCALENDAR\r\n")
+        assert r"SUMMARY:[테스트 모임] 첫 모임\; 준비물\, 없음" in body
+
+        assert self.client.get(path, HTTP_IF_NONE_MATCH=response["ETag"]).status_code == 304
+        assert self.client.get("/calendar/unknown.ics").status_code == 404
+
+    def test_feed_etag_changes_with_membership_and_deleted_schedules(
+        self, create_meetup, create_organizer, create_user
+    ):
+        """일정을 지우고 예전 일정이 있는 모임에 가입해 일정 수가 같아도 ETag가 바뀐다"""
+        other_meetup = Meetup.objects.create(
+            organizer=create_user,
+            name="다른 모임",
+            ad_title="다른 모임 광고",
+            started_at=create_meetup.started_at,
+            ended_at=create_meetup.ended_at,
+            ad_ended_at=create_meetup.ad_ended_at,
+        )
+        _schedule(other_meetup, 2)
+        schedule = _schedule(create_meetup, 1)
+        response = self.client.post("/api/v1/user/me/calendar/feed", **self.get_auth_headers(create_organizer))
+        path = response.json()["url"].split("testserver", 1)[1]
+        response = self.client.get(path)
+        etag = response["ETag"]
+        assert not response.has_header("Last-Modified")
+
+        schedule.delete()
+        Member.objects.create(user=create_organizer, meetup=other_meetup)
+
+        response = self.client.get(path, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+        assert response["ETag"] != etag
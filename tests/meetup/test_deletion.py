@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+import pytest
+from django.test import Client
+
+from meetup.deletion import MEETUP_TARGET, delete_meetup_later, resume_deletion_jobs
+from meetup.models import DeletionJob, Meetup, MeetupComment, Member, Proposal
+from tests.conftest import APITestCase
+
+
+@pytest.mark.django_db
+class TestBackgroundDeletion(APITestCase):
+    """tombstone 후 백그라운드에서 나눠 지우는 삭제 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def deletion_settings(self, settings):
+        settings.BACKGROUND_TASKS_EAGER = True
+        settings.DELETION_BATCH_SIZE = 1
+
+    def setup_method(self):
+        self.client = Client()
+
+    def test_delete_meetup_removes_dependents(self, create_meetup_with_member, create_organizer, create_user):
+        """모임 삭제 요청 후 연관 데이터가 배치로 모두 지워지고 진행 상황이 기록된다"""
+        meetup = create_meetup_with_member
+        Proposal.objects.create(user=create_user, meetup=meetup)
+        MeetupComment.objects.create(user=create_user, meetup=meetup, text="댓글")
+
+        response = self.client.delete(f"/api/v1/meetup/{meetup.id}", **self.get_auth_headers(create_organizer))
+
+        assert response.status_code == 204
+        assert not Meetup.all_objects.filter(pk=meetup.pk).exists()
+        assert not Member.objects.filter(meetup_id=meetup.pk).exists()
+        assert not Proposal.objects.filter(meetup_id=meetup.pk).exists()
+        job = DeletionJob.objects.get(target=MEETUP_TARGET, target_id=meetup.pk)
+        assert job.status == DeletionJob.DeletionStatus.DONE.value
+        assert job.deleted_count == 5
+
+    def test_tombstoned_meetup_is_hidden_until_purged(self, create_meetup, monkeypatch):
+        """삭제 작업이 끝나기 전에도 모임은 조회되지 않고, 중단된 작업은 다시 실행할 수 있다"""
+        # 워커로 넘기지 않아 작업이 중단된 상태를 흉내 냅니다.
+        monkeypatch.setattr("meetup.deletion.enqueue", lambda *args, **kwargs: None)
+        delete_meetup_later(create_meetup)
+
+        assert not Meetup.objects.filter(pk=create_meetup.pk).exists()
+        assert self.client.get(f"/api/v1/meetup/{create_meetup.id}").status_code == 404
+        assert Meetup.all_objects.filter(pk=create_meetup.pk).exists()
+
+        resume_deletion_jobs()
+
+        assert not Meetup.all_objects.filter(pk=create_meetup.pk).exists()
+
+    def test_delete_user_tombstones_user_and_meetups(self, create_meetup, create_organizer):
+        """탈퇴하면 사용자와 사용자가 만든 모임이 함께 지워진다"""
+        response = self.client.delete("/api/v1/user/me", **self.get_auth_headers(create_organizer))
+
+        assert response.status_code == 204
+        assert not Meetup.all_objects.filter(pk=create_meetup.pk).exists()
+        assert not type(create_organizer).all_objects.filter(pk=create_organizer.pk).exists()
@@ -6,7 +6,7 @@ import pytest
 from django.contrib.auth import get_user_model
 from django.test import Client
 
-from meetup.models import Meetup, MeetupLike
+from meetup.models import Meetup, MeetupLike, Proposal
 from meetup.models.member import Member
 from tests.conftest import APITestCase
 
@@ -69,6 +69,28 @@ class TestMeetupAPI(APITestCase):
         assert response_data["id"] == create_meetup.id
         assert response_data["name"] == create_meetup.name
 
+    def test_get_meetups_sparse_fields(self, create_meetup_with_member):
+        """fields= 로 요청한 필드만 목록 항목에 내려준다"""
+        response = self.client.get(self.meetup_url, {"fields": "id,adTitle,likeCount"})
+
+        assert response.status_code == 200
+        response_data = response.json()
+        assert response_data["total"] >= 1
+        assert set(response_data["result"][0]) == {"id", "adTitle", "likeCount"}
+
+    def test_get_meetup_detail_sparse_fields(self, create_meetup):
+        """상세 조회도 fields= 를 지원하고 resolver 필드를 함께 고를 수 있다"""
+        response = self.client.get(f"{self.meetup_url}/{create_meetup.id}", {"fields": "name,commentCount,imageWebp"})
+
+        assert response.status_code == 200
+        assert response.json() == {"name": create_meetup.name, "commentCount": 0, "imageWebp": None}
+
+    def test_get_meetups_invalid_fields(self, create_meetup):
+        """스키마에 없는 필드를 요청하면 400을 반환한다"""
+        response = self.client.get(self.meetup_url, {"fields": "id,password"})
+
+        assert response.status_code == 400
+
 
 @pytest.mark.django_db
 class TestMeetupLikeAPI(APITestCase):
@@ -96,3 +118,43 @@ class TestMeetupLikeAPI(APITestCase):
         response = self.client.post(like_url)
 
         assert response.status_code == 401
+
+
+@pytest.mark.django_db
+class TestMeetupRelationshipAPI(APITestCase):
+    """모임 관계 일괄 조회 API 테스트"""
+
+    def setup_method(self):
+        self.client = Client()
+
+    def test_relationships_for_many_meetups(self, create_meetup, create_organizer, create_user):
+        """모임마다 모임원/역할/신청 상태/좋아요/모임장 여부를 요청 순서대로 내려준다"""
+        Proposal.objects.create(user=create_user, meetup=create_meetup)
+        MeetupLike.objects.create(user=create_user, meetup=create_meetup)
+        url = "/api/v1/meetup/relationships"
+
+        response = self.client.get(url, {"ids": [create_meetup.id, 999999]}, **self.get_auth_headers(create_user))
+        assert response.status_code == 200
+        assert response.json()["result"] == [
+            {
+                "meetupId": create_meetup.id,
+                "isMember": False,
+                "role": None,
+                "proposalStatus": "pending",
+                "isLike": True,
+                "isOrganizer": False,
+            }
+        ]
+
+        organizer = self.client.get(url, {"ids": [create_meetup.id]}, **self.get_auth_headers(create_organizer))
+        assert organizer.json()["result"][0]["role"] == Member.MemberRole.ORGANIZER.value
+        assert organizer.json()["result"][0]["isOrganizer"] is True
+
+    def test_relationship_cache_is_invalidated(self, create_meetup, create_user):
+        """가입하면 캐시된 관계도 바로 바뀐다"""
+        url = "/api/v1/meetup/relationships"
+        headers = self.get_auth_headers(create_user)
+
+        assert self.client.get(url, {"ids": [create_meetup.id]}, **headers).json()["result"][0]["isMember"] is False
+        Member.objects.create(user=create_user, meetup=create_meetup)
+        assert self.client.get(url, {"ids": [create_meetup.id]}, **headers).json()["result"][0]["isMember"] is True
@@ -161,3 +161,41 @@ class TestMemberStats:
 
         # 기존 참가 수 + 새로 추가한 모임 = initial_count + 1
         assert joined_meetups_count == initial_count + 1
+
+
+@pytest.mark.django_db
+class TestMemberRosterAPI(APITestCase):
+    """모임원 명단 API 테스트"""
+
+    def setup_method(self):
+        self.client = Client()
+
+    def test_roster_pages_members_with_role_counts(self, create_meetup, create_organizer):
+        """모임장부터 커서로 모든 모임원을 내려주고 역할별 인원 수를 함께 준다"""
+        for index in range(4):
+            user = User.objects.create_user(
+                email=f"roster{index}@example.com", password="Test123!", nickname=f"명단{index}"
+            )
+            Member.objects.create(user=user, meetup=create_meetup)
+        headers = self.get_auth_headers(create_organizer)
+        url = f"/api/v1/meetup/{create_meetup.id}/member/roster"
+
+        data = self.client.get(url, {"size": 2}, **headers).json()
+        assert data["counts"] == {"organizer": 1, "member": 4}
+        assert data["result"][0]["user"]["nickname"] == create_organizer.nickname
+
+        seen = [item["id"] for item in data["result"]]
+        while data["next"]:
+            data = self.client.get(url, {"size": 2, "cursor": data["next"]}, **headers).json()
+            seen += [item["id"] for item in data["result"]]
+        assert sorted(seen) == sorted(Member.objects.filter(meetup=create_meetup).values_list("id", flat=True))
+
+    def test_roster_reflects_join_and_requires_membership(self, create_meetup, create_organizer, create_user):
+        """모임원이 아니면 403, 가입하면 캐시된 명단에도 바로 반영된다"""
+        url = f"/api/v1/meetup/{create_meetup.id}/member/roster"
+        assert self.client.get(url, **self.get_auth_headers(create_user)).status_code == 403
+
+        headers = self.get_auth_headers(create_organizer)
+        assert self.client.get(url, **headers).json()["total"] == 1
+        Member.objects.create(user=create_user, meetup=create_meetup)
+        assert self.client.get(url, **headers).json()["total"] == 2
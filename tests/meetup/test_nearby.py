@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+from datetime import timedelta
+
+import pytest
+from django.test import Client
+from django.utils import timezone
+
+from meetup.models import Schedule
+from placeholder.utils.geo import bounding_box, cell_for, cell_ranges, haversine_km
+from tests.conftest import APITestCase
+
+
+def _schedule(meetup, latitude, longitude, **kwargs):
+    return Schedule.objects.create(
+        meetup=meetup,
+        scheduled_at=kwargs.pop("scheduled_at", timezone.now() + timedelta(days=1)),
+        place="장소",
+        address="서울",
+        latitude=latitude,
+        longitude=longitude,
+        memo="메모",
+        **kwargs,
+    )
+
+
+class TestGeoUtils:
+    """격자 칸/거리 계산 테스트"""
+
+    def test_cell_ranges_cover_points_in_box(self):
+        """사각형 안의 점이 속한 칸은 반환한 범위 중 하나에 들어간다"""
+        ranges = cell_ranges(37.49, 37.52, 127.01, 127.05)
+        for lat, lng in [(37.49, 127.01), (37.505, 127.03), (37.52, 127.05)]:
+            cell = cell_for(lat, lng)
+            assert any(start <= cell <= end for start, end in ranges)
+
+    def test_max_radius_uses_row_ranges(self, settings):
+        """최대 반경의 사각형도 행별 범위로 나뉘어 경도 밖의 칸을 포함하지 않는다"""
+        min_lat, max_lat, min_lng, max_lng = bounding_box(37.5, 127.0, settings.GEO_NEARBY_MAX_RADIUS_KM)
+        ranges = cell_ranges(min_lat, max_lat, min_lng, max_lng)
+
+        assert len(ranges) > 1
+        assert all(end - start <= (max_lng - min_lng) / 0.01 + 1 for start, end in ranges)
+
+    def test_haversine_distance(self):
+        """서울역-강남역 거리는 약 8km"""
+        assert haversine_km(37.5547, 126.9707, [(37.4979, 127.0276)])[0] == pytest.approx(8.0, abs=1.0)
+
+
+@pytest.mark.django_db
+class TestNearbyScheduleAPI(APITestCase):
+    """주변 일정 검색 API 테스트"""
+
+    def setup_method(self):
+        self.client = Client()
+
+    def test_saving_schedule_fills_numeric_coordinates(self, create_meetup):
+        """문자열 좌표를 저장하면 숫자 좌표와 격자 칸이 함께 저장된다"""
+        schedule = _schedule(create_meetup, "37.4979", "127.0276")
+        schedule.refresh_from_db()
+
+        assert schedule.lat == pytest.approx(37.4979)
+        assert schedule.geo_cell == cell_for(37.4979, 127.0276)
+        assert _schedule(create_meetup, "", "").geo_cell is None
+
+    def test_nearby_filters_by_radius(self, create_meetup):
+        """반경 안의 예정된 일정만 가까운 순으로 내려주고 모임을 함께 준다"""
+        gangnam = _schedule(create_meetup, "37.4979", "127.0276")
+        yeoksam = _schedule(create_meetup, "37.5006", "127.0364")
+        _schedule(create_meetup, "35.1796", "129.0756")  # 부산
+        _schedule(create_meetup, "37.4980", "127.0277", scheduled_at=timezone.now() - timedelta(days=1))
+
+        response = self.client.get("/api/v1/schedule/nearby", {"lat": 37.4979, "lng": 127.0276, "radius": 3})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["id"] for item in data["result"]] == [gangnam.id, yeoksam.id]
+        assert data["meetups"][0]["id"] == create_meetup.id
+        assert data["meetups"][0]["scheduleCount"] == 2
+
+    def test_nearby_caps_candidates_by_distance(self, create_meetup, settings):
+        """후보 수를 넘으면 가까운 일정부터 가져온다"""
+        settings.GEO_NEARBY_MAX_CANDIDATES = 1
+        _schedule(create_meetup, "37.5006", "127.0364")
+        gangnam = _schedule(create_meetup, "37.4979", "127.0276")
+
+        response = self.client.get("/api/v1/schedule/nearby", {"lat": 37.4979, "lng": 127.0276, "radius": 3})
+
+        assert [item["id"] for item in response.json()["result"]] == [gangnam.id]
+
+    def test_viewport_and_invalid_bbox(self, create_meetup):
+        """지도 화면 안의 일정을 내려주고 잘못된 영역은 400을 반환한다"""
+        gangnam = _schedule(create_meetup, "37.4979", "127.0276")
+        _schedule(create_meetup, "35.1796", "129.0756")
+
+        response = self.client.get("/api/v1/schedule/nearby", {"bbox": "37.4,126.9,37.6,127.1"})
+        assert [item["id"] for item in response.json()["result"]] == [gangnam.id]
+        assert self.client.get("/api/v1/schedule/nearby", {"bbox": "broken"}).status_code == 400
@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+import pytest
+from django.contrib.auth import get_user_model
+from django.test import Client
+
+from meetup.models import Meetup, Member, Proposal
+from meetup.proposal_state import create_proposal
+from notification.models import Notification
+from tests.conftest import APITestCase
+
+User = get_user_model()
+
+
+@pytest.fixture
+def applicants(db):
+    return [
+        User.objects.create_user(email=f"applicant{i}@example.com", password="Test123!", nickname=f"신청자{i}")
+        for i in range(5)
+    ]
+
+
+@pytest.mark.django_db
+class TestProposalInboxAPI(APITestCase):
+    """모임장 신청함 API 테스트"""
+
+    def setup_method(self):
+        self.client = Client()
+
+    def test_inbox_counts_and_cursor_paging(self, create_meetup, create_organizer, applicants):
+        """상태별 신청 수를 내려주고 커서로 모든 신청서를 중복 없이 순회한다"""
+        for index, applicant in enumerate(applicants):
+            status = Proposal.ProposalStatus.ACCEPTANCE if index < 2 else Proposal.ProposalStatus.PENDING
+            Proposal.objects.create(user=applicant, meetup=create_meetup, status=status.value)
+        headers = self.get_auth_headers(create_organizer)
+        url = f"/api/v1/meetup/{create_meetup.id}/proposal/inbox"
+
+        response = self.client.get(url, {"size": 2}, **headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["counts"] == {"pending": 3, "acceptance": 2, "refuse": 0, "ignore": 0}
+
+        seen = [item["id"] for item in data["result"]]
+        while data["next"]:
+            data = self.client.get(url, {"size": 2, "cursor": data["next"]}, **headers).json()
+            seen += [item["id"] for item in data["result"]]
+
+        assert sorted(seen) == sorted(Proposal.objects.values_list("id", flat=True))
+        assert len(seen) == len(set(seen))
+
+    def test_inbox_filters_by_status(self, create_meetup, create_organizer, applicants):
+        """status를 지정하면 해당 상태의 신청서만 내려준다"""
+        Proposal.objects.create(user=applicants[0], meetup=create_meetup)
+        Proposal.objects.create(user=applicants[1], meetup=create_meetup, status=Proposal.ProposalStatus.REFUSE.value)
+
+        response = self.client.get(
+            f"/api/v1/meetup/{create_meetup.id}/proposal/inbox",
+            {"status": "refuse"},
+            **self.get_auth_headers(create_organizer),
+        )
+
+        assert [item["user"]["nickname"] for item in response.json()["result"]] == [applicants[1].nickname]
+
+    def test_inbox_rejects_invalid_cursor_and_non_organizer(self, create_meetup, create_organizer, create_user):
+        """잘못된 커서는 400, 모임장이 아니면 403을 반환한다"""
+        url = f"/api/v1/meetup/{create_meetup.id}/proposal/inbox"
+
+        assert self.client.get(url, {"cursor": "broken"}, **self.get_auth_headers(create_organizer)).status_code == 400
+        assert self.client.get(url, **self.get_auth_headers(create_user)).status_code == 403
+
+
+@pytest.mark.django_db
+class TestProposalBulkDecisionAPI(APITestCase):
+    """신청서 일괄 처리 API 테스트"""
+
+    def setup_method(self):
+        self.client = Client()
+
+    def test_bulk_accept_reports_outcome_per_id(self, create_meetup, create_organizer, create_user, applicants):
+        """대기 신청은 수락하고, 없는/권한 없는/이미 처리된 신청은 id별 결과로 알려준다"""
+        pending = [Proposal.objects.create(user=applicant, meetup=create_meetup) for applicant in applicants[:3]]
+        refused = Proposal.objects.create(
+            user=applicants[3], meetup=create_meetup, status=Proposal.ProposalStatus.REFUSE.value
+        )
+        other_meetup = Meetup.objects.create(
+            organizer=create_user,
+            name="다른 모임",
+            ad_title="다른 모임 광고",
+            started_at=create_meetup.started_at,
+            ended_at=create_meetup.ended_at,
+            ad_ended_at=create_meetup.ad_ended_at,
+        )
+        foreign = Proposal.objects.create(user=applicants[4], meetup=other_meetup)
+        ids = [proposal.id for proposal in pending] + [refused.id, foreign.id, 999999]
+
+        response = self.client.post(
+            "/api/v1/proposal/bulk",
+            {"ids": ids, "action": "acceptance"},
+            content_type="application/json",
+            **self.get_auth_headers(create_organizer),
+        )
+
+        assert response.status_code == 200
+        outcomes = {item["id"]: item["outcome"] for item in response.json()["result"]}
+        assert outcomes == {
+            **{proposal.id: "updated" for proposal in pending},
+            refused.id: "invalid_status",
+            foreign.id: "forbidden",
+            999999: "not_found",
+        }
+        assert Member.objects.filter(meetup=create_meetup, user__in=applicants[:3]).count() == 3
+        assert Notification.objects.filter(model_id__in=[proposal.id for proposal in pending]).count() == 3
+        assert Proposal.objects.get(id=foreign.id).status == Proposal.ProposalStatus.PENDING.value
+
+    def test_bulk_accept_keeps_existing_members(self, create_meetup, create_organizer, applicants):
+        """이미 모임원인 신청자는 중복 없이 그대로 둔다"""
+        proposal = Proposal.objects.create(user=applicants[0], meetup=create_meetup)
+        Member.objects.create(user=applicants[0], meetup=create_meetup)
+
+        response = self.client.post(
+            "/api/v1/proposal/bulk",
+            {"ids": [proposal.id], "action": "acceptance"},
+            content_type="application/json",
+            **self.get_auth_headers(create_organizer),
+        )
+
+        assert response.json()["result"] == [{"id": proposal.id, "outcome": "updated"}]
+        assert Member.objects.filter(meetup=create_meetup, user=applicants[0]).count() == 1
+
+
+@pytest.mark.django_db
+class TestProposalStateTransition(APITestCase):
+    """신청서 상태 전이 테스트"""
+
+    def setup_method(self):
+        self.client = Client()
+
+    def test_decided_proposal_can_be_decided_again(self, create_meetup, create_organizer, create_user):
+        """단건 API는 기존처럼 수락한 신청서를 다시 수락하거나 거절할 수 있다"""
+        proposal = Proposal.objects.create(user=create_user, meetup=create_meetup)
+        headers = self.get_auth_headers(create_organizer)
+
+        assert self.client.post(f"/api/v1/proposal/{proposal.id}/acceptance", **headers).status_code == 200
+        assert self.client.post(f"/api/v1/proposal/{proposal.id}/acceptance", **headers).status_code == 200
+        response = self.client.post(f"/api/v1/proposal/{proposal.id}/refuse", **headers)
+
+        assert response.status_code == 200
+        assert response.json()["status"] == Proposal.ProposalStatus.REFUSE.value
+        assert Member.objects.filter(meetup=create_meetup, user=create_user).count() == 1
+
+    def test_bulk_does_not_decide_again(self, create_meetup, create_organizer, create_user):
+        """bulk로는 수락한 신청서를 다시 거절하지 않고 상태를 그대로 둔다"""
+        proposal = Proposal.objects.create(
+            user=create_user, meetup=create_meetup, status=Proposal.ProposalStatus.ACCEPTANCE.value
+        )
+
+        response = self.client.post(
+            "/api/v1/proposal/bulk",
+            {"ids": [proposal.id], "action": "refuse"},
+            content_type="application/json",
+            **self.get_auth_headers(create_organizer),
+        )
+
+        assert response.json()["result"] == [{"id": proposal.id, "outcome": "invalid_status"}]
+        assert Proposal.objects.get(id=proposal.id).status == Proposal.ProposalStatus.ACCEPTANCE.value
+
+    def test_ignored_proposal_can_be_accepted(self, create_meetup, create_organizer, create_user):
+        """무시한 신청서는 나중에 수락할 수 있다"""
+        proposal = Proposal.objects.create(
+            user=create_user, meetup=create_meetup, status=Proposal.ProposalStatus.IGNORE.value
+        )
+
+        response = self.client.post(
+            f"/api/v1/proposal/{proposal.id}/acceptance", **self.get_auth_headers(create_organizer)
+        )
+
+        assert response.status_code == 200
+        assert response.json()["status"] == Proposal.ProposalStatus.ACCEPTANCE.value
+
+    def test_create_proposal_ignores_duplicate(self, create_meetup, create_user):
+        """같은 모임에 두 번 신청하면 두 번째는 None을 반환하고 신청서는 하나만 남는다"""
+        first = create_proposal(create_user.id, create_meetup.id, "첫 신청")
+
+        assert first.id and first.status == Proposal.ProposalStatus.PENDING.value
+        assert create_proposal(create_user.id, create_meetup.id, "두 번째 신청") is None
+        assert Proposal.objects.filter(user=create_user, meetup=create_meetup).count() == 1
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from meetup.models import Schedule, ScheduleComment
+from tests.conftest import APITestCase
+
+User = get_user_model()
+
+
+@pytest.fixture
+def schedules(create_meetup, create_organizer):
+    participants = [
+        User.objects.create_user(email=f"participant{i}@example.com", password="Test123!", nickname=f"참여자{i}")
+        for i in range(4)
+    ]
+    result = []
+    for index in range(3):
+        schedule = Schedule.objects.create(
+            meetup=create_meetup,
+            scheduled_at=timezone.now() + timedelta(days=index + 1),
+            place="강남역",
+            address="서울",
+            latitude="37.4979",
+            longitude="127.0276",
+            memo=f"모임 {index}",
+        )
+        schedule.participant.set(participants[: index + 2])
+        result.append(schedule)
+    result[0].participant.add(create_organizer)
+    return result
+
+
+@pytest.mark.django_db
+class TestScheduleParticipantAPI(APITestCase):
+    """일정 참여자 미리보기/목록 API 테스트"""
+
+    def setup_method(self):
+        self.client = Client()
+
+    @override_settings(SCHEDULE_PARTICIPANT_PREVIEW_SIZE=2)
+    def test_schedule_list_has_participant_preview(self, create_meetup, create_organizer, schedules):
+        """일정 목록은 참여자 수, 앞의 N명, 내 참여 여부만 고정된 쿼리 수로 내려준다"""
+        headers = self.get_auth_headers(create_organizer)
+        url = f"/api/v1/meetup/{create_meetup.id}/schedule"
+        for text in ("첫 댓글", "둘째 댓글", "삭제된 댓글"):
+            ScheduleComment.objects.create(
+                schedule=schedules[0], user=create_organizer, text=text, is_delete=text == "삭제된 댓글"
+            )
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url, **headers)
+
+        assert response.status_code == 200
+        result = response.json()["result"]
+        assert [item["participantCount"] for item in result] == [3, 3, 4]
+        assert [item["commentCount"] for item in result] == [2, 0, 0]
+        assert all(len(item["participantPreview"]) == 2 for item in result)
+        assert [item["isParticipating"] for item in result] == [True, False, False]
+        assert "participant" not in result[0]
+        # 사용자 인증 + 권한 로더 + 일정 목록 + 참여자 미리보기
+        assert len(ctx.captured_queries) <= 4
+
+    def test_participants_are_paginated(self, create_organizer, schedules):
+        """전체 참여자는 페이지로 나눠 내려준다"""
+        response = self.client.get(
+            f"/api/v1/schedule/{schedules[2].id}/participant",
+            {"page": 1, "size": 3},
+            **self.get_auth_headers(create_organizer),
+        )
+
+        assert response.status_code == 200
+        assert response.json()["total"] == 4
+        assert len(response.json()["result"]) == 3
+
+    def test_participants_require_membership(self, create_user, schedules):
+        """모임원이 아니면 참여자 목록을 볼 수 없다"""
+        response = self.client.get(
+            f"/api/v1/schedule/{schedules[0].id}/participant", **self.get_auth_headers(create_user)
+        )
+
+        assert response.status_code == 403
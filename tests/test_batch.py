@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+import json
+
+import pytest
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+
+from meetup.models import Meetup, Proposal
+from placeholder.utils.identity import get_by_pk, identity_map
+from tests.conftest import APITestCase
+
+
+@pytest.mark.django_db
+class TestBatchAPI(APITestCase):
+    """여러 GET 요청을 묶어 처리하는 batch API 테스트"""
+
+    def setup_method(self):
+        self.client = Client()
+        self.batch_url = "/api/v1/batch"
+
+    def _post(self, paths, **headers):
+        return self.client.post(
+            self.batch_url,
+            data=json.dumps({"requests": [{"path": path} for path in paths]}),
+            content_type="application/json",
+            **headers,
+        )
+
+    def test_batch_dispatches_in_order(self, create_meetup_with_member, create_member_user):
+        """하위 요청을 순서대로 처리해 각 응답의 상태와 본문을 내려준다"""
+        meetup_id = create_meetup_with_member.id
+        headers = self.get_auth_headers(create_member_user)
+
+        response = self._post(
+            [f"meetup/{meetup_id}", f"meetup/{meetup_id}/like", f"meetup/{meetup_id}/member", "meetup?size=1"],
+            **headers,
+        )
+
+        assert response.status_code == 200
+        result = response.json()["result"]
+        assert [item["status"] for item in result] == [200, 200, 200, 200]
+        assert result[0]["body"]["id"] == meetup_id
+        assert result[1]["body"]["isLike"] is False
+        assert len(result[2]["body"]["result"]) == 2
+        assert result[3]["body"]["total"] >= 1
+
+    def test_batch_reports_sub_request_errors(self, create_meetup):
+        """하위 요청의 오류는 해당 항목의 상태 코드로 전달한다"""
+        response = self._post([f"meetup/{create_meetup.id}/member", "unknown/path", "batch", "https://example.com/x"])
+
+        assert response.status_code == 200
+        assert [item["status"] for item in response.json()["result"]] == [401, 404, 400, 400]
+
+    def test_batch_authenticates_once(self, create_meetup, create_organizer):
+        """하위 요청마다 토큰 사용자를 다시 조회하지 않는다"""
+        headers = self.get_auth_headers(create_organizer)
+        paths = [f"meetup/{create_meetup.id}/proposal/status"] * 3
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self._post(paths, **headers)
+
+        assert response.status_code == 200
+        user_queries = [q for q in ctx.captured_queries if 'FROM "user_user"' in q["sql"]]
+        assert len(user_queries) == 1
+
+    def test_batch_shares_access_loads(self, create_meetup_with_member, create_member_user):
+        """권한 확인으로 불러온 모임은 배치 안의 하위 요청들이 함께 쓴다"""
+        meetup_id = create_meetup_with_member.id
+        Proposal.objects.create(user=create_member_user, meetup=create_meetup_with_member, text="신청합니다")
+        paths = [
+            f"meetup/{meetup_id}/member",
+            f"meetup/{meetup_id}/member/roster",
+            f"meetup/{meetup_id}/schedule",
+            f"meetup/{meetup_id}/comment",
+            f"meetup/{meetup_id}/proposal/status",
+        ]
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self._post(paths, **self.get_auth_headers(create_member_user))
+
+        assert [item["status"] for item in response.json()["result"]] == [200, 200, 200, 200, 200]
+        meetup_loads = [query["sql"] for query in ctx.captured_queries if 'FROM "meetup_meetup"' in query["sql"]]
+        assert len(meetup_loads) == 1
+        # 토큰 사용자 1 + 모임 1 + 모임원 목록 1 + 명단(역할별 수, 페이지) 2 + 일정/미리보기 1 + 댓글 1 + 신청 1
+        assert len(ctx.captured_queries) <= 8
+
+    def test_batch_rejects_too_many_requests(self, settings):
+        """BATCH_MAX_REQUESTS를 넘으면 400을 반환한다"""
+        settings.BATCH_MAX_REQUESTS = 2
+
+        response = self._post(["meetup", "meetup", "meetup"])
+
+        assert response.status_code == 400
+
+
+class TestIdentityMap:
+    """배치 identity map 테스트"""
+
+    def test_get_by_pk_reuses_instances(self, create_meetup):
+        """identity map 안에서는 같은 pk를 한 번만 조회한다"""
+        with identity_map():
+            with CaptureQueriesContext(connection) as ctx:
+                first = get_by_pk(Meetup, create_meetup.id)
+                second = get_by_pk(Meetup, str(create_meetup.id))
+
+        assert first is second
+        assert len(ctx.captured_queries) == 1
+        assert get_by_pk(Meetup, create_meetup.id) is not first
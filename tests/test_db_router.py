@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+import pytest
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import RequestFactory
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from meetup.models import Meetup
+from placeholder.middleware import ReplicaRoutingMiddleware
+from placeholder.utils.db import (
+    PrimaryReplicaRouter,
+    is_primary_sticky,
+    mark_primary_sticky,
+)
+
+
+@pytest.mark.django_db
+class TestReplicaRouting:
+    """레플리카 라우팅 및 read-your-writes 고정 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def replica_settings(self, settings):
+        settings.DATABASE_REPLICAS = ["replica_1"]
+        settings.DATABASE_REPLICA_STICKY_SECONDS = 5
+
+    def setup_method(self):
+        cache.clear()
+        self.factory = RequestFactory()
+        self.router = PrimaryReplicaRouter()
+
+    def _run(self, request, status=200):
+        seen = {}
+
+        def view(req):
+            seen["read"] = self.router.db_for_read(Meetup)
+            seen["write"] = self.router.db_for_write(Meetup)
+            return HttpResponse(status=status)
+
+        ReplicaRoutingMiddleware(view)(request)
+        return seen
+
+    def _auth(self, user):
+        token = str(RefreshToken.for_user(user).access_token)
+        return {"HTTP_AUTHORIZATION": f"Bearer {token}"}
+
+    def test_get_reads_from_replica(self):
+        """GET 요청은 레플리카에서 읽고 쓰기는 primary로 보낸다"""
+        seen = self._run(self.factory.get("/api/v1/meetup"))
+
+        assert seen["read"] == "replica_1"
+        assert seen["write"] == "default"
+
+    def test_write_request_reads_from_primary(self, create_user):
+        """쓰기 요청 안의 읽기는 primary를 사용한다"""
+        seen = self._run(self.factory.post("/api/v1/meetup", **self._auth(create_user)))
+
+        assert seen["read"] == "default"
+
+    def test_non_api_path_reads_from_primary(self):
+        """레플리카 대상이 아닌 경로는 primary에서 읽는다"""
+        seen = self._run(self.factory.get("/admin/"))
+
+        assert seen["read"] == "default"
+
+    def test_successful_write_makes_user_sticky(self, create_user):
+        """쓰기에 성공한 사용자의 다음 GET은 primary에서 읽는다"""
+        headers = self._auth(create_user)
+        self._run(self.factory.post("/api/v1/meetup/1/comment", **headers))
+
+        assert is_primary_sticky(create_user.id)
+        seen = self._run(self.factory.get("/api/v1/meetup/1/comment", **headers))
+        assert seen["read"] == "default"
+
+    def test_failed_write_does_not_stick(self, create_user):
+        """실패한 쓰기 요청은 고정하지 않는다"""
+        self._run(self.factory.post("/api/v1/meetup", **self._auth(create_user)), status=400)
+
+        assert not is_primary_sticky(create_user.id)
+
+    def test_batch_post_reads_from_replica(self, create_user):
+        """GET만 묶는 batch POST는 레플리카에서 읽고 primary 고정을 하지 않는다"""
+        seen = self._run(self.factory.post("/api/v1/batch", **self._auth(create_user)))
+
+        assert seen["read"] == "replica_1"
+        assert not is_primary_sticky(create_user.id)
+
+    def test_sticky_is_per_user(self, create_user, create_organizer):
+        """다른 사용자의 읽기는 계속 레플리카를 사용한다"""
+        mark_primary_sticky(create_user.id)
+
+        seen = self._run(self.factory.get("/api/v1/meetup", **self._auth(create_organizer)))
+        assert seen["read"] == "replica_1"
+
+    def test_context_is_reset_after_request(self):
+        """요청이 끝나면 읽기 alias가 초기화된다"""
+        self._run(self.factory.get("/api/v1/meetup"))
+
+        assert self.router.db_for_read(Meetup) == "default"
+
+    def test_without_replicas_reads_from_primary(self, settings):
+        """레플리카가 없으면 primary에서 읽는다"""
+        settings.DATABASE_REPLICAS = []
+        seen = self._run(self.factory.get("/api/v1/meetup"))
+
+        assert seen["read"] == "default"
+
+    def test_migrations_are_not_applied_to_replicas(self):
+        """레플리카에는 마이그레이션을 적용하지 않는다"""
+        assert self.router.allow_migrate("replica_1", "meetup") is False
+        assert self.router.allow_migrate("default", "meetup") is None
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+from io import BytesIO, StringIO
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+from PIL import Image
+
+from meetup.models import Meetup
+from meetup.schemas.meetup import MeetupListSchema
+from placeholder.utils.images import (
+    derivative_url,
+    generate_image_derivatives,
+    image_key,
+    pending_images,
+)
+from placeholder.utils.storage import BaseStorage
+
+
+class FakeStorage(BaseStorage):
+    def __init__(self, files=None):
+        self.files = dict(files or {})
+        self.content_types = {}
+
+    def read_file(self, key, max_size=None, bucket_name=None):
+        data = self.files.get(key)
+        if data is None or (max_size is not None and len(data) > max_size):
+            return None
+        return data
+
+    def upload_file(self, file, key, content_type="application/octet-stream", bucket_name=None):
+        self.files[key] = file.read()
+        self.content_types[key] = content_type
+        return True
+
+    def delete_file(self, key, bucket_name=None):
+        return self.files.pop(key, None) is not None
+
+    def create_batch_presigned_url(self, filepath, filetype_list: list, bucket_name=None, expiration=10):
+        return {"result": []}
+
+
+def _png(size, mode="RGB"):
+    buffer = BytesIO()
+    Image.new(mode, size).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+class TestImageDerivatives:
+    """이미지 파생본 생성 테스트"""
+
+    def test_derivative_url(self):
+        """원본 URL과 같은 경로에 파생본 URL을 만든다"""
+        url = "https://bucket.s3.amazonaws.com/meetup/abc.png"
+
+        assert derivative_url(url, "thumbnail") == "https://bucket.s3.amazonaws.com/meetup/abc.thumb.webp"
+        assert derivative_url(url, "webp") == "https://bucket.s3.amazonaws.com/meetup/abc.webp"
+        assert derivative_url("meetup/abc.jpeg", "webp") == "meetup/abc.webp"
+        assert derivative_url("", "webp") is None
+        assert derivative_url(None, "thumbnail") is None
+
+    def test_image_key(self, settings):
+        """URL에서 저장소 키를 추출한다"""
+        settings.AWS_S3_MEDIA_BUCKET_NAME = "media"
+
+        assert image_key("https://media.s3.amazonaws.com/meetup/abc.png") == "meetup/abc.png"
+        assert image_key("http://localhost:9000/media/meetup/abc.png") == "meetup/abc.png"
+        assert image_key("/meetup/abc.png") == "meetup/abc.png"
+
+    def test_generate_image_derivatives(self):
+        """썸네일과 WebP 변환본을 만들어 업로드한다"""
+        storage = FakeStorage({"meetup/abc.png": _png((2000, 1000), mode="P")})
+
+        with patch("placeholder.utils.images.get_storage", return_value=storage):
+            created = generate_image_derivatives("https://bucket.s3.amazonaws.com/meetup/abc.png")
+
+        assert created == ["meetup/abc.thumb.webp", "meetup/abc.webp"]
+        thumbnail = Image.open(BytesIO(storage.files["meetup/abc.thumb.webp"]))
+        webp = Image.open(BytesIO(storage.files["meetup/abc.webp"]))
+        assert thumbnail.format == "WEBP" and thumbnail.size == (320, 160)
+        assert webp.size == (1280, 640)
+        assert storage.content_types["meetup/abc.webp"] == "image/webp"
+
+    def test_generate_skips_invalid_image(self):
+        """읽을 수 없거나 이미지가 아니면 아무것도 올리지 않는다"""
+        storage = FakeStorage({"meetup/bad.png": b"not an image"})
+
+        with patch("placeholder.utils.images.get_storage", return_value=storage):
+            assert generate_image_derivatives("meetup/bad.png") == []
+            assert generate_image_derivatives("meetup/missing.png") == []
+        assert set(storage.files) == {"meetup/bad.png"}
+
+    def test_schema_exposes_derivative_urls(self, create_meetup):
+        """목록 스키마는 파생본이 만들어진 원본일 때만 파생본 URL을 내려준다"""
+        create_meetup.image = "https://bucket.s3.amazonaws.com/meetup/abc.png"
+        create_meetup.like_count = create_meetup.comment_count = 0
+        create_meetup.is_like = False
+
+        data = MeetupListSchema.from_orm(create_meetup).model_dump()
+        assert data["imageThumbnail"] is None
+
+        create_meetup.derived_image = create_meetup.image
+        data = MeetupListSchema.from_orm(create_meetup).model_dump()
+
+        assert data["imageThumbnail"] == "https://bucket.s3.amazonaws.com/meetup/abc.thumb.webp"
+        assert data["organizer"]["imageWebp"] is None
+
+    def test_generate_records_derived_image(self, create_meetup):
+        """파생본을 모두 올리면 같은 원본을 쓰는 행에 derived_image를 기록한다"""
+        image = "https://bucket.s3.amazonaws.com/meetup/abc.png"
+        Meetup.objects.filter(pk=create_meetup.pk).update(image=image)
+        storage = FakeStorage({"meetup/abc.png": _png((10, 10))})
+
+        assert pending_images() == [image]
+        with patch("placeholder.utils.images.get_storage", return_value=storage):
+            generate_image_derivatives(image)
+
+        create_meetup.refresh_from_db()
+        assert create_meetup.derived_image == image
+        assert pending_images() == []
+
+    def test_backfill_command(self, create_meetup):
+        """backfill 명령은 파생본이 없는 원본만 처리한다"""
+        Meetup.objects.filter(pk=create_meetup.pk).update(image="meetup/abc.png")
+        storage = FakeStorage({"meetup/abc.png": _png((10, 10))})
+        out = StringIO()
+
+        call_command("backfill_image_derivatives", "--dry-run", stdout=out)
+        assert "meetup/abc.png" in out.getvalue()
+        assert set(storage.files) == {"meetup/abc.png"}
+
+        with patch("placeholder.utils.images.get_storage", return_value=storage):
+            call_command("backfill_image_derivatives", stdout=out)
+
+        assert {"meetup/abc.thumb.webp", "meetup/abc.webp"} <= set(storage.files)
+        assert pending_images() == []
+
+
+@pytest.mark.django_db(transaction=True)
+def test_update_user_schedules_derivatives(api_client, create_user, auth_headers, settings):
+    """프로필 이미지가 바뀌면 커밋 후 파생본 생성을 예약한다"""
+    settings.BACKGROUND_TASKS_EAGER = True
+
+    with patch("placeholder.utils.images.generate_image_derivatives") as generate:
+        response = api_client.put(
+            "/api/v1/user/me",
+            {"nickname": "새닉네임", "bio": "", "image": "https://bucket.s3.amazonaws.com/user/new.png"},
+            content_type="application/json",
+            **auth_headers,
+        )
+
+    assert response.status_code == 200
+    generate.assert_called_once_with("https://bucket.s3.amazonaws.com/user/new.png")
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+
+from placeholder.utils.local_storage import LocalStorage
+from placeholder.utils.storage import get_storage
+
+
+@pytest.fixture
+def local_storage(settings, tmp_path):
+    settings.MEDIA_STORAGE_BACKEND = "local"
+    settings.MEDIA_ROOT = str(tmp_path)
+    settings.MEDIA_X_ACCEL_REDIRECT = False
+    return get_storage()
+
+
+def _upload(api_client, presigned, content=b"x" * 2048, **overrides):
+    data = {**presigned["fields"], **overrides}
+    data["file"] = SimpleUploadedFile("image.png", content, content_type=data["Content-Type"])
+    return api_client.post(presigned["url"], data)
+
+
+class TestLocalStorage:
+    """로컬 파일 저장소 테스트"""
+
+    def test_get_storage_uses_setting(self, local_storage):
+        """MEDIA_STORAGE_BACKEND 설정으로 저장소를 고른다"""
+        assert isinstance(local_storage, LocalStorage)
+
+    def test_upload_read_delete(self, local_storage):
+        """업로드한 파일을 읽고 삭제할 수 있다"""
+        result = local_storage.upload_stream(iter([b"abc", b"def"]), "exports/a.csv")
+
+        assert result.size == 6
+        assert local_storage.read_file("exports/a.csv") == b"abcdef"
+        assert local_storage.read_file("exports/a.csv", max_size=3) is None
+        assert local_storage.delete_file("exports/a.csv")
+        assert local_storage.read_file("exports/a.csv") is None
+
+    def test_rejects_keys_outside_media_root(self, local_storage):
+        """MEDIA_ROOT 밖을 가리키는 키는 거부한다"""
+        assert local_storage.read_file("../secret") is None
+        assert not local_storage.delete_file("../secret")
+
+
+class TestMediaViews:
+    """presigned 업로드 및 미디어 제공 테스트"""
+
+    def test_presigned_upload_and_serve(self, api_client, auth_headers, local_storage):
+        """presigned 필드로 업로드한 파일을 MEDIA_URL로 받을 수 있다"""
+        response = api_client.get("/api/v1/meetup/presigned-url?filetype=image/png", **auth_headers)
+        presigned = response.json()["result"][0]
+        assert presigned["url"] == "/media/"
+
+        response = _upload(api_client, presigned)
+
+        assert response.status_code == 201
+        key = presigned["fields"]["key"]
+        assert response.json()["url"] == f"/media/{key}"
+        response = api_client.get(f"/media/{key}")
+        assert response.status_code == 200
+        assert b"".join(response.streaming_content) == b"x" * 2048
+        assert response["Cache-Control"].startswith("public")
+
+    def test_upload_rejects_tampered_fields(self, api_client, local_storage):
+        """서명이 맞지 않거나 정책을 벗어난 업로드는 거부한다"""
+        presigned = local_storage.create_presigned_url("meetup/a.png", "image/png")
+
+        assert _upload(api_client, presigned, key="meetup/b.png").status_code == 403
+        assert _upload(api_client, presigned, content=b"x").status_code == 403
+        expired = local_storage.create_presigned_url("meetup/a.png", "image/png", expiration=-1)
+        assert _upload(api_client, expired).status_code == 403
+        assert local_storage.read_file("meetup/a.png") is None
+
+    def test_upload_rejects_malformed_form(self, api_client, local_storage):
+        """필수 필드가 빠진 업로드는 400을 반환하고 success_action_status는 무시한다"""
+        presigned = local_storage.create_presigned_url("meetup/a.png", "image/png")
+
+        assert _upload(api_client, presigned, expires="").status_code == 400
+        assert api_client.post(presigned["url"], presigned["fields"]).status_code == 400
+        assert _upload(api_client, presigned, success_action_status="abc").status_code == 201
+
+    def test_protected_media_requires_membership(
+        self, api_client, auth_headers, local_storage, settings, create_meetup_with_member, create_member_user
+    ):
+        """보호된 경로는 이미지를 가진 일정의 모임원만 X-Accel-Redirect로 받을 수 있다"""
+        from datetime import timedelta
+
+        from django.utils import timezone
+        from rest_framework_simplejwt.tokens import RefreshToken
+
+        from meetup.models import Schedule
+
+        settings.MEDIA_X_ACCEL_REDIRECT = True
+        local_storage.upload_stream(iter([b"data"]), "schedule/a b.png")
+        schedule = Schedule.objects.create(
+            meetup=create_meetup_with_member,
+            scheduled_at=timezone.now() + timedelta(days=1),
+            place="강남역",
+            address="서울",
+            image="/media/schedule/a b.png",
+        )
+        assert schedule.image_stem == "schedule/a b"
+        member_headers = {"HTTP_AUTHORIZATION": f"Bearer {RefreshToken.for_user(create_member_user).access_token}"}
+
+        assert api_client.get("/media/schedule/a b.png").status_code == 401
+        assert api_client.get("/media/schedule/a b.png", **auth_headers).status_code == 403
+        assert api_client.get("/media/schedule/orphan.png", **member_headers).status_code == 404
+        assert api_client.get("/media/schedule/a.png", **member_headers).status_code == 404
+
+        response = api_client.get("/media/schedule/a b.png", **member_headers)
+        assert response.status_code == 200
+        assert response["X-Accel-Redirect"] == "/protected-media/schedule/a%20b.png"
+        assert response["Content-Type"] == "image/png"
+        assert response["Cache-Control"].startswith("private")
+        assert api_client.get("/media/schedule/a b.thumb.webp", **member_headers).status_code == 200
+
+    def test_missing_media_returns_404(self, api_client, local_storage):
+        assert api_client.get("/media/meetup/missing.png").status_code == 404
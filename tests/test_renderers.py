@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+import json
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+from placeholder.renderers import ORJSONRenderer
+from placeholder.schemas.base import ErrorSchema
+from user.schemas.user import UserCreateSchema
+
+
+class TestORJSONRenderer:
+    """orjson 렌더러 테스트"""
+
+    def test_renders_native_and_fallback_types(self):
+        """date/datetime은 직접, Decimal/pydantic 모델은 기본 인코더로 직렬화한다"""
+        data = {
+            "createdAt": datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+            "startedAt": date(2025, 1, 2),
+            "price": Decimal("1.50"),
+            "error": ErrorSchema(message="오류"),
+            1: "정수 키",
+        }
+
+        content = ORJSONRenderer().render(None, data, response_status=200)
+
+        assert isinstance(content, bytes)
+        assert json.loads(content) == {
+            "createdAt": "2025-01-02T03:04:05Z",
+            "startedAt": "2025-01-02",
+            "price": "1.50",
+            "error": {"message": "오류"},
+            "1": "정수 키",
+        }
+        assert "오류".encode() in content
+
+
+class TestBaseSchemaDump:
+    def test_model_dump_passes_options(self):
+        """by_alias 기본값은 유지하고 나머지 옵션은 그대로 전달한다"""
+        schema = UserCreateSchema(email="a@example.com", password="Test123!", nickname="테스터")
+
+        assert "bio" not in schema.model_dump(exclude_none=True)
+        assert schema.dict(by_alias=False, include={"email"}) == {"email": "a@example.com"}
+
+
+def test_api_uses_orjson(api_client, create_user):
+    """잘못된 JSON 요청은 400, 응답은 UTF-8 JSON으로 내려준다"""
+    response = api_client.post("/api/v1/user", data=b"{not json", content_type="application/json")
+    assert response.status_code == 400
+
+    response = api_client.post(
+        "/api/v1/auth/login",
+        data={"email": create_user.email, "password": "Test123!"},
+        content_type="application/json",
+    )
+    assert response.status_code == 200
+    assert response["Content-Type"] == "application/json; charset=utf-8"
+    assert set(response.json()) == {"access", "refresh"}
@@ -1,4 +1,7 @@
 # -*- coding: utf-8 -*-
+import gzip
+import json
+from datetime import timedelta
 from io import StringIO
 from unittest.mock import MagicMock, patch
 
@@ -6,9 +9,21 @@ import pytest
 from django.core.management import call_command
 from django.core.management.base import CommandError
 from django.test import TestCase
+from django.utils import timezone
 
 from meetup.models import Meetup
+from placeholder.utils.local_storage import LocalStorage
 from placeholder.utils.s3 import S3Service
+from placeholder.utils.storage import UploadResult
+
+
+def _consume_stream(chunks, key, **kwargs):
+    data = b"".join(chunks)
+    _consume_stream.uploads[key] = gzip.decompress(data).decode()
+    return UploadResult(key=key, size=len(data), parts=1, sha256="", elapsed=0.0)
+
+
+_consume_stream.uploads = {}
 
 
 @pytest.mark.django_db
@@ -102,8 +117,9 @@ class TestGenerateSitemapCommand:
         assert f"https://www.place-holder.site/ad/{public_meetup.id}" in output
         assert f"https://www.place-holder.site/ad/{private_meetup.id}" not in output
 
+    @patch.object(S3Service, "upload_stream", side_effect=_consume_stream)
     @patch.object(S3Service, "upload_file")
-    def test_s3_upload_success(self, mock_upload, create_organizer):
+    def test_s3_upload_success(self, mock_upload, mock_upload_stream, create_organizer):
         """S3 업로드가 성공적으로 호출되는지 테스트"""
         mock_upload.return_value = True
 
@@ -128,14 +144,22 @@ class TestGenerateSitemapCommand:
         assert "Uploading sitemap to S3..." in output
         assert "Successfully generated and uploaded sitemap to S3" in output
 
-        # upload_file이 올바른 파라미터로 호출되었는지 확인
-        mock_upload.assert_called_once()
-        call_args = mock_upload.call_args
+        # upload_file이 올바른 파라미터로 호출되었는지 확인 (sitemap index, 증분 생성용 manifest)
+        assert [c[1]["key"] for c in mock_upload.call_args_list] == ["sitemap.xml", "sitemap-manifest.json"]
+        call_args = mock_upload.call_args_list[0]
         assert call_args[1]["key"] == "sitemap.xml"
         assert call_args[1]["content_type"] == "application/xml"
 
+        # 샤드는 gzip으로 스트리밍 업로드되고 index가 샤드를 가리키는지 확인
+        mock_upload_stream.assert_called_once()
+        assert mock_upload_stream.call_args[1]["key"] == "sitemap-0.xml.gz"
+        assert mock_upload_stream.call_args[1]["content_type"] == "application/gzip"
+        index = call_args[1]["file"].getvalue().decode()
+        assert "<loc>https://www.place-holder.site/sitemap-0.xml.gz</loc>" in index
+
+    @patch.object(S3Service, "upload_stream", side_effect=_consume_stream)
     @patch.object(S3Service, "upload_file")
-    def test_s3_upload_failure(self, mock_upload, create_organizer):
+    def test_s3_upload_failure(self, mock_upload, mock_upload_stream, create_organizer):
         """S3 업로드 실패 시 에러 처리 테스트"""
         mock_upload.return_value = False
 
@@ -202,3 +226,129 @@ class TestGenerateSitemapCommand:
         homepage_priority = homepage_section[: next_url if next_url > 0 else len(homepage_section)]
         assert "<priority>1.0</priority>" in homepage_priority
         assert "<changefreq>daily</changefreq>" in homepage_priority
+
+    @patch.object(S3Service, "upload_stream", side_effect=_consume_stream)
+    @patch.object(S3Service, "upload_file", return_value=True)
+    def test_sitemap_is_sharded_by_id_range(self, mock_upload, mock_upload_stream, create_organizer):
+        """id 구간별로 샤드를 나누고, 빈 구간은 건너뛴다"""
+        meetups = [
+            Meetup.objects.create(
+                name=f"모임 {i}",
+                description="샤드 테스트",
+                place="서울",
+                place_description="강남",
+                ad_title=f"광고 {i}",
+                ad_ended_at="2025-12-31",
+                is_public=True,
+                organizer=create_organizer,
+            )
+            for i in range(5)
+        ]
+        # 샤드 0: 홈페이지 + id 1..2, 샤드 1: id 3..4, ...
+        Meetup.objects.filter(id__in=[m.id for m in meetups if 3 <= m.id <= 4]).update(is_public=False)
+        _consume_stream.uploads.clear()
+
+        with patch("meetup.management.commands.generate_sitemap.SHARD_SPAN", 2):
+            call_command("generate_sitemap", "--chunk-size=2", stdout=StringIO())
+
+        uploads = _consume_stream.uploads
+        expected_shards = {(m.id - 1) // 2 for m in meetups if not 3 <= m.id <= 4} | {0}
+        assert set(uploads) == {f"sitemap-{shard}.xml.gz" for shard in expected_shards}
+        assert "<loc>https://www.place-holder.site</loc>" in uploads["sitemap-0.xml.gz"]
+        for meetup in meetups:
+            shard_xml = uploads.get(f"sitemap-{(meetup.id - 1) // 2}.xml.gz", "")
+            assert (f"/ad/{meetup.id}</loc>" in shard_xml) == (not 3 <= meetup.id <= 4)
+        index = mock_upload.call_args_list[0][1]["file"].getvalue().decode()
+        assert index.count("<sitemap>") == len(expected_shards)
+
+
+def _create_meetup(organizer, **kwargs):
+    return Meetup.objects.create(
+        name="모임",
+        description="증분 테스트",
+        place="서울",
+        place_description="강남",
+        ad_title="광고",
+        ad_ended_at="2025-12-31",
+        is_public=True,
+        organizer=organizer,
+        **kwargs,
+    )
+
+
+@pytest.mark.django_db
+class TestIncrementalSitemap:
+    """sitemap 증분 생성 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def local_storage(self, settings, tmp_path):
+        settings.MEDIA_STORAGE_BACKEND = "local"
+        settings.MEDIA_ROOT = str(tmp_path)
+        with patch("meetup.management.commands.generate_sitemap.SHARD_SPAN", 2):
+            yield LocalStorage(str(tmp_path))
+
+    def _run(self, *args):
+        with patch.object(LocalStorage, "upload_file", autospec=True, side_effect=LocalStorage.upload_file) as upload:
+            call_command("generate_sitemap", "--incremental", *args, stdout=StringIO())
+        return [c.kwargs["key"] for c in upload.call_args_list]
+
+    def _shard(self, storage, meetup):
+        return f"sitemap-{(meetup.id - 1) // 2}.xml.gz"
+
+    def _xml(self, storage, key):
+        return gzip.decompress(storage.read_file(key)).decode()
+
+    def test_first_run_builds_everything(self, local_storage, create_organizer):
+        """manifest가 없으면 모든 샤드를 만들고 manifest를 남긴다"""
+        meetups = [_create_meetup(create_organizer) for _ in range(3)]
+
+        uploaded = self._run()
+
+        shards = {self._shard(local_storage, m) for m in meetups} | {"sitemap-0.xml.gz"}
+        assert set(uploaded) == shards | {"sitemap.xml", "sitemap-manifest.json"}
+        manifest = json.loads(local_storage.read_file("sitemap-manifest.json"))
+        assert sum(info["count"] for info in manifest["shards"].values()) == 3
+        for meetup in meetups:
+            assert f"/ad/{meetup.id}</loc>" in self._xml(local_storage, self._shard(local_storage, meetup))
+
+    def test_unchanged_shards_are_not_uploaded(self, local_storage, create_organizer):
+        """바뀐 것이 없으면 샤드와 index를 다시 올리지 않는다"""
+        _create_meetup(create_organizer)
+        self._run()
+
+        # 워터마크 직전 수정분은 다시 확인하지만 해시가 같으므로 업로드하지 않는다
+        assert self._run() == ["sitemap-manifest.json"]
+
+    def test_only_changed_shard_is_regenerated(self, local_storage, create_organizer):
+        """수정된 모임이 속한 샤드만 다시 올린다"""
+        meetups = [_create_meetup(create_organizer) for _ in range(5)]
+        Meetup.objects.update(updated_at=timezone.now() - timedelta(days=1))
+        self._run()
+
+        target = meetups[-1]
+        target.description = "수정"
+        target.save()
+
+        uploaded = self._run()
+
+        assert uploaded == [self._shard(local_storage, target), "sitemap.xml", "sitemap-manifest.json"]
+        assert target.updated_at.isoformat() in self._xml(local_storage, self._shard(local_storage, target))
+
+    def test_unpublished_meetup_is_removed(self, local_storage, create_organizer):
+        """update()로 비공개 전환되어 워터마크가 바뀌지 않아도 공개 모임 수 변화로 감지한다"""
+        meetups = [_create_meetup(create_organizer) for _ in range(5)]
+        self._run()
+        target = meetups[-1]
+        shard = self._shard(local_storage, target)
+        others_in_shard = [m for m in meetups[:-1] if self._shard(local_storage, m) == shard]
+
+        Meetup.objects.filter(id=target.id).update(is_public=False)
+        uploaded = self._run()
+
+        if others_in_shard:
+            assert shard in uploaded
+            assert f"/ad/{target.id}</loc>" not in self._xml(local_storage, shard)
+        else:
+            # 샤드가 비면 파일을 지우고 index에서 뺀다
+            assert local_storage.read_file(shard) is None
+            assert shard not in local_storage.read_file("sitemap.xml").decode()
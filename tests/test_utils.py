@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -217,6 +218,168 @@ class TestS3Service:
         assert calls[2][0][1] == "unknown"
 
 
+class TestS3ClientPool:
+    """공유 S3 클라이언트 및 일괄 presign 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def s3_settings(self, settings):
+        from placeholder.utils.s3 import clear_client_pool
+
+        settings.AWS_ACCESS_KEY_ID = "AKIDEXAMPLE"
+        settings.AWS_SECRET_ACCESS_KEY = "secret"
+        settings.AWS_S3_MEDIA_BUCKET_NAME = "test-bucket"
+        settings.AWS_S3_CLIENT_MAX_AGE = 3600
+        clear_client_pool()
+        yield settings
+        clear_client_pool()
+
+    def test_client_is_reused(self):
+        """같은 설정에서는 클라이언트를 재사용한다"""
+        s3_service = S3Service()
+
+        assert s3_service._get_s3_client() is s3_service._get_s3_client()
+        assert S3Service()._get_s3_client() is s3_service._get_s3_client()
+
+    def test_client_is_recreated_when_credentials_change(self, s3_settings):
+        """자격 증명이 바뀌면 새 클라이언트를 만든다"""
+        client = S3Service()._get_s3_client()
+
+        s3_settings.AWS_SECRET_ACCESS_KEY = "rotated"
+
+        assert S3Service()._get_s3_client() is not client
+
+    def test_client_is_recreated_after_max_age(self, s3_settings):
+        """최대 사용 시간이 지나면 새 클라이언트를 만든다"""
+        client = S3Service()._get_s3_client()
+
+        s3_settings.AWS_S3_CLIENT_MAX_AGE = 0
+
+        assert S3Service()._get_s3_client() is not client
+
+    def test_batch_presign_matches_botocore(self):
+        """일괄 서명 결과가 botocore의 presigned POST와 같다"""
+        import datetime as dt
+        import uuid
+
+        from placeholder.utils import s3
+
+        fixed = dt.datetime(2026, 1, 2, 3, 4, 5)
+
+        class FixedDateTime(dt.datetime):
+            @classmethod
+            def utcnow(cls):
+                return fixed
+
+            @classmethod
+            def now(cls, tz=None):
+                return fixed.replace(tzinfo=dt.timezone.utc)
+
+        # botocore는 datetime.datetime.utcnow()로 서명 시각을 정하므로 모듈 단위로 시계를 고정합니다.
+        frozen_datetime = SimpleNamespace(datetime=FixedDateTime, timedelta=dt.timedelta)
+        key = uuid.UUID(int=1)
+        with (
+            patch("botocore.signers.datetime", frozen_datetime),
+            patch("botocore.auth.datetime", frozen_datetime),
+            patch.object(s3, "datetime", FixedDateTime),
+            patch.object(s3.uuid, "uuid4", return_value=key),
+        ):
+            s3_service = S3Service()
+            expected = [
+                s3_service.create_presigned_url(f"meetup/{key}.png", "image/png"),
+                s3_service.create_presigned_url(f"meetup/{key}.jpeg", "image/jpeg"),
+            ]
+            result = s3_service.create_batch_presigned_url("meetup", ["image/png", "image/jpeg"])
+
+        assert result == {"result": expected}
+
+    def test_batch_presign_signs_each_file(self):
+        """파일마다 고유한 키와 서명을 만든다"""
+        result = S3Service().create_batch_presigned_url("schedule", ["image/png", "image/png", "unknown"])["result"]
+
+        keys = [item["fields"]["key"] for item in result]
+        assert len(set(keys)) == 3
+        assert keys[0].startswith("schedule/") and keys[0].endswith(".png")
+        assert keys[2].endswith(".jpg")
+        assert len({item["fields"]["x-amz-signature"] for item in result}) == 3
+
+
+class TestS3StreamingUpload:
+    """S3 스트리밍 multipart 업로드 테스트"""
+
+    PART_SIZE = 5 * 1024 * 1024
+
+    @pytest.fixture
+    def s3_client(self):
+        client = MagicMock()
+        client.create_multipart_upload.return_value = {"UploadId": "upload-1"}
+        client.upload_part.side_effect = lambda **kwargs: {"ETag": f"etag-{kwargs['PartNumber']}"}
+        with patch.object(S3Service, "_get_s3_client", return_value=client):
+            yield client
+
+    def _chunks(self, total, chunk_size=1024 * 1024):
+        for offset in range(0, total, chunk_size):
+            yield b"x" * min(chunk_size, total - offset)
+
+    def test_multipart_upload(self, s3_client):
+        """파트 크기 단위로 나눠 올리고 순서대로 완료한다"""
+        import hashlib
+
+        total = self.PART_SIZE * 2 + 123
+        result = S3Service("bucket").upload_stream(
+            self._chunks(total), "sitemap.xml.gz", content_type="application/gzip", part_size=1, max_concurrency=2
+        )
+
+        assert result.size == total
+        assert result.parts == 3
+        assert result.sha256 == hashlib.sha256(b"x" * total).hexdigest()
+        assert result.throughput > 0
+        s3_client.create_multipart_upload.assert_called_once_with(
+            Bucket="bucket", Key="sitemap.xml.gz", ContentType="application/gzip"
+        )
+        sizes = sorted((c.kwargs["PartNumber"], len(c.kwargs["Body"])) for c in s3_client.upload_part.call_args_list)
+        assert sizes == [(1, self.PART_SIZE), (2, self.PART_SIZE), (3, 123)]
+        parts = s3_client.complete_multipart_upload.call_args.kwargs["MultipartUpload"]["Parts"]
+        assert parts == [{"PartNumber": n, "ETag": f"etag-{n}"} for n in (1, 2, 3)]
+
+    def test_small_stream_uses_single_put(self, s3_client):
+        """한 파트보다 작으면 put_object 한 번으로 올린다"""
+        result = S3Service("bucket").upload_stream(iter([b"<urlset>", b"</urlset>"]), "sitemap.xml")
+
+        assert result.parts == 1 and result.size == 17
+        s3_client.put_object.assert_called_once_with(
+            Bucket="bucket", Key="sitemap.xml", Body=b"<urlset></urlset>", ContentType="application/octet-stream"
+        )
+        s3_client.create_multipart_upload.assert_not_called()
+
+    def test_failed_part_aborts_upload(self, s3_client):
+        """파트 업로드가 실패하면 multipart 업로드를 중단하고 None을 반환한다"""
+        from botocore.exceptions import ClientError
+
+        s3_client.upload_part.side_effect = ClientError({"Error": {"Code": "500"}}, "UploadPart")
+
+        result = S3Service("bucket").upload_stream(
+            self._chunks(self.PART_SIZE * 2), "export.csv", part_size=self.PART_SIZE
+        )
+
+        assert result is None
+        s3_client.abort_multipart_upload.assert_called_once_with(
+            Bucket="bucket", Key="export.csv", UploadId="upload-1"
+        )
+        s3_client.complete_multipart_upload.assert_not_called()
+
+    def test_producer_error_aborts_upload(self, s3_client):
+        """데이터 생성 중 오류가 나면 업로드를 중단하고 오류를 전달한다"""
+
+        def chunks():
+            yield from self._chunks(self.PART_SIZE)
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            S3Service("bucket").upload_stream(chunks(), "export.csv", part_size=self.PART_SIZE)
+
+        s3_client.abort_multipart_upload.assert_called_once()
+
+
 @pytest.mark.django_db
 class TestAuthUtils:
     """인증 유틸리티 테스트"""
@@ -312,3 +475,39 @@ class TestMiddleware:
 
         # get_response가 호출되었는지 확인
         mock_get_response.assert_called_once_with(mock_request)
+
+
+class TestProjection:
+    """응답 스키마 기반 컬럼 프로젝션 테스트"""
+
+    def test_meetup_list_projection(self):
+        """목록 스키마에 없는 TextField는 읽지 않고 organizer는 필요한 컬럼만 함께 읽는다"""
+        from meetup.models import Meetup
+        from meetup.schemas.meetup import MeetupListSchema
+        from placeholder.utils.projection import get_projection
+
+        only_fields, related = get_projection(Meetup, MeetupListSchema)
+
+        assert related == ("organizer",)
+        assert "description" not in only_fields
+        assert "place_description" not in only_fields
+        assert {"id", "ad_title", "image", "organizer", "organizer__id", "organizer__nickname"} <= set(only_fields)
+        assert "organizer__password" not in only_fields
+
+    def test_project_queryset_defers_unused_columns(self, create_meetup_with_member):
+        """프로젝션된 queryset은 스키마 필드만 불러오고 중첩 객체를 추가 쿼리 없이 내려준다"""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        from meetup.models import Member
+        from meetup.schemas.member import MemberListSchema
+        from placeholder.utils.projection import project_queryset
+
+        meetup = create_meetup_with_member
+        with CaptureQueriesContext(connection) as ctx:
+            members = list(project_queryset(Member.objects.filter(meetup=meetup), MemberListSchema))
+            nicknames = {member.user.nickname for member in members}
+
+        assert len(ctx.captured_queries) == 1
+        assert len(nicknames) == len(members)
+        assert "bio" in members[0].user.get_deferred_fields()
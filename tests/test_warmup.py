@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+import asyncio
+
+import pytest
+
+from placeholder import warmup
+from placeholder.utils import s3
+
+
+@pytest.mark.django_db
+class TestWarmup:
+    """워커 워밍업 테스트"""
+
+    def test_warm_up_runs_all_steps(self):
+        """모든 워밍업 단계가 실행된다"""
+        timings = warmup.warm_up()
+
+        assert set(timings) == {step.__name__ for step in warmup.WARMUP_STEPS}
+
+    def test_failed_step_does_not_stop_warm_up(self, monkeypatch):
+        """실패한 단계가 있어도 나머지 단계는 실행된다"""
+        called = []
+
+        def broken():
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(warmup, "WARMUP_STEPS", [broken, lambda: called.append(True)])
+
+        warmup.warm_up()
+
+        assert called == [True]
+
+    def test_lifespan_startup_and_shutdown(self, monkeypatch):
+        """lifespan startup/shutdown 이벤트에 응답한다"""
+        from placeholder.asgi import application
+
+        monkeypatch.setattr(warmup, "WARMUP_STEPS", [])
+        messages = [{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}]
+        sent = []
+
+        async def receive():
+            return messages.pop(0)
+
+        async def send(message):
+            sent.append(message["type"])
+
+        asyncio.run(application({"type": "lifespan"}, receive, send))
+
+        assert sent == ["lifespan.startup.complete", "lifespan.shutdown.complete"]
+
+    def test_lifespan_closes_warm_up_connections(self, monkeypatch):
+        """워밍업이 끝나면 lifespan 스레드에서 연 DB 커넥션을 닫는다"""
+        from placeholder.asgi import application
+
+        closed = []
+        monkeypatch.setattr(warmup, "WARMUP_STEPS", [])
+        monkeypatch.setattr(warmup, "close_db_connections", lambda: closed.append(True))
+        messages = [{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}]
+
+        async def receive():
+            return messages.pop(0)
+
+        async def send(message):
+            pass
+
+        asyncio.run(application({"type": "lifespan"}, receive, send))
+
+        assert closed == [True]
+
+    def test_s3_module_does_not_import_boto3_eagerly(self):
+        """S3 유틸 모듈은 boto3를 모듈 로드 시점에 불러오지 않는다"""
+        assert "boto3" not in vars(s3)
+        assert "ClientError" not in vars(s3)
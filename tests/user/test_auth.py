@@ -1,8 +1,10 @@
 # -*- coding: utf-8 -*-
 import json
+from types import SimpleNamespace
 
 import pytest
 from django.contrib.auth import get_user_model
+from django.db import IntegrityError
 from django.test import Client
 from rest_framework_simplejwt.tokens import RefreshToken
 
@@ -77,6 +79,45 @@ class TestAuthAPI:
         assert user.nickname == data["nickname"]
         assert user.check_password(data["password"])
 
+    def test_user_registration_duplicate_email_ignores_case(self):
+        """대소문자만 다른 이메일로 가입하면 중복 이메일 오류를 반환한다"""
+        User.objects.create_user(email="dup@example.com", password="Test123!", nickname="기존사용자")
+        data = {"email": "DUP@example.com", "password": "Test123!", "nickname": "새사용자"}
+
+        response = self.client.post(self.register_url, data=json.dumps(data), content_type="application/json")
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "이미 사용 중인 이메일입니다."
+
+    def test_user_registration_duplicate_nickname(self):
+        """이미 사용 중인 닉네임으로 가입하면 중복 닉네임 오류를 반환한다"""
+        User.objects.create_user(email="first@example.com", password="Test123!", nickname="Nick")
+        data = {"email": "second@example.com", "password": "Test123!", "nickname": "nick"}
+
+        response = self.client.post(self.register_url, data=json.dumps(data), content_type="application/json")
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "이미 사용 중인 닉네임입니다."
+
+    def test_unique_conflict_uses_constraint_name(self):
+        """PostgreSQL이 알려주는 제약 이름으로 중복 예외를 고르고, 다른 제약 위반은 그대로 둔다"""
+        from placeholder.utils.exceptions import NicknameAlreadyExistsException
+        from user.apis.user import _unique_conflict
+
+        def integrity_error(constraint_name):
+            cause = Exception()
+            cause.diag = SimpleNamespace(constraint_name=constraint_name)
+            error = IntegrityError()
+            error.__cause__ = cause
+            return error
+
+        payload = SimpleNamespace(email="none@example.com", nickname="없음")
+        error = integrity_error("user_nickname_ci_unique")
+        other = integrity_error("user_user_pkey")
+
+        assert isinstance(_unique_conflict(error, payload), NicknameAlreadyExistsException)
+        assert _unique_conflict(other, payload) is other
+
     def test_user_registration_invalid_email(self):
         """잘못된 이메일로 사용자 등록 실패 테스트"""
         data = {"email": "invalid-email", "password": "Test123!", "nickname": "테스터"}
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from user.availability import AvailabilityIndex, BloomFilter, email_index
+
+User = get_user_model()
+
+
+class TestBloomFilter:
+    def test_added_values_are_always_found(self):
+        """추가한 값은 항상 포함된 것으로 판단한다"""
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        values = [f"user{i}@example.com" for i in range(1000)]
+        for value in values:
+            bloom.add(value)
+
+        assert all(value in bloom for value in values)
+        false_positives = sum(f"other{i}@example.com" in bloom for i in range(1000))
+        assert false_positives < 50
+
+
+@pytest.mark.django_db
+class TestAvailabilityIndex:
+    """이메일/닉네임 availability index 테스트"""
+
+    def test_definite_negative_skips_db(self, create_user):
+        """filter에 없는 값은 DB 조회 없이 사용 가능으로 답한다"""
+        index = AvailabilityIndex("email")
+        index.build()
+
+        with CaptureQueriesContext(connection) as ctx:
+            assert index.is_taken("nobody@example.com") is False
+        assert len(ctx.captured_queries) == 0
+
+        assert index.is_taken(create_user.email) is True
+
+    def test_signals_keep_index_current(self):
+        """가입한 사용자의 이메일은 바로 사용 중으로 판단한다"""
+        email_index.build()
+        User.objects.create_user(email="Fresh@example.com", password="Test123!", nickname="신규")
+
+        assert email_index.is_taken("Fresh@example.com") is True
+
+    def test_deleted_user_is_verified_by_db(self, create_user):
+        """삭제된 사용자의 값은 DB 확인 후 사용 가능으로 답한다"""
+        email_index.build()
+        email = create_user.email
+        create_user.delete()
+
+        assert email_index.is_taken(email) is False
+
+    def test_changes_during_first_build_are_replayed(self, monkeypatch):
+        """첫 생성 중에 추가/삭제된 값도 생성이 끝난 filter에 반영한다"""
+        from user import availability
+
+        index = AvailabilityIndex("email")
+
+        class ChangedDuringBuild(BloomFilter):
+            def __init__(self, *args, **kwargs):
+                # DB를 읽은 뒤, filter가 만들어지기 전에 signal이 온 경우
+                index.add("Late@example.com")
+                index.discard("gone@example.com")
+                super().__init__(*args, **kwargs)
+
+        monkeypatch.setattr(availability, "BloomFilter", ChangedDuringBuild)
+        index.build()
+
+        assert "late@example.com" in index._bloom
+        assert index._removed == 1
+        assert index._pending is None
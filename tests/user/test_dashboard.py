@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+import pytest
+from django.core.cache import cache
+from django.test import Client
+
+from meetup.models import Proposal
+from notification.models import Notification
+from tests.conftest import APITestCase
+
+
+@pytest.mark.django_db
+class TestDashboardAPI(APITestCase):
+    """마이 스페이스 대시보드 API 테스트"""
+
+    def setup_method(self):
+        cache.clear()
+        self.client = Client()
+        self.dashboard_url = "/api/v1/user/me/dashboard"
+
+    def test_dashboard_counts(self, create_meetup_with_member, create_organizer, create_user):
+        """모임/받은 신청/읽지 않은 알림 수를 집계한다"""
+        Proposal.objects.create(user=create_user, meetup=create_meetup_with_member, text="신청합니다")
+        Notification.objects.create(
+            type=Notification.NotificationType.RECEIVED_PROPOSAL.value,
+            model_id=1,
+            sender=create_user,
+            recipient=create_organizer,
+        )
+
+        response = self.client.get(self.dashboard_url, **self.get_auth_headers(create_organizer))
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "ongoingMeetupCount": 1,
+            "endedMeetupCount": 0,
+            "organizingMeetupCount": 1,
+            "memberMeetupCount": 0,
+            "pendingProposalCount": 1,
+            "unreadNotificationCount": 1,
+        }
+
+    def test_dashboard_is_invalidated_on_proposal_change(self, create_meetup, create_organizer, create_user):
+        """캐시된 카운트는 신청 상태가 바뀌면 다시 집계된다"""
+        headers = self.get_auth_headers(create_organizer)
+        proposal = Proposal.objects.create(user=create_user, meetup=create_meetup)
+        assert self.client.get(self.dashboard_url, **headers).json()["pendingProposalCount"] == 1
+
+        proposal.status = Proposal.ProposalStatus.ACCEPTANCE.value
+        proposal.save()
+
+        assert self.client.get(self.dashboard_url, **headers).json()["pendingProposalCount"] == 0
+
+    def test_dashboard_skips_tombstoned_meetups(self, create_meetup_with_member, create_organizer, create_user):
+        """삭제 처리 중인 모임의 모임원/신청은 세지 않는다"""
+        from django.utils import timezone
+
+        from meetup.models import Meetup
+
+        Proposal.objects.create(user=create_user, meetup=create_meetup_with_member, text="신청합니다")
+        Meetup.objects.filter(pk=create_meetup_with_member.pk).update(deleted_at=timezone.now())
+
+        data = self.client.get(self.dashboard_url, **self.get_auth_headers(create_organizer)).json()
+
+        assert data["ongoingMeetupCount"] == data["organizingMeetupCount"] == data["pendingProposalCount"] == 0
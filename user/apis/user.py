@@ -1,22 +1,36 @@
 # -*- coding: utf-8 -*-
-from datetime import datetime
+from datetime import date, datetime
 from typing import List, Optional
 
+from django.db import IntegrityError, transaction
 from django.db.models import BooleanField, Case, F, When
+from django.urls import reverse
 from ninja import Query, Router
 from ninja.pagination import paginate
 
+from meetup.deletion import delete_user_later
 from meetup.models import Meetup, Proposal
+from meetup.schedule_calendar import get_calendar, issue_calendar_token
 from meetup.schemas.proposal import ProposalListSchema
 from placeholder.pagination import CustomPagination
 from placeholder.schemas.base import PresignedUrlSchema
 from placeholder.utils.auth import JWTAuth
 from placeholder.utils.decorators import handle_exceptions
 from placeholder.utils.enums import MeetupStatus
-from placeholder.utils.s3 import S3Service
+from placeholder.utils.exceptions import (
+    EmailAlreadyExistsException,
+    NicknameAlreadyExistsException,
+)
+from placeholder.utils.images import schedule_image_derivatives
+from placeholder.utils.projection import project_queryset
+from placeholder.utils.storage import get_storage
+from user.dashboard import get_dashboard_counts
 from user.models.user import User
 from user.schemas.user import (
+    CalendarFeedSchema,
     MyAdSchema,
+    MyCalendarSchema,
+    MyDashboardSchema,
     MyMeetupSchema,
     MyProposalSchema,
     UserCreateSchema,
@@ -27,10 +41,45 @@ from user.schemas.user import (
 user_router = Router(tags=["User"])
 
 
+# unique 제약 이름 -> 중복 예외 (PostgreSQL: 컬럼 unique는 <테이블>_<컬럼>_key)
+UNIQUE_CONFLICTS = {
+    "user_email_ci_unique": EmailAlreadyExistsException,
+    "user_user_email_key": EmailAlreadyExistsException,
+    "user_nickname_ci_unique": NicknameAlreadyExistsException,
+    "user_user_nickname_key": NicknameAlreadyExistsException,
+}
+
+
+def _unique_constraint_name(error):
+    """PostgreSQL 드라이버가 알려주는 위반한 제약 이름. (제약 이름을 주지 않는 DB에서는 None)"""
+    return getattr(getattr(error.__cause__, "diag", None), "constraint_name", None)
+
+
+def _unique_conflict(error, payload):
+    """
+    이메일/닉네임 unique 제약 위반만 중복 예외로 바꾸고, 그 밖의 IntegrityError(NOT NULL, FK 등)는 그대로 돌려줍니다.
+    제약 이름을 알 수 없으면 실패한 경우에만 어느 값이 겹쳤는지 한 번 더 조회합니다.
+    """
+    name = _unique_constraint_name(error)
+    if name is not None:
+        exception = UNIQUE_CONFLICTS.get(name)
+        return exception() if exception else error
+    if User.all_objects.filter(email__iexact=payload.email).exists():
+        return EmailAlreadyExistsException()
+    if User.all_objects.filter(nickname__iexact=payload.nickname).exists():
+        return NicknameAlreadyExistsException()
+    return error
+
+
 @user_router.post("", response={201: None})
 @handle_exceptions
 def create_user(request, payload: UserCreateSchema):
-    User.objects.create_user(**payload.dict())
+    # 중복 확인 쿼리 없이 INSERT 한 번으로 가입하고, 중복은 unique 제약으로 판단합니다.
+    try:
+        with transaction.atomic():
+            User.objects.create_user(**payload.dict(exclude={"bio"}), bio=payload.bio or "")
+    except IntegrityError as e:
+        raise _unique_conflict(e, payload)
     return 201, None
 
 
@@ -45,11 +94,17 @@ def get_user(request):
 @handle_exceptions
 def update_user(request, payload: UserUpdateSchema):
     user = request.auth
+    previous_image = user.image
 
     for attr, value in payload.model_dump(by_alias=False).items():
         setattr(user, attr, value)
 
-    user.save()
+    try:
+        with transaction.atomic():
+            user.save()
+    except IntegrityError as e:
+        raise _unique_conflict(e, payload)
+    schedule_image_derivatives(user.image, previous_image)
 
     return 200, user
 
@@ -57,12 +112,39 @@ def update_user(request, payload: UserUpdateSchema):
 @user_router.delete("/me", response={204: None}, auth=JWTAuth())
 @handle_exceptions
 def delete_user(request):
-    user = request.auth
-
-    user.delete()
+    delete_user_later(request.auth)
     return 204, None
 
 
+@user_router.get("/me/dashboard", response=MyDashboardSchema, auth=JWTAuth(), by_alias=True)
+@handle_exceptions
+def get_my_dashboard(request):
+    return get_dashboard_counts(request.auth)
+
+
+@user_router.get("/me/calendar", response=MyCalendarSchema, auth=JWTAuth(), by_alias=True)
+@handle_exceptions
+def get_my_calendar(
+    request,
+    start: date = Query(..., description="시작일"),
+    end: date = Query(..., description="종료일 (포함)"),
+):
+    """
+    내가 속한 모든 모임의 일정을 기간으로 한 번에 조회합니다.
+    """
+    return {"result": get_calendar(request.auth, start, end)}
+
+
+@user_router.post("/me/calendar/feed", response=CalendarFeedSchema, auth=JWTAuth(), by_alias=True)
+@handle_exceptions
+def issue_calendar_feed(request):
+    """
+    캘린더 앱에서 구독할 iCalendar 주소를 발급합니다. 다시 발급하면 이전 주소는 만료됩니다.
+    """
+    token = issue_calendar_token(request.auth)
+    return {"url": request.build_absolute_uri(reverse("calendar_feed", args=[token]))}
+
+
 @user_router.get("/me/meetup", response=List[MyMeetupSchema], auth=JWTAuth())
 @handle_exceptions
 @paginate(CustomPagination)
@@ -83,8 +165,7 @@ def get_my_meetups(
         filters["organizer"] = user
 
     meetups = (
-        Meetup.objects.prefetch_related("member_set")
-        .filter(member__user=user, **filters)
+        Meetup.objects.filter(member__user=user, **filters)
         .annotate(
             is_organizer=Case(When(organizer=user, then=True), default=False, output_field=BooleanField()),
             is_current=Case(
@@ -139,7 +220,7 @@ def get_my_proposals(request):
 
     proposals = (
         Proposal.objects.select_related("meetup")
-        .filter(user=user, is_hide_to_proposer=False)
+        .filter(user=user, is_hide_to_proposer=False, meetup__deleted_at__isnull=True)
         .annotate(meetup_name=F("meetup__name"), meetup_ad_title=F("meetup__ad_title"))
         .all()
     )
@@ -159,20 +240,18 @@ def get_received_proposals(
     request, meetup_id, status: Optional[Proposal.ProposalStatus] = Query(None, description="신청 상태")
 ):
     user = request.auth
-    proposals = (
-        Proposal.objects.prefetch_related("user")
-        .filter(meetup_id=meetup_id, meetup__organizer=user, status=status)
-        .exclude(user=user)
-        .all()
-    )
+    proposals = Proposal.objects.filter(
+        meetup_id=meetup_id, meetup__organizer=user, meetup__deleted_at__isnull=True, user__deleted_at__isnull=True
+    ).exclude(user=user)
+    if status:
+        proposals = proposals.filter(status=status.value)
 
-    return proposals
+    return project_queryset(proposals.order_by("-created_at", "-id"), ProposalListSchema)
 
 
 @user_router.get("presigned-url", response=PresignedUrlSchema, auth=JWTAuth(), by_alias=True)
 @handle_exceptions
 def get_presigned_url(request, filetype):
-    s3_service = S3Service()
     filetype_list = filetype.split(",")
-    result = s3_service.create_multi_presigned_url("user", filetype_list)
+    result = get_storage().create_batch_presigned_url("user", filetype_list)
     return result
@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+import hashlib
+import math
+import threading
+import time
+
+from django.conf import settings
+from django.db.models.functions import Lower
+
+from placeholder.utils.tasks import enqueue
+from user.models.user import User
+
+
+def normalize(value):
+    # DB의 대소문자 무시 unique 제약(LOWER)과 같은 기준으로 정규화합니다.
+    return value.lower()
+
+
+class BloomFilter:
+    """고정 크기 bit 배열과 double hashing을 사용하는 Bloom filter입니다."""
+
+    def __init__(self, capacity, error_rate):
+        capacity = max(capacity, 1)
+        self.capacity = capacity
+        self.size = max(int(-capacity * math.log(error_rate) / (math.log(2) ** 2)), 8)
+        self.hash_count = max(int(round(self.size / capacity * math.log(2))), 1)
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, value):
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, value):
+        for position in self._positions(value):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, value):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(value))
+
+
+class AvailabilityIndex:
+    """
+    프로세스마다 사용 중인 값(정규화한 이메일/닉네임)의 Bloom filter를 유지합니다.
+    filter에 없으면 DB 조회 없이 사용 가능으로 답하고, 있을 때만 DB로 확인합니다.
+    다른 프로세스에서 추가된 값은 주기적인 재생성(AVAILABILITY_INDEX_REBUILD_SECONDS) 때 반영되며,
+    최종 중복 여부는 가입 시 DB의 unique 제약이 보장합니다.
+    """
+
+    def __init__(self, field):
+        self.field = field
+        self._bloom = None
+        self._built_at = 0.0
+        self._removed = 0
+        self._pending = None
+        self._pending_removed = 0
+        self._lock = threading.Lock()
+        self._rebuilding = False
+
+    def build(self):
+        with self._lock:
+            # 생성/재생성 중에 signal로 추가/삭제된 값은 새 filter에도 반영합니다.
+            self._pending = []
+            self._pending_removed = 0
+        try:
+            # 탈퇴 처리 중인 사용자도 unique 제약에는 남아 있으므로 함께 넣습니다.
+            values = User.all_objects.values_list(self.field, flat=True).order_by().iterator(chunk_size=5000)
+            normalized = [normalize(value) for value in values if value]
+            bloom = BloomFilter(
+                capacity=len(normalized) * 2 + settings.AVAILABILITY_INDEX_HEADROOM,
+                error_rate=settings.AVAILABILITY_INDEX_ERROR_RATE,
+            )
+            for value in normalized:
+                bloom.add(value)
+            with self._lock:
+                for value in self._pending:
+                    bloom.add(value)
+                self._bloom = bloom
+                self._built_at = time.monotonic()
+                self._removed = self._pending_removed
+        finally:
+            with self._lock:
+                self._pending = None
+                self._rebuilding = False
+
+    def _is_stale(self):
+        bloom = self._bloom
+        return (
+            time.monotonic() - self._built_at > settings.AVAILABILITY_INDEX_REBUILD_SECONDS
+            or bloom.count > bloom.capacity
+            # 삭제된 값은 filter에서 뺄 수 없어 오탐이 늘어나므로 일정 비율을 넘으면 다시 만듭니다.
+            or self._removed > bloom.count // 10
+        )
+
+    def _schedule_rebuild(self):
+        with self._lock:
+            if self._rebuilding:
+                return
+            self._rebuilding = True
+        enqueue(self.build)
+
+    def add(self, value):
+        if not value:
+            return
+        value = normalize(value)
+        with self._lock:
+            # 첫 생성 중에는 아직 filter가 없으므로 _pending에만 남겼다가 생성이 끝나면 넣습니다.
+            if self._pending is not None:
+                self._pending.append(value)
+            if self._bloom is not None:
+                self._bloom.add(value)
+
+    def discard(self, value):
+        if not value:
+            return
+        with self._lock:
+            if self._pending is not None:
+                self._pending_removed += 1
+            if self._bloom is not None:
+                self._removed += 1
+
+    def is_taken(self, value):
+        if self._bloom is None:
+            self.build()
+        elif self._is_stale():
+            # 재생성하는 동안에는 기존 filter로 답합니다.
+            self._schedule_rebuild()
+        if normalize(value) not in self._bloom:
+            return False
+        # LOWER() 함수 인덱스를 사용하도록 제약과 같은 식으로 조회합니다.
+        return User.all_objects.alias(lowered=Lower(self.field)).filter(lowered=normalize(value)).exists()
+
+
+email_index = AvailabilityIndex("email")
+nickname_index = AvailabilityIndex("nickname")
+
+
+def is_email_taken(email):
+    return email_index.is_taken(email)
+
+
+def is_nickname_taken(nickname):
+    return nickname_index.is_taken(nickname)
+
+
+def build_availability_indexes():
+    email_index.build()
+    nickname_index.build()
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+from datetime import date
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, F, Func, IntegerField, Q, Subquery
+
+from meetup.models import Member, Proposal
+from notification.models import Notification
+from user.models.user import User
+
+DASHBOARD_FIELDS = (
+    "ongoing_meetup_count",
+    "ended_meetup_count",
+    "organizing_meetup_count",
+    "member_meetup_count",
+    "pending_proposal_count",
+    "unread_notification_count",
+)
+
+
+def _dashboard_cache_key(user_id):
+    return f"user:dashboard:{user_id}"
+
+
+def _count(queryset):
+    # GROUP BY 없이 COUNT(*) 한 값을 돌려주는 스칼라 서브쿼리입니다.
+    return Subquery(
+        queryset.order_by().values(count=Func(F("pk"), function="COUNT", output_field=IntegerField())),
+        output_field=IntegerField(),
+    )
+
+
+def _aggregate_counts(user):
+    today = date.today()
+    organizer_role = Member.MemberRole.ORGANIZER.value
+    # 삭제 처리 중인 모임은 세지 않습니다.
+    alive = Q(member__meetup__deleted_at__isnull=True)
+    row = (
+        User.objects.filter(pk=user.pk)
+        .annotate(
+            ongoing_meetup_count=Count("member", filter=alive & Q(member__meetup__ended_at__gt=today)),
+            ended_meetup_count=Count("member", filter=alive & Q(member__meetup__ended_at__lt=today)),
+            organizing_meetup_count=Count("member", filter=alive & Q(member__role=organizer_role)),
+            member_meetup_count=Count("member", filter=alive & ~Q(member__role=organizer_role)),
+            pending_proposal_count=_count(
+                Proposal.objects.filter(
+                    meetup__organizer_id=user.pk,
+                    meetup__deleted_at__isnull=True,
+                    user__deleted_at__isnull=True,
+                    status=Proposal.ProposalStatus.PENDING.value,
+                ).exclude(user_id=user.pk)
+            ),
+            unread_notification_count=_count(Notification.objects.filter(recipient_id=user.pk, is_read=False)),
+        )
+        .values(*DASHBOARD_FIELDS)
+        .first()
+    )
+    return {field: (row or {}).get(field) or 0 for field in DASHBOARD_FIELDS}
+
+
+def get_dashboard_counts(user):
+    """
+    마이 스페이스 탭 배지에 쓰는 카운트를 한 번의 쿼리로 집계합니다.
+    결과는 사용자별로 캐시하며 모임원/신청/알림이 바뀌면 signals에서 무효화합니다.
+    """
+    key = _dashboard_cache_key(user.pk)
+    counts = cache.get(key)
+    if counts is None:
+        counts = _aggregate_counts(user)
+        cache.set(key, counts, timeout=settings.USER_DASHBOARD_CACHE_SECONDS)
+    return counts
+
+
+def invalidate_dashboard(*user_ids):
+    cache.delete_many([_dashboard_cache_key(user_id) for user_id in user_ids if user_id])
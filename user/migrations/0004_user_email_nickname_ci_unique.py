@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 5.2.2 on 2026-10-19 12:10
+
+import django.db.models.functions.text
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import Lower
+
+
+def check_case_duplicates(apps, schema_editor):
+    """
+    대소문자만 다른 이메일/닉네임이 이미 있으면 제약을 추가할 수 없으므로 미리 확인하고 멈춥니다.
+    계정을 자동으로 합치거나 지우지 않으니, 목록의 계정을 직접 정리한 뒤 다시 migrate 하세요.
+    """
+    User = apps.get_model("user", "User")
+    duplicates = []
+    for field in ("email", "nickname"):
+        values = (
+            User.objects.annotate(value=Lower(field))
+            .values("value")
+            .annotate(count=Count("id"))
+            .filter(count__gt=1)
+            .values_list("value", flat=True)
+        )
+        duplicates += [f"{field}={value}" for value in values]
+    if duplicates:
+        message = "대소문자만 다른 중복 계정이 있어 unique 제약을 추가할 수 없습니다: "
+        raise RuntimeError(message + ", ".join(duplicates))
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("user", "0003_alter_user_image"),
+    ]
+
+    operations = [
+        migrations.RunPython(check_case_duplicates, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="user",
+            constraint=models.UniqueConstraint(
+                django.db.models.functions.text.Lower("email"), name="user_email_ci_unique"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="user",
+            constraint=models.UniqueConstraint(
+                django.db.models.functions.text.Lower("nickname"), name="user_nickname_ci_unique"
+            ),
+        ),
+    ]
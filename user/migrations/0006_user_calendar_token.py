@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 5.2.2 on 2026-10-19 14:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("user", "0005_user_deleted_at"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="user",
+            name="calendar_token",
+            field=models.CharField(
+                blank=True, default=None, max_length=64, null=True, unique=True, verbose_name="캘린더 구독 토큰"
+            ),
+        ),
+    ]
@@ -5,11 +5,16 @@ from django.contrib.auth.models import (
     PermissionsMixin,
 )
 from django.db import models
+from django.db.models.functions import Lower
 
 from placeholder.models.base import BaseModel
 
 
 class UserManager(BaseUserManager):
+    def get_queryset(self):
+        # 탈퇴 처리 중(tombstone)인 사용자는 인증을 포함한 모든 조회에서 제외합니다.
+        return super().get_queryset().filter(deleted_at__isnull=True)
+
     def create_user(self, email, password=None, nickname=None, **extra_fields):
         if not email:
             raise ValueError("이메일은 필수입니다.")
@@ -35,14 +40,28 @@ class User(AbstractBaseUser, BaseModel, PermissionsMixin):
     email = models.EmailField(verbose_name="이메일", max_length=64, unique=True)
     nickname = models.CharField(verbose_name="별명", max_length=8, unique=True)
     image = models.CharField(verbose_name="프로필 이미지", null=True, blank=True, default="")
+    # 썸네일/WebP 파생 이미지를 만든 원본 image 값 (image와 같을 때만 파생 이미지 URL을 내려줍니다)
+    derived_image = models.CharField(verbose_name="파생 이미지 원본", null=True, blank=True, default="")
     bio = models.CharField(verbose_name="자기소개", max_length=40, blank=True)
     is_active = models.BooleanField(default=True)
     is_staff = models.BooleanField(default=False)
+    deleted_at = models.DateTimeField(verbose_name="탈퇴 요청 시각", null=True, blank=True, default=None)
+    calendar_token = models.CharField(
+        verbose_name="캘린더 구독 토큰", max_length=64, unique=True, null=True, blank=True, default=None
+    )
 
     objects = UserManager()
+    all_objects = models.Manager()
 
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = ["nickname"]
 
+    class Meta:
+        # 대소문자만 다른 이메일/닉네임도 중복으로 막습니다. 가입 시 IntegrityError를 제약 이름으로 구분합니다.
+        constraints = [
+            models.UniqueConstraint(Lower("email"), name="user_email_ci_unique"),
+            models.UniqueConstraint(Lower("nickname"), name="user_nickname_ci_unique"),
+        ]
+
     def __str__(self):
         return self.email
@@ -1,7 +1,7 @@
 import re
 
 from pydantic import field_validator
-from user.models.user import User
+from user.availability import is_email_taken, is_nickname_taken
 from placeholder.schemas.base import BaseSchema
 
 
@@ -36,7 +36,7 @@ class EmailCheckSchema(BaseSchema):
         email_regex = r'^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$'
         if not re.match(email_regex, value):
             raise ValueError("유효하지 않은 이메일 형식입니다.")
-        if User.objects.filter(email=value).exists():
+        if is_email_taken(value):
             raise ValueError("이미 가입된 이메일 입니다. 다른 이메일을 사용해주세요.")
         return value
 
@@ -51,7 +51,7 @@ class NicknameCheckSchema(BaseSchema):
             raise ValueError("닉네임에는 공백이 포함될 수 없습니다.")
         if len(value) < 2 or len(value) > 8:
             raise ValueError("닉네임은 2자 이상 8자 이하이어야 합니다.")
-        if User.objects.filter(nickname=value).exists():
+        if is_nickname_taken(value):
             raise ValueError("사용 중인 닉네임 입니다. 다른 닉네임을 사용해 주세요.")
         return value
 
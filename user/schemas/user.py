@@ -6,7 +6,7 @@ from typing import List
 from ninja.orm import create_schema
 from pydantic import Field, field_validator
 
-from placeholder.schemas.base import BaseSchema
+from placeholder.schemas.base import BaseSchema, ImageDerivativeSchema
 from user.models.user import User
 
 
@@ -22,9 +22,6 @@ class UserCreateSchema(BaseSchema):
         email_regex = r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$"
         if not re.match(email_regex, value):
             raise ValueError("유효하지 않은 이메일 형식입니다.")
-
-        if User.objects.filter(email=value).exists() is True:
-            raise ValueError("이미 가입된 이메일 입니다. 다른 이메일을 사용해주세요.")
         return value
 
     @field_validator("password")
@@ -43,16 +40,14 @@ class UserCreateSchema(BaseSchema):
             raise ValueError("닉네임에는 공백이 포함될 수 없습니다.")
         if len(value) < 2 or len(value) > 8:
             raise ValueError("닉네임은 2자 이상 8자 이하이어야 합니다.")
-        if User.objects.filter(nickname=value).exists() is True:
-            raise ValueError("사용 중인 닉네임 입니다. 다른 닉네임을 사용해 주세요.")
         return value
 
 
-UserSchema = create_schema(User, fields=["email", "nickname", "bio", "image"], base_class=BaseSchema)
+UserSchema = create_schema(User, fields=["email", "nickname", "bio", "image"], base_class=ImageDerivativeSchema)
 
 UserUpdateSchema = create_schema(User, fields=["nickname", "bio", "image"], base_class=BaseSchema)
 
-UserProfileSchema = create_schema(User, fields=["id", "nickname", "image"], base_class=BaseSchema)
+UserProfileSchema = create_schema(User, fields=["id", "nickname", "image"], base_class=ImageDerivativeSchema)
 
 
 class MyMeetupSchema(BaseSchema):
@@ -70,6 +65,33 @@ class MyAdSchema(BaseSchema):
     is_current: bool
 
 
+class MyDashboardSchema(BaseSchema):
+    ongoing_meetup_count: int
+    ended_meetup_count: int
+    organizing_meetup_count: int
+    member_meetup_count: int
+    pending_proposal_count: int
+    unread_notification_count: int
+
+
+class CalendarScheduleSchema(BaseSchema):
+    id: int
+    meetup_id: int
+    meetup_name: str
+    scheduled_at: datetime
+    place: str
+    address: str
+    memo: str
+
+
+class MyCalendarSchema(BaseSchema):
+    result: List[CalendarScheduleSchema]
+
+
+class CalendarFeedSchema(BaseSchema):
+    url: str
+
+
 class MyMeetupListSchema(BaseSchema):
     result: List[MyMeetupSchema]
 
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from meetup.models import Meetup, Member, Proposal
+from notification.models import Notification
+from user.availability import email_index, nickname_index
+from user.dashboard import invalidate_dashboard
+from user.models.user import User
+
+
+def _meetup_organizer_id(instance):
+    if Proposal.meetup.is_cached(instance):
+        return instance.meetup.organizer_id
+    return Meetup.all_objects.filter(pk=instance.meetup_id).values_list("organizer_id", flat=True).first()
+
+
+@receiver([post_save, post_delete], sender=Member)
+def invalidate_member_dashboard(sender, instance, **kwargs):
+    invalidate_dashboard(instance.user_id)
+
+
+@receiver([post_save, post_delete], sender=Proposal)
+def invalidate_proposal_dashboard(sender, instance, **kwargs):
+    # 받은 신청 수는 모임장의 대시보드에만 포함됩니다.
+    invalidate_dashboard(_meetup_organizer_id(instance))
+
+
+@receiver([post_save, post_delete], sender=Notification)
+def invalidate_notification_dashboard(sender, instance, **kwargs):
+    invalidate_dashboard(instance.recipient_id)
+
+
+@receiver(post_save, sender=User)
+def add_taken_user_values(sender, instance, **kwargs):
+    email_index.add(instance.email)
+    nickname_index.add(instance.nickname)
+
+
+@receiver(post_delete, sender=User)
+def discard_taken_user_values(sender, instance, **kwargs):
+    email_index.discard(instance.email)
+    nickname_index.discard(instance.nickname)